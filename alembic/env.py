@@ -24,6 +24,7 @@ from betting.models.base import Base
 from betting.models.user import User
 from betting.models.game import Game
 from betting.models.bet import Bet
+from betting.models.odds_snapshot import OddsSnapshot
 
 target_metadata = Base.metadata
 
@@ -0,0 +1,31 @@
+"""add bets history index
+
+Revision ID: 06ee51120449
+Revises: 8a2842e0c301
+Create Date: 2026-10-19 15:21:37.640152
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "06ee51120449"
+down_revision: Union[str, Sequence[str], None] = "8a2842e0c301"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_bets_user_id_created_at_id",
+        "bets",
+        ["user_id", "created_at", "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_bets_user_id_created_at_id", table_name="bets")
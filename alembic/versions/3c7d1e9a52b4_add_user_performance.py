@@ -0,0 +1,78 @@
+"""add user performance
+
+Revision ID: 3c7d1e9a52b4
+Revises: 8594eaf6e8a1
+Create Date: 2026-10-19 23:18:06.204715
+
+Running performance statistics per user, updated at settlement. Existing
+settled bets are not counted until `python -m betting.scripts.rebuild_performance`
+is run after upgrading.
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "3c7d1e9a52b4"
+down_revision: Union[str, Sequence[str], None] = "8594eaf6e8a1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "user_performance",
+        sa.Column("user_id", sa.Uuid(), nullable=False),
+        sa.Column("settled_bets", sa.Integer(), nullable=False),
+        sa.Column("won", sa.Integer(), nullable=False),
+        sa.Column("lost", sa.Integer(), nullable=False),
+        sa.Column("push", sa.Integer(), nullable=False),
+        sa.Column("total_staked", sa.Numeric(precision=12, scale=2), nullable=False),
+        sa.Column("total_returned", sa.Numeric(precision=12, scale=2), nullable=False),
+        sa.Column("return_mean", sa.Float(), nullable=False),
+        sa.Column("return_m2", sa.Float(), nullable=False),
+        sa.Column("net_profit", sa.Numeric(precision=12, scale=2), nullable=False),
+        sa.Column("peak_profit", sa.Numeric(precision=12, scale=2), nullable=False),
+        sa.Column("max_drawdown", sa.Numeric(precision=12, scale=2), nullable=False),
+        sa.Column("last_settled_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["user_id"],
+            ["users.id"],
+        ),
+        sa.PrimaryKeyConstraint("user_id"),
+    )
+    op.create_table(
+        "user_performance_buckets",
+        sa.Column("user_id", sa.Uuid(), nullable=False),
+        sa.Column(
+            "dimension",
+            sa.Enum("BET_TYPE", "MONTH", name="performancedimension"),
+            nullable=False,
+        ),
+        sa.Column("key", sa.String(length=20), nullable=False),
+        sa.Column("bets", sa.Integer(), nullable=False),
+        sa.Column("won", sa.Integer(), nullable=False),
+        sa.Column("lost", sa.Integer(), nullable=False),
+        sa.Column("push", sa.Integer(), nullable=False),
+        sa.Column("total_staked", sa.Numeric(precision=12, scale=2), nullable=False),
+        sa.Column("total_returned", sa.Numeric(precision=12, scale=2), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["user_id"],
+            ["users.id"],
+        ),
+        sa.PrimaryKeyConstraint("user_id", "dimension", "key"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("user_performance_buckets")
+    op.drop_table("user_performance")
+    sa.Enum(name="performancedimension").drop(op.get_bind(), checkfirst=True)
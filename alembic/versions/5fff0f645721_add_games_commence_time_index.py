@@ -0,0 +1,41 @@
+"""add games commence_time index
+
+Revision ID: 5fff0f645721
+Revises: a0990d0dc189
+Create Date: 2026-10-19 17:32:40.118204
+
+Backs the default time window on GET /games, which filters and orders by
+commence_time across all statuses.
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "5fff0f645721"
+down_revision: Union[str, Sequence[str], None] = "a0990d0dc189"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_games_commence_time",
+            "games",
+            ["commence_time"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_games_commence_time",
+            table_name="games",
+            postgresql_concurrently=True,
+        )
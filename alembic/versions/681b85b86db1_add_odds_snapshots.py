@@ -0,0 +1,56 @@
+"""add odds snapshots
+
+Revision ID: 681b85b86db1
+Revises: a80ce5b66541
+Create Date: 2026-10-19 09:12:41.503318
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "681b85b86db1"
+down_revision: Union[str, Sequence[str], None] = "a80ce5b66541"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "odds_snapshots",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("game_id", sa.Uuid(), nullable=False),
+        sa.Column("captured_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("bookmaker", sa.String(length=50), nullable=False),
+        sa.Column("home_moneyline", sa.Integer(), nullable=True),
+        sa.Column("away_moneyline", sa.Integer(), nullable=True),
+        sa.Column("home_spread", sa.Numeric(precision=4, scale=1), nullable=True),
+        sa.Column("home_spread_odds", sa.Integer(), nullable=True),
+        sa.Column("away_spread", sa.Numeric(precision=4, scale=1), nullable=True),
+        sa.Column("away_spread_odds", sa.Integer(), nullable=True),
+        sa.Column("total_points", sa.Numeric(precision=5, scale=1), nullable=True),
+        sa.Column("over_odds", sa.Integer(), nullable=True),
+        sa.Column("under_odds", sa.Integer(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["game_id"],
+            ["games.id"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_odds_snapshots_game_id_captured_at",
+        "odds_snapshots",
+        ["game_id", "captured_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_odds_snapshots_game_id_captured_at", table_name="odds_snapshots")
+    op.drop_table("odds_snapshots")
@@ -0,0 +1,64 @@
+"""add jobs
+
+Revision ID: 8594eaf6e8a1
+Revises: 5fff0f645721
+Create Date: 2026-10-19 21:04:12.532871
+
+Admin job registry. The partial unique index is the cross-instance lock
+allowing one queued or running job per type.
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "8594eaf6e8a1"
+down_revision: Union[str, Sequence[str], None] = "5fff0f645721"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+ACTIVE_ONLY = sa.text("status IN ('QUEUED', 'RUNNING')")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "jobs",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column(
+            "job_type",
+            sa.Enum("FETCH_GAMES", "SCORE_GAMES", "SETTLE_BETS", name="jobtype"),
+            nullable=False,
+        ),
+        sa.Column(
+            "status",
+            sa.Enum("QUEUED", "RUNNING", "SUCCEEDED", "FAILED", name="jobstatus"),
+            nullable=False,
+        ),
+        sa.Column("started_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("finished_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("progress", sa.String(length=200), nullable=True),
+        sa.Column("result", sa.JSON(), nullable=True),
+        sa.Column("error", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ux_jobs_job_type_active",
+        "jobs",
+        ["job_type"],
+        unique=True,
+        postgresql_where=ACTIVE_ONLY,
+        sqlite_where=ACTIVE_ONLY,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ux_jobs_job_type_active", table_name="jobs")
+    op.drop_table("jobs")
+    sa.Enum(name="jobstatus").drop(op.get_bind(), checkfirst=True)
+    sa.Enum(name="jobtype").drop(op.get_bind(), checkfirst=True)
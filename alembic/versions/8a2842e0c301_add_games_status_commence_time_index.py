@@ -0,0 +1,31 @@
+"""add games status commence_time index
+
+Revision ID: 8a2842e0c301
+Revises: c942f35e8ba0
+Create Date: 2026-10-19 14:05:52.913470
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "8a2842e0c301"
+down_revision: Union[str, Sequence[str], None] = "c942f35e8ba0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_games_status_commence_time",
+        "games",
+        ["status", "commence_time"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_games_status_commence_time", table_name="games")
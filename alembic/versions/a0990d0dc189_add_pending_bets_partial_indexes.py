@@ -0,0 +1,61 @@
+"""add pending bets partial indexes
+
+Revision ID: a0990d0dc189
+Revises: 06ee51120449
+Create Date: 2026-10-19 16:48:12.377905
+
+Partial indexes on status = 'PENDING' stay small because settled bets drop
+out of them. On PostgreSQL they are built CONCURRENTLY, which cannot run
+inside a transaction, hence the autocommit block.
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "a0990d0dc189"
+down_revision: Union[str, Sequence[str], None] = "06ee51120449"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+PENDING_ONLY = sa.text("status = 'PENDING'")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_bets_game_id_pending",
+            "bets",
+            ["game_id"],
+            unique=False,
+            postgresql_where=PENDING_ONLY,
+            sqlite_where=PENDING_ONLY,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_bets_user_id_pending",
+            "bets",
+            ["user_id"],
+            unique=False,
+            postgresql_where=PENDING_ONLY,
+            sqlite_where=PENDING_ONLY,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_bets_user_id_pending",
+            table_name="bets",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_bets_game_id_pending",
+            table_name="bets",
+            postgresql_concurrently=True,
+        )
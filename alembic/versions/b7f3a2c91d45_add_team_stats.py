@@ -0,0 +1,69 @@
+"""add team stats
+
+Revision ID: b7f3a2c91d45
+Revises: e41f6b0c8d27
+Create Date: 2026-10-20 14:12:07.530184
+
+Season records per team for game cards. Run
+`python -m betting.scripts.refresh_team_stats --full` after upgrading to
+fill it from games already completed.
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "b7f3a2c91d45"
+down_revision: Union[str, Sequence[str], None] = "e41f6b0c8d27"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "team_stats",
+        sa.Column("team_name", sa.String(length=100), nullable=False),
+        sa.Column("season", sa.String(length=7), nullable=False),
+        sa.Column("wins", sa.Integer(), nullable=False),
+        sa.Column("losses", sa.Integer(), nullable=False),
+        sa.Column("home_wins", sa.Integer(), nullable=False),
+        sa.Column("home_losses", sa.Integer(), nullable=False),
+        sa.Column("away_wins", sa.Integer(), nullable=False),
+        sa.Column("away_losses", sa.Integer(), nullable=False),
+        sa.Column("ats_wins", sa.Integer(), nullable=False),
+        sa.Column("ats_losses", sa.Integer(), nullable=False),
+        sa.Column("ats_pushes", sa.Integer(), nullable=False),
+        sa.Column("ats_wins_home", sa.Integer(), nullable=False),
+        sa.Column("ats_losses_home", sa.Integer(), nullable=False),
+        sa.Column("ats_wins_away", sa.Integer(), nullable=False),
+        sa.Column("ats_losses_away", sa.Integer(), nullable=False),
+        sa.Column("ats_wins_as_favorite", sa.Integer(), nullable=False),
+        sa.Column("ats_losses_as_favorite", sa.Integer(), nullable=False),
+        sa.Column("ats_wins_as_underdog", sa.Integer(), nullable=False),
+        sa.Column("ats_losses_as_underdog", sa.Integer(), nullable=False),
+        sa.Column("overs", sa.Integer(), nullable=False),
+        sa.Column("unders", sa.Integer(), nullable=False),
+        sa.Column("ou_pushes", sa.Integer(), nullable=False),
+        sa.Column("last10_wins", sa.Integer(), nullable=False),
+        sa.Column("last10_losses", sa.Integer(), nullable=False),
+        sa.Column("last10_ats_wins", sa.Integer(), nullable=False),
+        sa.Column("last10_ats_losses", sa.Integer(), nullable=False),
+        sa.Column("last10_overs", sa.Integer(), nullable=False),
+        sa.Column("last10_unders", sa.Integer(), nullable=False),
+        sa.Column("recent_su", sa.String(length=10), nullable=False),
+        sa.Column("recent_ats", sa.String(length=10), nullable=False),
+        sa.Column("recent_ou", sa.String(length=10), nullable=False),
+        sa.Column("current_streak", sa.Integer(), nullable=False),
+        sa.Column("last_game_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("team_name", "season"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("team_stats")
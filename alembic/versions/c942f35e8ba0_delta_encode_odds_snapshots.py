@@ -0,0 +1,53 @@
+"""delta encode odds snapshots
+
+Revision ID: c942f35e8ba0
+Revises: 681b85b86db1
+Create Date: 2026-10-19 11:40:06.218547
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "c942f35e8ba0"
+down_revision: Union[str, Sequence[str], None] = "681b85b86db1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "odds_snapshots",
+        sa.Column("last_seen_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.add_column(
+        "odds_snapshots",
+        sa.Column("sample_count", sa.Integer(), nullable=False, server_default="1"),
+    )
+    # Existing rows are single observations: the run ends where it starts
+    op.execute("UPDATE odds_snapshots SET last_seen_at = captured_at")
+    op.alter_column(
+        "odds_snapshots",
+        "last_seen_at",
+        existing_type=sa.DateTime(timezone=True),
+        nullable=False,
+    )
+    op.create_index(
+        "ix_odds_snapshots_game_id_bookmaker_captured_at",
+        "odds_snapshots",
+        ["game_id", "bookmaker", "captured_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        "ix_odds_snapshots_game_id_bookmaker_captured_at",
+        table_name="odds_snapshots",
+    )
+    op.drop_column("odds_snapshots", "sample_count")
+    op.drop_column("odds_snapshots", "last_seen_at")
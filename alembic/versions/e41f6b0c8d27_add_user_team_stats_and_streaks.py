@@ -0,0 +1,61 @@
+"""add user team stats and streaks
+
+Revision ID: e41f6b0c8d27
+Revises: 3c7d1e9a52b4
+Create Date: 2026-10-20 08:41:52.918306
+
+Win/loss streaks on user_performance and per-team results per user, both
+updated at settlement. Run `python -m betting.scripts.rebuild_performance`
+after upgrading to fill them in for bets already settled.
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "e41f6b0c8d27"
+down_revision: Union[str, Sequence[str], None] = "3c7d1e9a52b4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+STREAK_COLUMNS = ("current_streak", "longest_win_streak", "longest_loss_streak")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table("user_performance") as batch_op:
+        for name in STREAK_COLUMNS:
+            batch_op.add_column(
+                sa.Column(name, sa.Integer(), nullable=False, server_default="0")
+            )
+
+    op.create_table(
+        "user_team_stats",
+        sa.Column("user_id", sa.Uuid(), nullable=False),
+        sa.Column("team_name", sa.String(length=100), nullable=False),
+        sa.Column("bets_for", sa.Integer(), nullable=False),
+        sa.Column("wins_for", sa.Integer(), nullable=False),
+        sa.Column("losses_for", sa.Integer(), nullable=False),
+        sa.Column("pnl_for", sa.Numeric(precision=12, scale=2), nullable=False),
+        sa.Column("bets_against", sa.Integer(), nullable=False),
+        sa.Column("wins_against", sa.Integer(), nullable=False),
+        sa.Column("losses_against", sa.Integer(), nullable=False),
+        sa.Column("pnl_against", sa.Numeric(precision=12, scale=2), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["user_id"],
+            ["users.id"],
+        ),
+        sa.PrimaryKeyConstraint("user_id", "team_name"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("user_team_stats")
+    with op.batch_alter_table("user_performance") as batch_op:
+        for name in STREAK_COLUMNS:
+            batch_op.drop_column(name)
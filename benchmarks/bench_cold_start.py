@@ -0,0 +1,122 @@
+"""
+Cold-start time of the API: process launch to first response.
+
+Starts uvicorn the way the Docker image does against a throwaway SQLite
+database and times the first successful /health and /games responses,
+with and without cached bytecode (an empty PYTHONPYCACHEPREFIX forces every
+module to be compiled, as on an image built without compileall). Ends with
+the slowest imports from `python -X importtime`, grouped by top-level package.
+
+    python -m benchmarks.bench_cold_start
+"""
+
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.error
+import urllib.request
+from collections import defaultdict
+
+from sqlalchemy import create_engine
+
+from betting.models.base import Base
+
+RUNS = 5
+TIMEOUT_SECONDS = 30
+TOP_IMPORTS = 10
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def wait_for(url: str, deadline: float) -> float:
+    while time.perf_counter() < deadline:
+        try:
+            with urllib.request.urlopen(url, timeout=1) as response:
+                if response.status == 200:
+                    return time.perf_counter()
+        except (urllib.error.URLError, ConnectionError):
+            time.sleep(0.005)
+    raise TimeoutError(f"No response from {url}")
+
+
+def cold_start(env: dict) -> tuple[float, float]:
+    """Seconds from launch to the first /health and the first /games response."""
+    port = free_port()
+    started = time.perf_counter()
+    server = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "betting.api.http_api:app",
+            "--port",
+            str(port),
+        ],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        deadline = started + TIMEOUT_SECONDS
+        health = wait_for(f"http://127.0.0.1:{port}/health", deadline)
+        games = wait_for(f"http://127.0.0.1:{port}/games", deadline)
+    finally:
+        server.terminate()
+        server.wait()
+    return health - started, games - started
+
+
+def report(label: str, env: dict):
+    timings = [cold_start(env) for _ in range(RUNS)]
+    health = statistics.median(t[0] for t in timings) * 1000
+    games = statistics.median(t[1] for t in timings) * 1000
+    print(f"{label:<22} /health {health:7.0f} ms   /games {games:7.0f} ms")
+
+
+def slowest_imports(env: dict):
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import betting.api.http_api"],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    # Lines look like "import time:  self [us] | cumulative | module"
+    by_package = defaultdict(int)
+    for line in result.stderr.splitlines()[1:]:
+        self_us, _, module = line.removeprefix("import time:").split("|")
+        by_package[module.strip().split(".")[0]] += int(self_us)
+
+    total = sum(by_package.values())
+    print(f"\nImport of betting.api.http_api: {total / 1000:.0f} ms")
+    for package, self_us in sorted(by_package.items(), key=lambda p: -p[1])[
+        :TOP_IMPORTS
+    ]:
+        print(f"  {package:<20} {self_us / 1000:6.1f} ms")
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        url = f"sqlite:///{os.path.join(tmp, 'betting.db')}"
+        Base.metadata.create_all(create_engine(url))
+        env = {**os.environ, "DATABASE_URL": url}
+
+        print(f"Median of {RUNS} cold starts")
+        report("cached bytecode", env)
+        with tempfile.TemporaryDirectory() as pycache:
+            uncached = {**env, "PYTHONPYCACHEPREFIX": pycache}
+            report("no bytecode cache", {**uncached, "PYTHONDONTWRITEBYTECODE": "1"})
+
+        slowest_imports(env)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+"""
+Micro-benchmark of the /games and /users/{id}/bets read paths at 10k rows.
+
+Compares hydrating tracked ORM objects against the Core row views the
+endpoints now return. Each timing covers the query plus response_model
+validation and JSON serialization the way FastAPI does it.
+
+    python -m benchmarks.bench_read_paths
+"""
+
+import json
+import timeit
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from uuid import uuid4
+
+from pydantic import TypeAdapter
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+from betting.api.schemas import BetResponse, GameResponse
+from betting.models import Bet, BetSelection, BetStatus, BetType, Game, User
+from betting.models import GameStatus
+from betting.models.base import Base
+from betting.repositories import BetRepository, GameRepository
+from betting.repositories.game_repository import HAS_ALL_LINES
+
+ROWS = 10_000
+REPEAT = 5
+
+games_adapter = TypeAdapter(list[GameResponse])
+bets_adapter = TypeAdapter(list[BetResponse])
+
+
+def seed(session):
+    start = datetime(2025, 10, 21, tzinfo=timezone.utc)
+    user_id = uuid4()
+    session.add(User(id=user_id, username="bench", balance=Decimal("1000")))
+
+    games = [
+        dict(
+            id=uuid4(),
+            external_id=f"game_{i}",
+            home_team="Celtics",
+            away_team="Heat",
+            commence_time=start + timedelta(minutes=i),
+            status=GameStatus.UPCOMING,
+            home_moneyline=Decimal("-110"),
+            away_moneyline=Decimal("100"),
+            home_spread=Decimal("-3.5"),
+            home_spread_odds=Decimal("-110"),
+            away_spread=Decimal("3.5"),
+            away_spread_odds=Decimal("-110"),
+            total_points=Decimal("210.5"),
+            over_odds=Decimal("-110"),
+            under_odds=Decimal("-110"),
+        )
+        for i in range(ROWS)
+    ]
+    session.execute(insert(Game), games)
+    session.execute(
+        insert(Bet),
+        [
+            dict(
+                id=uuid4(),
+                user_id=user_id,
+                game_id=game["id"],
+                bet_type=BetType.MONEYLINE,
+                selection=BetSelection.HOME,
+                odds=Decimal("-110"),
+                stake=Decimal("10"),
+                potential_payout=Decimal("19.09"),
+                status=BetStatus.PENDING,
+                created_at=start + timedelta(seconds=i),
+            )
+            for i, game in enumerate(games)
+        ],
+    )
+    session.commit()
+    return user_id
+
+
+def serialize(adapter, result):
+    # Mirrors FastAPI: validate against response_model, dump, then json.dumps
+    responses = adapter.validate_python(result, from_attributes=True)
+    return json.dumps(adapter.dump_python(responses, mode="json")).encode()
+
+
+def games_orm(Session):
+    with Session() as session:
+        games = session.query(Game).filter(HAS_ALL_LINES).limit(ROWS).all()
+        return serialize(games_adapter, games)
+
+
+def games_views(Session):
+    with Session() as session:
+        games = GameRepository(session).find_games_with_lines(limit=ROWS)
+        return serialize(games_adapter, games)
+
+
+def bets_orm(Session, user_id):
+    with Session() as session:
+        bets = session.query(Bet).filter_by(user_id=user_id).limit(ROWS).all()
+        return serialize(bets_adapter, bets)
+
+
+def bets_views(Session, user_id):
+    with Session() as session:
+        bets = BetRepository(session).find_bet_history_page(user_id, limit=ROWS)
+        return serialize(bets_adapter, bets)
+
+
+def report(name, orm, views):
+    orm_time = min(timeit.repeat(orm, number=1, repeat=REPEAT))
+    views_time = min(timeit.repeat(views, number=1, repeat=REPEAT))
+    print(
+        f"{name:<20} orm {orm_time * 1000:8.1f} ms   "
+        f"views {views_time * 1000:8.1f} ms   {orm_time / views_time:4.1f}x"
+    )
+
+
+def main():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine)
+    with Session() as session:
+        user_id = seed(session)
+
+    assert len(json.loads(games_views(Session))) == ROWS
+    assert len(json.loads(bets_views(Session, user_id))) == ROWS
+
+    print(f"{ROWS} rows, best of {REPEAT}")
+    report("/games", lambda: games_orm(Session), lambda: games_views(Session))
+    report(
+        "/users/{id}/bets",
+        lambda: bets_orm(Session, user_id),
+        lambda: bets_views(Session, user_id),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+CPU cost of serializing large /games and /users/{id}/bets responses.
+
+Times only the rows-to-bytes step on rows already fetched, comparing:
+
+- response_model + json.dumps: FastAPI's classic path (validate rows into
+  models, dump to Python, encode with the stdlib json module)
+- response_model + dump_json: newer FastAPI releases, which encode with
+  pydantic-core but still validate every row
+- RowSerializer: trusted rows straight to pydantic-core, no validation
+
+    python -m benchmarks.bench_serialization
+"""
+
+import time
+
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from benchmarks.bench_read_paths import ROWS, seed
+from betting.api.schemas import BetResponse, GameResponse
+from betting.api.serialization import RowSerializer
+from betting.models.base import Base
+from betting.repositories import BetRepository, GameRepository
+
+REPEAT = 5
+
+
+def cpu_time(fn):
+    best = float("inf")
+    for _ in range(REPEAT):
+        start = time.process_time()
+        fn()
+        best = min(best, time.process_time() - start)
+    return best
+
+
+def compare(name, model, rows):
+    adapter = TypeAdapter(list[model])
+    serializer = RowSerializer(model)
+
+    def classic():
+        models = adapter.validate_python(rows, from_attributes=True)
+        return JSONResponse(adapter.dump_python(models, mode="json")).body
+
+    def dump_json():
+        return adapter.dump_json(adapter.validate_python(rows, from_attributes=True))
+
+    def trusted():
+        return serializer.dump_rows(rows)
+
+    assert classic() == dump_json() == trusted()
+
+    timings = [
+        ("response_model + json.dumps", cpu_time(classic)),
+        ("response_model + dump_json", cpu_time(dump_json)),
+        ("RowSerializer", cpu_time(trusted)),
+    ]
+    baseline = timings[0][1]
+
+    print(f"{name} ({len(rows)} rows)")
+    for label, spent in timings:
+        print(
+            f"  {label:<28} {spent * 1000:7.1f} ms CPU"
+            f"  {spent / len(rows) * 1e6:5.2f} us/row"
+            f"  saves {(baseline - spent) * 1000:6.1f} ms/request"
+        )
+
+
+def main():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine)
+
+    with Session() as session:
+        user_id = seed(session)
+        games = GameRepository(session).find_games_with_lines(limit=ROWS)
+        bets = BetRepository(session).find_bet_history_page(user_id, limit=ROWS)
+
+    compare("/games", GameResponse, games)
+    compare("/users/{id}/bets", BetResponse, bets)
+
+
+if __name__ == "__main__":
+    main()
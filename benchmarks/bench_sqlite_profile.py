@@ -0,0 +1,134 @@
+"""
+Concurrent bet placement on SQLite, with and without the performance profile.
+
+Several threads place bets at once through BettingService on a shared game,
+two threads per user, the way concurrent POST /bets requests do. Untuned,
+pysqlite starts the transaction at the first write, so the balance check
+reads outside it and two placements for one user can both deduct from the
+same balance (a lost update); long write transactions surface as
+"database is locked". With the profile (WAL, BEGIN IMMEDIATE,
+busy_timeout) each placement holds the write lock from its first read, so
+placements queue and every stake is deducted.
+
+    python -m benchmarks.bench_sqlite_profile
+"""
+
+import os
+import tempfile
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from uuid import uuid4
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+
+from betting.database import Database
+from betting.models import BetSelection, BetType, Game, GameStatus, User
+from betting.models.base import Base
+from betting.services import BettingService
+
+THREADS = 8
+BETS_PER_THREAD = 100
+STAKE = Decimal("10")
+BALANCE = Decimal("1000000")
+
+
+def seed(Session):
+    game_id = uuid4()
+    user_ids = [uuid4() for _ in range(THREADS // 2)]
+    with Session() as session:
+        session.execute(
+            insert(Game),
+            [
+                dict(
+                    id=game_id,
+                    external_id="bench",
+                    home_team="Celtics",
+                    away_team="Heat",
+                    commence_time=datetime.now(timezone.utc) + timedelta(days=1),
+                    status=GameStatus.UPCOMING,
+                    home_moneyline=Decimal("-110"),
+                    away_moneyline=Decimal("100"),
+                )
+            ],
+        )
+        session.execute(
+            insert(User),
+            [
+                dict(id=id, username=f"bench{i}", balance=BALANCE)
+                for i, id in enumerate(user_ids)
+            ],
+        )
+        session.commit()
+    return game_id, user_ids
+
+
+counts_lock = threading.Lock()
+
+
+def place_bets(Session, game_id, user_id, counts):
+    for _ in range(BETS_PER_THREAD):
+        with Session() as session:
+            try:
+                BettingService(session).place_bet(
+                    user_id=user_id,
+                    game_id=game_id,
+                    bet_type=BetType.MONEYLINE,
+                    selection=BetSelection.HOME,
+                    stake=STAKE,
+                )
+                outcome = user_id
+            except OperationalError:
+                session.rollback()
+                outcome = "locked"
+        with counts_lock:
+            counts[outcome] += 1
+
+
+def run(label, engine):
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine, autoflush=False)
+    game_id, user_ids = seed(Session)
+
+    counts = Counter()
+    threads = [
+        threading.Thread(
+            target=place_bets,
+            args=(Session, game_id, user_ids[i % len(user_ids)], counts),
+        )
+        for i in range(THREADS)
+    ]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    placed = sum(counts[user_id] for user_id in user_ids)
+    with Session() as session:
+        deducted = sum(
+            BALANCE - session.get(User, user_id).balance for user_id in user_ids
+        )
+    lost = placed - int(deducted / STAKE)
+    print(
+        f"{label:<10} {placed / elapsed:6.0f} bets/s   {placed:4d} placed   "
+        f"{lost:4d} lost updates   {counts['locked']:4d} database is locked"
+    )
+    engine.dispose()
+
+
+def main():
+    print(f"{THREADS} threads x {BETS_PER_THREAD} bets")
+    with tempfile.TemporaryDirectory() as tmp:
+        # Both wait up to 5s for a lock (pysqlite's default timeout)
+        run("untuned", create_engine(f"sqlite:///{os.path.join(tmp, 'untuned.db')}"))
+        run("profile", Database(f"sqlite:///{os.path.join(tmp, 'tuned.db')}").engine)
+
+
+if __name__ == "__main__":
+    main()
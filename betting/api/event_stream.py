@@ -0,0 +1,151 @@
+"""
+Server-sent events for live odds, game status and bet settlement.
+
+Domain events published in this process are encoded once into a bounded
+ring buffer. Each connected client holds only a cursor into that buffer, so
+fan-out costs one lookup per event per client instead of a database poll per
+client per interval. Clients that reconnect with `Last-Event-ID` are
+replayed what they missed, or told to `reset` (refetch) when the gap has
+already been overwritten.
+"""
+
+import asyncio
+import threading
+import time
+from dataclasses import dataclass
+from typing import AsyncIterator, Collection, List, Optional
+from uuid import UUID
+
+from fastapi import Request
+from pydantic_core import to_json
+
+# Sent instead of a replay when the client's cursor fell out of the buffer
+RESET_EVENT = "reset"
+
+
+@dataclass(frozen=True)
+class StreamEvent:
+    id: int
+    type: str
+    data: bytes
+    # Set for events only their owner may see, e.g. bet settlements
+    user_id: Optional[UUID] = None
+
+    def encode(self) -> bytes:
+        return b"id: %d\nevent: %s\ndata: %s\n\n" % (
+            self.id,
+            self.type.encode(),
+            self.data,
+        )
+
+    def visible_to(self, user_id: Optional[UUID]) -> bool:
+        return self.user_id is None or self.user_id == user_id
+
+
+class EventBroker:
+    """
+    Ring buffer of recent events with async wakeups for stream consumers.
+
+    `publish` may be called from any thread (service code runs in FastAPI's
+    threadpool); waiters on the event loop are woken thread-safely. Ids are
+    seeded from the clock, so a cursor held across a restart falls behind
+    the new buffer and gets a reset rather than silently skipping events.
+    """
+
+    def __init__(self, buffer_size: int):
+        self.buffer_size = buffer_size
+        self._buffer: List[Optional[StreamEvent]] = [None] * buffer_size
+        self._first_id = time.time_ns() // 1000
+        self._last_id = self._first_id - 1
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._changed: Optional[asyncio.Event] = None
+
+    @property
+    def last_id(self) -> int:
+        return self._last_id
+
+    def publish(self, event_type: str, data, user_id: Optional[UUID] = None):
+        body = to_json(data)
+        with self._lock:
+            self._last_id += 1
+            event = StreamEvent(self._last_id, event_type, body, user_id)
+            self._buffer[event.id % self.buffer_size] = event
+        self._notify()
+
+    def relay(self, event_type: str, payloads: List[dict]):
+        """Domain event handler: one stream event per payload."""
+        for payload in payloads:
+            self.publish(event_type, payload, user_id=payload.get("user_id"))
+
+    def can_replay(self, cursor: int) -> bool:
+        """Whether every event after `cursor` is still in the buffer."""
+        with self._lock:
+            oldest = max(self._first_id, self._last_id - self.buffer_size + 1)
+            return oldest - 1 <= cursor <= self._last_id
+
+    def events_after(self, cursor: int) -> List[StreamEvent]:
+        with self._lock:
+            start = max(cursor + 1, self._last_id - self.buffer_size + 1)
+            return [
+                self._buffer[id % self.buffer_size]
+                for id in range(start, self._last_id + 1)
+            ]
+
+    async def wait(self, cursor: int):
+        """Return once an event newer than `cursor` has been published."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._changed = asyncio.Event()
+        changed = self._changed
+        if self._last_id > cursor:
+            return
+        await changed.wait()
+
+    def _notify(self):
+        loop = self._loop
+        if loop is None:
+            return
+        try:
+            loop.call_soon_threadsafe(self._wake)
+        except RuntimeError:
+            # The loop that last waited has shut down; nobody is listening
+            pass
+
+    def _wake(self):
+        changed, self._changed = self._changed, asyncio.Event()
+        changed.set()
+
+
+async def sse_stream(
+    broker: EventBroker,
+    request: Request,
+    cursor: Optional[int],
+    user_id: Optional[UUID] = None,
+    types: Optional[Collection[str]] = None,
+    keepalive: float = 15.0,
+) -> AsyncIterator[bytes]:
+    """
+    Yield encoded events for one client until it disconnects.
+
+    Without a cursor the stream starts at the newest event. Private events
+    are only sent to the matching `user_id`; `types` narrows the stream.
+    """
+    if cursor is None:
+        cursor = broker.last_id
+    elif not broker.can_replay(cursor):
+        cursor = broker.last_id
+        yield StreamEvent(cursor, RESET_EVENT, b"{}").encode()
+
+    while not await request.is_disconnected():
+        for event in broker.events_after(cursor):
+            cursor = event.id
+            if event.visible_to(user_id) and (not types or event.type in types):
+                yield event.encode()
+
+        try:
+            await asyncio.wait_for(broker.wait(cursor), keepalive)
+        except asyncio.TimeoutError:
+            # Comment line: keeps proxies from closing an idle connection
+            yield b": keepalive\n\n"
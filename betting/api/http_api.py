@@ -1,34 +1,105 @@
+import time
+
+# Start of the import phase reported as app_startup_seconds{phase="import"}
+_import_started = time.perf_counter()
+
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from functools import partial
+from datetime import datetime, timedelta, timezone
 from uuid import UUID
-from fastapi import FastAPI, HTTPException, Depends, Header
+from fastapi import FastAPI, HTTPException, Depends, Header, Query, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
-from betting.database import get_database
+from betting.database import (
+    get_database,
+    issue_consistency_token,
+    read_only_sessionmaker,
+)
+from betting.instrumentation import SlowQueryLog, collect_query_stats
+from betting.jobs import JobRunner, ProgressReporter
+from betting.metrics import (
+    APP_STARTUP_DURATION,
+    HTTP_REQUEST_DURATION,
+    HTTP_REQUESTS_IN_FLIGHT,
+    REGISTRY,
+)
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 from betting.config import config
+from betting.events import (
+    BET_SETTLED,
+    GAME_COMPLETED,
+    GAME_STARTED,
+    GAMES_CHANGED,
+    ODDS_CHANGED,
+    TEAM_STATS_CHANGED,
+    subscribe,
+)
 from betting.models.enums import BetSelection, BetType, GameStatus, BetStatus
-from betting.repositories import GameRepository, UserRepository
+from betting.models.enums import JobType
+from betting.models.odds_snapshot import LINE_COLUMNS
+from betting.repositories import (
+    BetRepository,
+    GameRepository,
+    UserRepository,
+    OddsSnapshotRepository,
+    JobRepository,
+)
+from betting.repositories.pagination import encode_cursor, decode_cursor
 from betting.services import BettingService, InsufficientBalanceError, InvalidBetError
 from betting.services.game_sync_service import GameSyncService
 from betting.services import GameScoringService, BetSettlementService
-
+from betting.services import LineHistoryService, GameStatusSweeper
+from betting.services import BetExportService, ExportFormat
+from betting.services import GameHistoryExportService, HistoryFormat, HistoryTable
+from betting.services import PerformanceService
+from betting.services import TeamStatsService, season_for
+
+from .event_stream import EventBroker, sse_stream
+from .response_cache import ResponseCache
+from .serialization import RowSerializer, json_response
 from .schemas import (
     GameResponse,
+    OddsSnapshotResponse,
+    OddsPointResponse,
     PlaceBetRequest,
     BetResponse,
     BalanceResponse,
     CreateUserRequest,
     UserResponse,
+    PerformanceResponse,
+    UserStatsResponse,
+    UserTeamStatsResponse,
+    JobResponse,
+    PoolStatusResponse,
+    SlowQueryResponse,
+    TeamStatsResponse,
 )
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Configured here rather than at import, so importing the app (tests,
+    # scripts, benchmarks) leaves the caller's logging alone
+    logging.basicConfig(level=logging.INFO)
+    # uvicorn only starts listening once this returns, so warm-up finishes
+    # before Cloud Run routes the first request here
+    warm_up()
+    yield
+
+
 app = FastAPI(
     title="Betting API",
     description="NBA Betting API",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
 app.add_middleware(
@@ -37,62 +108,400 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[
+        "X-Next-Cursor",
+        "X-Consistency-Token",
+        "X-Query-Count",
+        "X-Query-Time-Ms",
+        "X-Query-Rows",
+    ],
 )
 
+
+@app.middleware("http")
+async def record_request_stats(request: Request, call_next):
+    started = time.perf_counter()
+    status = 500
+    HTTP_REQUESTS_IN_FLIGHT.inc()
+    try:
+        # Counting rows read buffers results, so only for the debug headers
+        with collect_query_stats(count_rows=config.DEBUG) as stats:
+            response = await call_next(request)
+        status = response.status_code
+    finally:
+        HTTP_REQUESTS_IN_FLIGHT.dec()
+        # Label by route template, not the raw path, to bound cardinality
+        route = request.scope.get("route")
+        HTTP_REQUEST_DURATION.labels(
+            request.method, route.path if route else "unmatched", str(status)
+        ).observe(time.perf_counter() - started)
+
+    logger.info(
+        f"{request.method} {request.url.path} {response.status_code}: "
+        f"{stats.summary()}",
+        extra=stats.as_log_fields(),
+    )
+    for statement, count in stats.repeated_statements():
+        logger.warning(
+            f"Possible N+1 in {request.method} {request.url.path}: "
+            f"{count}x {statement}"
+        )
+
+    if config.DEBUG:
+        response.headers.update(stats.as_headers())
+    return response
+
+
 _db = None
 
+slow_query_log = SlowQueryLog(
+    config.SLOW_QUERY_THRESHOLD_MS / 1000,
+    config.SLOW_QUERY_LOG_SIZE,
+    explain=config.SLOW_QUERY_EXPLAIN,
+)
+
+game_status_sweeper = GameStatusSweeper(
+    timedelta(seconds=config.GAME_STATUS_SWEEP_SECONDS)
+)
+
 
 def get_db():
     global _db
     if _db is None:
-        _db = get_database(config.DATABASE_URL)
+        _db = get_database(
+            config.DATABASE_URL,
+            config.DATABASE_REPLICA_URLS,
+            timedelta(seconds=config.REPLICA_MAX_LAG_SECONDS),
+            slow_query_log=slow_query_log if config.SLOW_QUERY_THRESHOLD_MS else None,
+        )
     return _db
 
 
+def warm_up():
+    """Open database connections and render the default /games page."""
+    started = time.perf_counter()
+    try:
+        db = get_db()
+        opened = db.warm_up(config.DB_WARMUP_CONNECTIONS)
+        with db.get_read_session() as session:
+            games_cache.refresh(session)
+    except SQLAlchemyError:
+        # Not fatal: requests connect on demand, as they would without warm-up
+        logger.exception("Startup warm-up failed")
+        return
+
+    elapsed = time.perf_counter() - started
+    APP_STARTUP_DURATION.labels("warmup").set(elapsed)
+    logger.info(
+        f"Started: imports {_import_seconds * 1000:.0f}ms, "
+        f"warm-up {elapsed * 1000:.0f}ms ({opened} connections)"
+    )
+
+
 def get_session():
     db = get_db()
     with db.get_session() as session:
         yield session
 
 
+def get_session_scope():
+    """Opens write sessions on demand, for requests that only sometimes write."""
+    return get_db().get_session
+
+
+def get_read_session(x_consistency_token: str | None = Header(None)):
+    db = get_db()
+    with db.get_read_session(x_consistency_token) as session:
+        yield session
+
+
+def get_streaming_read_session(x_consistency_token: str | None = Header(None)):
+    """Read-only session in a transaction, for server-side cursor exports."""
+    db = get_db()
+    with db.get_read_session(x_consistency_token, streaming=True) as session:
+        yield session
+
+
+@app.get("/metrics", include_in_schema=False)
+def metrics():
+    return Response(generate_latest(REGISTRY), media_type=CONTENT_TYPE_LATEST)
+
+
 @app.get("/health")
 def health_check():
     return {"status": "healthy"}
 
 
-def has_all_lines(game) -> bool:
-    """Check if game has all betting lines available."""
-    return all([
-        game.home_moneyline is not None,
-        game.away_moneyline is not None,
-        game.home_spread is not None,
-        game.away_spread is not None,
-        game.total_points is not None,
-    ])
+def find_games_page(
+    session: Session,
+    status: GameStatus | None = None,
+    commence_from: datetime | None = None,
+    commence_to: datetime | None = None,
+    team: str | None = None,
+    after: tuple[datetime, UUID] | None = None,
+    limit: int = 200,
+):
+    """One page of /games rows, plus the cursor for the next page if any."""
+    if commence_from is None:
+        commence_from = datetime.now(timezone.utc) - timedelta(
+            hours=config.GAMES_LOOKBACK_HOURS
+        )
+
+    game_repo = GameRepository(session)
+    games = game_repo.find_games_with_lines(
+        status=status,
+        commence_from=commence_from,
+        commence_to=commence_to,
+        team=team,
+        after=after,
+        limit=limit + 1,
+    )
+
+    next_cursor = None
+    if len(games) > limit:
+        games = games[:limit]
+        next_cursor = encode_cursor(games[-1].commence_time, games[-1].id)
+
+    return games, next_cursor
+
+
+games_serializer = RowSerializer(GameResponse)
+bets_serializer = RowSerializer(BetResponse)
+snapshots_serializer = RowSerializer(OddsSnapshotResponse)
+points_serializer = RowSerializer(OddsPointResponse)
+team_stats_serializer = RowSerializer(TeamStatsResponse)
+
+
+def refresh_on_commit(cache: ResponseCache):
+    """
+    Event handler re-rendering `cache` after the publisher's commit.
+
+    Renders through an autocommit read session on the publisher's database,
+    so the rebuild sees the commit without opening another write transaction.
+    """
+
+    def refresh(session: Session):
+        with read_only_sessionmaker(session.get_bind())() as read_session:
+            cache.refresh(read_session)
+
+    return refresh
+
+
+# Default /games page size, the only one served from games_cache
+GAMES_PAGE_LIMIT = 200
+
+
+def render_games(session: Session, status: GameStatus | None):
+    games, next_cursor = find_games_page(session, status=status, limit=GAMES_PAGE_LIMIT)
+    body = games_serializer.dump_rows(games)
+    headers = {"X-Next-Cursor": next_cursor} if next_cursor else {}
+    return body, headers
+
+
+# Unfiltered default-size first pages of /games, keyed by status (so at most
+# one entry per GameStatus plus all) and rebuilt whenever sync, scoring or a
+# status sweep commits
+games_cache = ResponseCache(
+    render_games,
+    ttl=timedelta(seconds=config.GAMES_CACHE_TTL_SECONDS),
+    default_keys=[None],
+)
+subscribe(GAMES_CHANGED, refresh_on_commit(games_cache))
 
 
 @app.get("/games", response_model=list[GameResponse])
 def list_games(
     status: GameStatus | None = None,
-    session: Session = Depends(get_session),
+    commence_from: datetime | None = Query(None, alias="from"),
+    commence_to: datetime | None = Query(None, alias="to"),
+    team: str | None = None,
+    cursor: str | None = None,
+    limit: int = Query(GAMES_PAGE_LIMIT, ge=1, le=500),
+    if_none_match: str | None = Header(None),
+    read_session: Session = Depends(get_read_session),
+    session_scope=Depends(get_session_scope),
+):
+    # Only a due sweep needs the primary; the sweep's GAMES_CHANGED has
+    # already rebuilt games_cache from it by the time we read
+    if game_status_sweeper.is_due():
+        with session_scope() as session:
+            game_status_sweeper.sweep_if_due(session)
+
+    if limit == GAMES_PAGE_LIMIT and not (
+        commence_from or commence_to or team or cursor
+    ):
+        cached = games_cache.get(status) or games_cache.load(read_session, status)
+        headers = {"ETag": cached.etag, "Cache-Control": "no-cache"}
+
+        if cached.matches(if_none_match):
+            return Response(status_code=304, headers=headers)
+        return json_response(cached.body, {**headers, **cached.headers})
+
+    try:
+        after = decode_cursor(cursor) if cursor else None
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    games, next_cursor = find_games_page(
+        read_session,
+        status=status,
+        commence_from=commence_from,
+        commence_to=commence_to,
+        team=team,
+        after=after,
+        limit=limit,
+    )
+    headers = {"X-Next-Cursor": next_cursor} if next_cursor else None
+    return json_response(games_serializer.dump_rows(games), headers)
+
+
+@app.get("/games/history")
+def export_game_history(
+    table: HistoryTable = HistoryTable.GAMES,
+    export_format: HistoryFormat = Query(HistoryFormat.ARROW, alias="format"),
+    commence_from: datetime | None = Query(None, alias="from"),
+    commence_to: datetime | None = Query(None, alias="to"),
+    session: Session = Depends(get_streaming_read_session),
+):
+    """
+    Completed games (or their odds runs, `table=odds`) as one Arrow IPC or
+    Parquet file with decimal and timestamp types and season/date columns.
+    """
+    chunks = GameHistoryExportService(session).stream(
+        table, export_format, commence_from, commence_to
+    )
+    filename = f"{table.value}.{export_format.value}"
+    return StreamingResponse(
+        chunks,
+        media_type=export_format.media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+@app.get("/odds/snapshots", response_model=list[OddsSnapshotResponse])
+def list_odds_snapshots(
+    game_id: UUID,
+    bookmaker: str | None = None,
+    session: Session = Depends(get_read_session),
 ):
     game_repo = GameRepository(session)
+    if not game_repo.find_by_id(game_id):
+        raise HTTPException(status_code=404, detail="Game not found")
+
+    snapshot_repo = OddsSnapshotRepository(session)
+    snapshots = snapshot_repo.find_by_game(game_id, bookmaker)
+    return json_response(snapshots_serializer.dump_objects(snapshots))
+
+
+@app.get("/odds/as-of", response_model=OddsSnapshotResponse)
+def get_odds_as_of(
+    game_id: UUID,
+    at: datetime,
+    bookmaker: str = config.ODDS_API_BOOKMAKER,
+    session: Session = Depends(get_read_session),
+):
+    service = LineHistoryService(session)
+    snapshot = service.get_line_as_of(game_id, bookmaker, at)
+
+    if not snapshot:
+        raise HTTPException(status_code=404, detail="No odds captured before that time")
+
+    return snapshot
+
+
+@app.get("/odds/series", response_model=list[OddsPointResponse])
+def get_odds_series(
+    game_id: UUID,
+    start: datetime,
+    end: datetime,
+    step_seconds: int = Query(300, gt=0),
+    bookmaker: str = config.ODDS_API_BOOKMAKER,
+    session: Session = Depends(get_read_session),
+):
+    service = LineHistoryService(session)
+
+    try:
+        series = service.get_line_series(
+            game_id, bookmaker, start, end, timedelta(seconds=step_seconds)
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    points = []
+    for at, run in series:
+        lines = {}
+        if run:
+            lines = {column: getattr(run, column) for column in LINE_COLUMNS}
+        points.append(OddsPointResponse(at=at, **lines))
+
+    return json_response(points_serializer.dump_objects(points))
+
 
-    if status:
-        games = game_repo.find_by_status(status)
-    else:
-        games = game_repo.find_all()
+def render_team_stats(session: Session, season: str):
+    rows = TeamStatsService(session).get_season(season)
+    return team_stats_serializer.dump_rows(rows), {}
+
+
+# /teams/stats by season, rebuilt whenever a refresh commits
+team_stats_cache = ResponseCache(
+    render_team_stats, ttl=timedelta(seconds=config.TEAM_STATS_CACHE_TTL_SECONDS)
+)
+subscribe(TEAM_STATS_CHANGED, refresh_on_commit(team_stats_cache))
+
+
+@app.get("/teams/stats", response_model=list[TeamStatsResponse])
+def list_team_stats(
+    season: str | None = Query(None, pattern=r"^\d{4}-\d{2}$"),
+    if_none_match: str | None = Header(None),
+    session: Session = Depends(get_read_session),
+):
+    """Every team's records for a season (default: the current one)."""
+    season = season or season_for(datetime.now(timezone.utc))
+    cached = team_stats_cache.get(season) or team_stats_cache.load(session, season)
+    headers = {"ETag": cached.etag, "Cache-Control": "no-cache"}
 
-    # Filter out games without complete betting lines
-    games = [g for g in games if has_all_lines(g)]
+    if cached.matches(if_none_match):
+        return Response(status_code=304, headers=headers)
+    return json_response(cached.body, headers)
 
-    return games
+
+event_broker = EventBroker(config.EVENT_STREAM_BUFFER_SIZE)
+for event_type in (ODDS_CHANGED, GAME_STARTED, GAME_COMPLETED, BET_SETTLED):
+    subscribe(event_type, partial(event_broker.relay, event_type))
+
+
+@app.get("/events")
+async def stream_events(
+    request: Request,
+    user_id: UUID | None = None,
+    types: str | None = None,
+    last_event_id: int | None = Header(None),
+    cursor: int | None = Query(None, alias="last_event_id"),
+):
+    """
+    Server-sent events: odds_changed, game_started, game_completed and, for
+    the given user_id, bet_settled. `types` is a comma-separated filter.
+    """
+    stream = sse_stream(
+        event_broker,
+        request,
+        cursor=last_event_id if last_event_id is not None else cursor,
+        user_id=user_id,
+        types=set(types.split(",")) if types else None,
+        keepalive=config.EVENT_STREAM_KEEPALIVE_SECONDS,
+    )
+    return StreamingResponse(
+        stream,
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 @app.post("/bets", response_model=BetResponse)
 def place_bet(
     request: PlaceBetRequest,
     user_id: UUID,
+    response: Response,
     session: Session = Depends(get_session),
 ):
     service = BettingService(session)
@@ -108,7 +517,8 @@ def place_bet(
             selection=db_selection,
             stake=request.stake,
         )
-        return bet
+        response.headers["X-Consistency-Token"] = issue_consistency_token()
+        return BetRepository(session).find_view_by_id(bet.id)
     except InsufficientBalanceError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except InvalidBetError as e:
@@ -118,21 +528,64 @@ def place_bet(
 @app.get("/users/{user_id}/bets", response_model=list[BetResponse])
 def get_user_bets(
     user_id: UUID,
-    session: Session = Depends(get_session),
+    limit: int = Query(50, ge=1, le=500),
+    cursor: str | None = None,
+    status: BetStatus | None = None,
+    bet_type: BetType | None = None,
+    created_from: datetime | None = Query(None, alias="from"),
+    created_to: datetime | None = Query(None, alias="to"),
+    session: Session = Depends(get_read_session),
 ):
     service = BettingService(session)
 
     try:
-        bets = service.get_bet_history(user_id)
-        return bets
+        bets, next_cursor = service.get_bet_history_page(
+            user_id,
+            limit=limit,
+            cursor=cursor,
+            status=status,
+            bet_type=bet_type,
+            created_from=created_from,
+            created_to=created_to,
+        )
     except InvalidBetError as e:
-        raise HTTPException(status_code=404, detail=str(e))
+        raise HTTPException(status_code=400, detail=str(e))
+
+    headers = {"X-Next-Cursor": next_cursor} if next_cursor else None
+    return json_response(bets_serializer.dump_rows(bets), headers)
+
+
+@app.get("/users/{user_id}/bets/export")
+def export_user_bets(
+    user_id: UUID,
+    export_format: ExportFormat = Query(ExportFormat.NDJSON, alias="format"),
+    status: BetStatus | None = None,
+    bet_type: BetType | None = None,
+    created_from: datetime | None = Query(None, alias="from"),
+    created_to: datetime | None = Query(None, alias="to"),
+    session: Session = Depends(get_streaming_read_session),
+):
+    """Full bet history with game lines and scores, oldest first, streamed."""
+    chunks = BetExportService(session).export(
+        export_format,
+        user_id=user_id,
+        status=status,
+        bet_type=bet_type,
+        created_from=created_from,
+        created_to=created_to,
+    )
+    filename = f"bets-{user_id}.{export_format.value}"
+    return StreamingResponse(
+        chunks,
+        media_type=export_format.media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
 
 
 @app.get("/users/{user_id}/balance", response_model=BalanceResponse)
 def get_user_balance(
     user_id: UUID,
-    session: Session = Depends(get_session),
+    session: Session = Depends(get_read_session),
 ):
     user_repo = UserRepository(session)
     user = user_repo.find_by_id(user_id)
@@ -143,10 +596,45 @@ def get_user_balance(
     return BalanceResponse(user_id=user.id, balance=user.balance)
 
 
+@app.get("/users/{user_id}/performance", response_model=PerformanceResponse)
+def get_user_performance(
+    user_id: UUID,
+    session: Session = Depends(get_read_session),
+):
+    """ROI, win rate, Sharpe ratio and drawdown, kept up to date at settlement."""
+    if not UserRepository(session).find_by_id(user_id):
+        raise HTTPException(status_code=404, detail="User not found")
+
+    return PerformanceService(session).get_performance(user_id)
+
+
+@app.get("/users/{user_id}/stats", response_model=UserStatsResponse)
+def get_user_stats(
+    user_id: UUID,
+    session: Session = Depends(get_read_session),
+):
+    """Records, P/L, best and worst teams and streaks, kept up to date at settlement."""
+    if not UserRepository(session).find_by_id(user_id):
+        raise HTTPException(status_code=404, detail="User not found")
+
+    return PerformanceService(session).get_stats(user_id)
+
+
+@app.get("/users/{user_id}/stats/teams", response_model=list[UserTeamStatsResponse])
+def get_user_team_stats(
+    user_id: UUID,
+    session: Session = Depends(get_read_session),
+):
+    if not UserRepository(session).find_by_id(user_id):
+        raise HTTPException(status_code=404, detail="User not found")
+
+    return PerformanceService(session).get_team_stats(user_id)
+
+
 @app.get("/users/by-username/{username}", response_model=UserResponse)
 def get_user_by_username(
     username: str,
-    session: Session = Depends(get_session),
+    session: Session = Depends(get_read_session),
 ):
     user_repo = UserRepository(session)
     user = user_repo.find_by_username(username)
@@ -160,6 +648,7 @@ def get_user_by_username(
 @app.post("/users", response_model=UserResponse)
 def create_user(
     request: CreateUserRequest,
+    response: Response,
     session: Session = Depends(get_session),
 ):
     user_repo = UserRepository(session)
@@ -169,6 +658,8 @@ def create_user(
         raise HTTPException(status_code=400, detail="Username already exists")
 
     user = user_repo.create(username=request.username, balance=request.balance)
+    user_repo.commit()
+    response.headers["X-Consistency-Token"] = issue_consistency_token()
     return user
 
 
@@ -179,63 +670,53 @@ def verify_admin_key(x_admin_key: str = Header()):
         raise HTTPException(status_code=401, detail="Invalid admin key")
 
 
-@app.post("/admin/fetch-games")
-def admin_fetch_games(
-    session: Session = Depends(get_session),
-    _: None = Depends(verify_admin_key),
-):
-    logger.info("Starting game sync...")
-    sync_service = GameSyncService(session)
-    result = sync_service.sync_games()
+def run_fetch_games(session: Session, progress: ProgressReporter) -> dict:
+    progress("Syncing games from The Odds API")
+    result = GameSyncService(session).sync_games()
+    game_status_sweeper.reset()
 
     logger.info(
         f"Game sync complete: {result['created']} created, "
         f"{result['updated']} updated, {result['total']} total"
     )
-
     return {
-        "status": "success",
         "created": result["created"],
         "updated": result["updated"],
         "total": result["total"],
     }
 
 
-@app.post("/admin/score-games")
-def admin_score_games(
-    session: Session = Depends(get_session),
-    _: None = Depends(verify_admin_key),
-):
-    logger.info("Starting game scoring...")
-    scoring_service = GameScoringService(session)
-    updated_games = scoring_service.update_completed_games(days_from=2)
-
+def run_score_games(session: Session, progress: ProgressReporter) -> dict:
+    progress("Fetching scores")
+    updated_games = GameScoringService(session).update_completed_games(days_from=2)
     if updated_games:
-        for game in updated_games:
-            logger.info(
-                f"  Scored: {game.away_team} @ {game.home_team} -> "
-                f"{game.away_score}-{game.home_score}"
-            )
+        # Scoring committed; report before the log lines below reload the
+        # games and reopen the session's transaction
+        progress("Refreshing team stats")
+
+    for game in updated_games:
+        logger.info(
+            f"  Scored: {game.away_team} @ {game.home_team} -> "
+            f"{game.away_score}-{game.home_score}"
+        )
 
     logger.info(f"Game scoring complete: {len(updated_games)} games updated")
+    if not updated_games:
+        return {"games_updated": 0}
 
-    return {
-        "status": "success",
-        "games_updated": len(updated_games),
-    }
+    team_stats = TeamStatsService(session).refresh()
+    logger.info(
+        f"Team stats refreshed ({team_stats['mode']}): "
+        f"{team_stats['games']} games, {team_stats['teams']} teams"
+    )
+    return {"games_updated": len(updated_games), "team_stats": team_stats}
 
 
-@app.post("/admin/settle-bets")
-def admin_settle_bets(
-    session: Session = Depends(get_session),
-    _: None = Depends(verify_admin_key),
-):
-    logger.info("Starting bet settlement...")
+def run_settle_bets(session: Session, progress: ProgressReporter) -> dict:
+    progress("Settling bets for completed games")
     game_repo = GameRepository(session)
     finished_games = game_repo.find_games_with_pending_bets(GameStatus.COMPLETED)
 
-    logger.info(f"Found {len(finished_games)} completed games with pending bets")
-
     settlement_service = BetSettlementService(session)
     settled_bets = settlement_service.settle_bets_for_games(finished_games)
 
@@ -247,11 +728,112 @@ def admin_settle_bets(
         f"Bet settlement complete: {len(settled_bets)} bets settled "
         f"({won_count} won, {lost_count} lost, {push_count} push)"
     )
-
     return {
-        "status": "success",
         "bets_settled": len(settled_bets),
         "won": won_count,
         "lost": lost_count,
         "push": push_count,
     }
+
+
+ADMIN_JOBS = {
+    JobType.FETCH_GAMES: run_fetch_games,
+    JobType.SCORE_GAMES: run_score_games,
+    JobType.SETTLE_BETS: run_settle_bets,
+}
+
+_job_runner = None
+
+
+def get_job_runner() -> JobRunner:
+    global _job_runner
+    if _job_runner is None:
+        _job_runner = JobRunner(
+            ADMIN_JOBS,
+            get_db().get_session,
+            # One worker per job type; the job lock never needs more
+            ThreadPoolExecutor(max_workers=len(JobType), thread_name_prefix="job"),
+            stale_after=timedelta(seconds=config.JOB_STALE_SECONDS),
+            # A job's write lock blocks every SQLite heartbeat; see JobRunner
+            heartbeat=get_db().engine.dialect.name != "sqlite",
+        )
+    return _job_runner
+
+
+def enqueue_job(
+    job_type: JobType, runner: JobRunner, session: Session, response: Response
+):
+    job_id, created = runner.submit(job_type)
+    if not created:
+        logger.info(f"{job_type.value} already active as job {job_id}")
+
+    response.headers["Location"] = f"/admin/jobs/{job_id}"
+    return JobRepository(session).find_by_id(job_id)
+
+
+@app.post("/admin/fetch-games", response_model=JobResponse, status_code=202)
+def admin_fetch_games(
+    response: Response,
+    _: None = Depends(verify_admin_key),
+    runner: JobRunner = Depends(get_job_runner),
+    session: Session = Depends(get_session),
+):
+    return enqueue_job(JobType.FETCH_GAMES, runner, session, response)
+
+
+@app.post("/admin/score-games", response_model=JobResponse, status_code=202)
+def admin_score_games(
+    response: Response,
+    _: None = Depends(verify_admin_key),
+    runner: JobRunner = Depends(get_job_runner),
+    session: Session = Depends(get_session),
+):
+    return enqueue_job(JobType.SCORE_GAMES, runner, session, response)
+
+
+@app.post("/admin/settle-bets", response_model=JobResponse, status_code=202)
+def admin_settle_bets(
+    response: Response,
+    _: None = Depends(verify_admin_key),
+    runner: JobRunner = Depends(get_job_runner),
+    session: Session = Depends(get_session),
+):
+    return enqueue_job(JobType.SETTLE_BETS, runner, session, response)
+
+
+@app.get("/admin/jobs/{job_id}", response_model=JobResponse)
+def get_admin_job(
+    job_id: UUID,
+    _: None = Depends(verify_admin_key),
+    session: Session = Depends(get_session),
+):
+    job = JobRepository(session).find_by_id(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
+
+@app.get("/admin/db-pool", response_model=list[PoolStatusResponse])
+def get_admin_db_pool(_: None = Depends(verify_admin_key)):
+    """
+    Connection pool usage of this instance, per database. Multiply
+    `max_connections` by the instance count to size against the database.
+    """
+    return get_db().pool_status()
+
+
+@app.get("/admin/slow-queries", response_model=list[SlowQueryResponse])
+def get_admin_slow_queries(
+    limit: int = Query(50, ge=1, le=1000),
+    _: None = Depends(verify_admin_key),
+):
+    """
+    This instance's most recent statements over SLOW_QUERY_THRESHOLD_MS,
+    newest first, with redacted parameters, caller and query plan.
+    """
+    return slow_query_log.entries()[:limit]
+
+
+# Last statement of the module, so this covers every import above
+_import_seconds = time.perf_counter() - _import_started
+APP_STARTUP_DURATION.labels("import").set(_import_seconds)
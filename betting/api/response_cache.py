@@ -0,0 +1,82 @@
+"""Precomputed serialized responses held in process memory."""
+
+import hashlib
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import timedelta
+from typing import Callable, Dict, Hashable, Iterable, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+# Builds the body and any extra headers for one cache key
+Renderer = Callable[[Session, Hashable], Tuple[bytes, Dict[str, str]]]
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    body: bytes
+    etag: str
+    expires_at: float
+    headers: Dict[str, str] = field(default_factory=dict)
+
+    def matches(self, if_none_match: Optional[str]) -> bool:
+        """Whether an If-None-Match header names this response's ETag."""
+        if not if_none_match:
+            return False
+        tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+        return "*" in tags or self.etag in tags
+
+
+class ResponseCache:
+    """
+    Serialized responses keyed by request parameters.
+
+    `refresh` re-renders every cached key (plus `default_keys`) when the
+    underlying data changes, so requests between changes are served from
+    memory. Entries also expire after `ttl`, which bounds staleness when the
+    data is changed by another process.
+
+    ETags hash the body, so identical content gets the same tag across
+    rebuilds and across instances.
+    """
+
+    def __init__(
+        self, render: Renderer, ttl: timedelta, default_keys: Iterable[Hashable] = ()
+    ):
+        self.render = render
+        self.ttl = ttl
+        self.default_keys = list(default_keys)
+        self._entries: Dict[Hashable, CachedResponse] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[CachedResponse]:
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None or entry.expires_at <= time.monotonic():
+            return None
+        return entry
+
+    def load(self, session: Session, key: Hashable) -> CachedResponse:
+        """Render `key` with `session` and cache the result."""
+        body, headers = self.render(session, key)
+        entry = CachedResponse(
+            body=body,
+            etag=f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"',
+            expires_at=time.monotonic() + self.ttl.total_seconds(),
+            headers=headers,
+        )
+        with self._lock:
+            self._entries[key] = entry
+        return entry
+
+    def refresh(self, session: Session):
+        """Re-render every cached key, e.g. after a commit changed the data."""
+        with self._lock:
+            keys = set(self._entries) | set(self.default_keys)
+        for key in keys:
+            self.load(session, key)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
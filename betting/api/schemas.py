@@ -1,9 +1,11 @@
 from datetime import datetime
 from decimal import Decimal
+from typing import Any
 from uuid import UUID
 from pydantic import BaseModel, ConfigDict
 
 from betting.models.enums import GameStatus, BetType, BetSelection, BetStatus
+from betting.models.enums import JobStatus, JobType
 
 
 class GameResponse(BaseModel):
@@ -28,6 +30,38 @@ class GameResponse(BaseModel):
     away_score: int | None
 
 
+class OddsSnapshotResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    game_id: UUID
+    captured_at: datetime
+    last_seen_at: datetime
+    sample_count: int
+    bookmaker: str
+    home_moneyline: int | None
+    away_moneyline: int | None
+    home_spread: Decimal | None
+    home_spread_odds: int | None
+    away_spread: Decimal | None
+    away_spread_odds: int | None
+    total_points: Decimal | None
+    over_odds: int | None
+    under_odds: int | None
+
+
+class OddsPointResponse(BaseModel):
+    at: datetime
+    home_moneyline: int | None = None
+    away_moneyline: int | None = None
+    home_spread: Decimal | None = None
+    home_spread_odds: int | None = None
+    away_spread: Decimal | None = None
+    away_spread_odds: int | None = None
+    total_points: Decimal | None = None
+    over_odds: int | None = None
+    under_odds: int | None = None
+
+
 class PlaceBetRequest(BaseModel):
     game_id: UUID
     bet_type: BetType
@@ -48,6 +82,8 @@ class BetResponse(BaseModel):
     potential_payout: Decimal
     status: BetStatus
     settled_at: datetime | None
+    home_team: str
+    away_team: str
 
 
 class BalanceResponse(BaseModel):
@@ -70,3 +106,156 @@ class UserResponse(BaseModel):
 
 class ErrorResponse(BaseModel):
     detail: str
+
+
+class JobResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: UUID
+    job_type: JobType
+    status: JobStatus
+    progress: str | None
+    result: dict[str, Any] | None
+    error: str | None
+    created_at: datetime
+    started_at: datetime | None
+    finished_at: datetime | None
+    duration_seconds: float | None
+
+
+class PoolStatusResponse(BaseModel):
+    name: str
+    pool_class: str
+    size: int | None
+    checked_in: int | None
+    checked_out: int | None
+    overflow: int | None
+    max_connections: int | None
+
+
+class SlowQueryResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    recorded_at: datetime
+    database: str
+    duration_ms: float
+    statement: str
+    parameters: Any
+    caller: str | None
+    plan: list[str] | None
+
+
+class PerformanceRecord(BaseModel):
+    won: int
+    lost: int
+    push: int
+
+
+class BetTypePerformance(BaseModel):
+    count: int
+    roi: float | None
+
+
+class MonthPerformance(BaseModel):
+    month: str
+    bets: int
+    roi: float | None
+
+
+class PerformanceBreakdown(BaseModel):
+    by_bet_type: dict[str, BetTypePerformance]
+    by_month: list[MonthPerformance]
+
+
+class PerformanceResponse(BaseModel):
+    user_id: UUID
+    total_bets: int
+    record: PerformanceRecord
+    win_rate: float | None
+    roi: float | None
+    total_staked: Decimal
+    total_returned: Decimal
+    net_profit: Decimal
+    sharpe_ratio: float | None
+    # Largest fall in net profit from its running peak, in currency
+    max_drawdown: Decimal
+    breakdown: PerformanceBreakdown
+
+
+class BetTypeRecord(BaseModel):
+    wins: int
+    losses: int
+    pushes: int
+    pnl: Decimal
+
+
+class UserTeamStatsResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    team_name: str
+    bets_for: int
+    wins_for: int
+    losses_for: int
+    pnl_for: Decimal
+    bets_against: int
+    wins_against: int
+    losses_against: int
+    pnl_against: Decimal
+
+
+class UserStatsResponse(BaseModel):
+    user_id: UUID
+    total_bets: int
+    total_wins: int
+    total_losses: int
+    total_pushes: int
+    total_staked: Decimal
+    total_pnl: Decimal
+    by_bet_type: dict[str, BetTypeRecord]
+    best_teams: list[UserTeamStatsResponse]
+    worst_teams: list[UserTeamStatsResponse]
+    # Positive for consecutive wins, negative for losses
+    current_streak: int
+    longest_win_streak: int
+    longest_loss_streak: int
+
+
+class TeamStatsResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    team_name: str
+    season: str
+    wins: int
+    losses: int
+    home_wins: int
+    home_losses: int
+    away_wins: int
+    away_losses: int
+    ats_wins: int
+    ats_losses: int
+    ats_pushes: int
+    ats_wins_home: int
+    ats_losses_home: int
+    ats_wins_away: int
+    ats_losses_away: int
+    ats_wins_as_favorite: int
+    ats_losses_as_favorite: int
+    ats_wins_as_underdog: int
+    ats_losses_as_underdog: int
+    overs: int
+    unders: int
+    ou_pushes: int
+    last10_wins: int
+    last10_losses: int
+    last10_ats_wins: int
+    last10_ats_losses: int
+    last10_overs: int
+    last10_unders: int
+    # Last 10 results, oldest first: W/L/P, or O/U/P for totals
+    recent_su: str
+    recent_ats: str
+    recent_ou: str
+    # Straight up; positive for consecutive wins, negative for losses
+    current_streak: int
+    last_game_at: datetime
+    updated_at: datetime
@@ -0,0 +1,40 @@
+"""
+JSON rendering for list endpoints without response_model re-validation.
+
+Repository row views are already typed by their SQLAlchemy columns (UUID,
+Decimal, aware datetime, enum), so validating them again only to serialize
+them is wasted work. RowSerializer hands them straight to pydantic-core's
+Rust JSON encoder through a TypedDict mirror of the response model, which
+keeps the output byte-identical to what response_model would produce.
+"""
+
+from typing import Any, Dict, Iterable, Optional, Sequence
+
+from fastapi import Response
+from pydantic import BaseModel, TypeAdapter
+from sqlalchemy.engine import Row
+from typing_extensions import TypedDict
+
+
+class RowSerializer:
+    """Serializes lists of trusted rows or objects in the shape of `model`."""
+
+    def __init__(self, model: type[BaseModel]):
+        fields = {name: field.annotation for name, field in model.model_fields.items()}
+        row_type = TypedDict(f"{model.__name__}Row", fields)
+        self._rows = TypeAdapter(list[row_type])
+        self._models = TypeAdapter(list[model])
+
+    def dump_rows(self, rows: Sequence[Row]) -> bytes:
+        """Serialize row views; columns beyond the model's fields are dropped."""
+        return self._rows.dump_json([row._asdict() for row in rows])
+
+    def dump_objects(self, objects: Iterable[Any]) -> bytes:
+        """Serialize ORM objects or models, validating from attributes once."""
+        return self._models.dump_json(
+            self._models.validate_python(objects, from_attributes=True)
+        )
+
+
+def json_response(body: bytes, headers: Optional[Dict[str, str]] = None) -> Response:
+    return Response(body, media_type="application/json", headers=headers)
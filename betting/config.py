@@ -9,14 +9,79 @@ class Config:
 
     DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///betting.db")
 
+    # Per engine and instance; keep instances x (size + overflow) under the
+    # database's connection limit
+    DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+    DB_POOL_MAX_OVERFLOW = int(os.getenv("DB_POOL_MAX_OVERFLOW", "10"))
+    # Seconds a request waits for a free connection before failing
+    DB_POOL_TIMEOUT_SECONDS = float(os.getenv("DB_POOL_TIMEOUT_SECONDS", "30"))
+    # Connections older than this are replaced, ahead of server/proxy idle kills
+    DB_POOL_RECYCLE_SECONDS = int(os.getenv("DB_POOL_RECYCLE_SECONDS", "1800"))
+    # Test each connection on checkout, so a dropped one is replaced, not raised
+    DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
+    # DATABASE_URL points at PgBouncer in transaction mode (e.g. Supabase's
+    # pooler on 6543): no app-side pool and no prepared statements
+    DB_PGBOUNCER_TRANSACTION_MODE = (
+        os.getenv("DB_PGBOUNCER_TRANSACTION_MODE", "false").lower() == "true"
+    )
+
+    # Connections opened per database engine at startup, before traffic
+    DB_WARMUP_CONNECTIONS = int(os.getenv("DB_WARMUP_CONNECTIONS", "2"))
+
+    # Comma-separated read replicas; read-only endpoints use these when set
+    DATABASE_REPLICA_URLS = [
+        url for url in os.getenv("DATABASE_REPLICA_URLS", "").split(",") if url
+    ]
+    # Reads carrying a consistency token younger than this go to the primary
+    REPLICA_MAX_LAG_SECONDS = float(os.getenv("REPLICA_MAX_LAG_SECONDS", "5"))
+
     ODDS_API_KEY = os.getenv("ODDS_API_KEY", "")
     ODDS_API_BASE_URL = "https://api.the-odds-api.com/v4"
     ODDS_API_SPORT = "basketball_nba"
+    ODDS_API_BOOKMAKER = "betmgm"
 
     ADMIN_API_KEY = os.getenv("ADMIN_API_KEY", "")
 
+    # Adds per-request SQL stats (X-Query-*) to API responses
+    DEBUG = os.getenv("DEBUG", "false").lower() == "true"
+
+    # Queued or running admin jobs silent for this long are failed, which
+    # frees their type for a new run
+    JOB_STALE_SECONDS = int(os.getenv("JOB_STALE_SECONDS", "900"))
+
+    # Statements slower than this are kept (with their plan) for
+    # /admin/slow-queries and logged; 0 turns the slow query log off
+    SLOW_QUERY_THRESHOLD_MS = float(os.getenv("SLOW_QUERY_THRESHOLD_MS", "0"))
+    SLOW_QUERY_LOG_SIZE = int(os.getenv("SLOW_QUERY_LOG_SIZE", "100"))
+    SLOW_QUERY_EXPLAIN = os.getenv("SLOW_QUERY_EXPLAIN", "true").lower() == "true"
+
     DEFAULT_USER_BALANCE = 1000.00
 
+    # /games lists games from this far back unless a `from` bound is given
+    GAMES_LOOKBACK_HOURS = int(os.getenv("GAMES_LOOKBACK_HOURS", "48"))
+
+    # Cached /games responses are rebuilt on in-process changes; this bounds
+    # staleness from writes made elsewhere (scripts, other instances)
+    GAMES_CACHE_TTL_SECONDS = int(os.getenv("GAMES_CACHE_TTL_SECONDS", "30"))
+
+    # Cached /teams/stats responses are rebuilt when a refresh commits in
+    # this process; this bounds staleness from the refresh script
+    TEAM_STATS_CACHE_TTL_SECONDS = int(os.getenv("TEAM_STATS_CACHE_TTL_SECONDS", "300"))
+
+    # Recent events kept for /events clients reconnecting with Last-Event-ID
+    EVENT_STREAM_BUFFER_SIZE = int(os.getenv("EVENT_STREAM_BUFFER_SIZE", "10000"))
+    # Idle /events connections get a comment line this often
+    EVENT_STREAM_KEEPALIVE_SECONDS = float(
+        os.getenv("EVENT_STREAM_KEEPALIVE_SECONDS", "15")
+    )
+
+    # Upper bound on how stale game status can be between lazy sweeps
+    GAME_STATUS_SWEEP_SECONDS = int(os.getenv("GAME_STATUS_SWEEP_SECONDS", "30"))
+
+    # Snapshots for games older than this are thinned to opening/closing lines
+    # by the prune_odds_snapshots script (0 disables)
+    ODDS_SNAPSHOT_RETENTION_DAYS = int(os.getenv("ODDS_SNAPSHOT_RETENTION_DAYS", "90"))
+
     @classmethod
     def validate(cls):
         """Validate that required configuration is present."""
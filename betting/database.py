@@ -1,16 +1,286 @@
-from sqlalchemy import create_engine
+import itertools
+import time
+from sqlalchemy import create_engine, event, make_url, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import InvalidRequestError
 from sqlalchemy.orm import sessionmaker, Session
-from contextlib import contextmanager
-from typing import Generator
+from sqlalchemy.pool import NullPool, QueuePool
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Any, Dict, Generator, Iterator, List, Optional, Sequence, Tuple
+
+from betting.config import config
+from betting.instrumentation import (
+    SlowQueryLog,
+    instrument_engine,
+    instrument_slow_queries,
+)
+from betting.metrics import instrument_pool
+
+# Connect arguments that turn off server-side prepared statements, which
+# PgBouncer can't route in transaction mode. psycopg2 never prepares.
+_NO_PREPARED_STATEMENTS = {
+    "psycopg": {"prepare_threshold": None},
+}
+
+# Applied to every SQLite connection. WAL lets readers run alongside the
+# writer; NORMAL sync is durable in WAL mode except on power loss; the
+# negative cache size is in KiB (64 MB).
+SQLITE_PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "cache_size": -64000,
+    "mmap_size": 256 * 1024 * 1024,
+    "temp_store": "MEMORY",
+    "busy_timeout": 5000,
+}
+
+
+# Execution option set on the engines behind streaming read sessions
+READ_ONLY_TRANSACTION = "read_only_transaction"
+
+
+def apply_sqlite_profile(engine: Engine) -> Engine:
+    """
+    Tune an SQLite engine for concurrent use: SQLITE_PRAGMAS on connect, and
+    BEGIN IMMEDIATE for transactions.
+
+    A deferred transaction that reads and then writes has to upgrade its
+    lock, and SQLite fails that upgrade at once ("database is locked")
+    instead of waiting when another writer got there first. Taking the write
+    lock at BEGIN makes writers queue on busy_timeout instead. AUTOCOMMIT
+    connections (read sessions) don't begin, and read-only transactions
+    (streaming read sessions) begin deferred, so reads never take it.
+    """
+
+    @event.listens_for(engine, "connect")
+    def configure(dbapi_connection, connection_record):
+        # Transactions are begun below rather than by pysqlite
+        dbapi_connection.isolation_level = None
+        for name, value in SQLITE_PRAGMAS.items():
+            dbapi_connection.execute(f"PRAGMA {name} = {value}")
+
+    @event.listens_for(engine, "begin")
+    def begin(conn):
+        options = conn.get_execution_options()
+        if options.get("isolation_level") == "AUTOCOMMIT":
+            return
+        read_only = options.get(READ_ONLY_TRANSACTION)
+        conn.connection.dbapi_connection.execute(
+            "BEGIN" if read_only else "BEGIN IMMEDIATE"
+        )
+
+    return engine
+
+
+@dataclass(frozen=True)
+class PoolSettings:
+    """
+    Connection pool options for each engine a Database creates.
+
+    An instance holds up to `size + max_overflow` connections per engine, so
+    instances x that x engines must stay under the database's connection
+    limit. With `pgbouncer` the pool is PgBouncer's (transaction mode): the
+    app opens a connection per checkout and sends no prepared statements.
+    Sizing options only apply to server databases; SQLite keeps its defaults.
+    """
+
+    size: int = 5
+    max_overflow: int = 10
+    timeout: float = 30
+    recycle: int = 1800
+    pre_ping: bool = True
+    pgbouncer: bool = False
+
+    @classmethod
+    def from_config(cls) -> "PoolSettings":
+        return cls(
+            size=config.DB_POOL_SIZE,
+            max_overflow=config.DB_POOL_MAX_OVERFLOW,
+            timeout=config.DB_POOL_TIMEOUT_SECONDS,
+            recycle=config.DB_POOL_RECYCLE_SECONDS,
+            pre_ping=config.DB_POOL_PRE_PING,
+            pgbouncer=config.DB_PGBOUNCER_TRANSACTION_MODE,
+        )
+
+    def engine_options(self, db_url: str) -> Dict[str, Any]:
+        """Keyword arguments for create_engine(db_url)."""
+        url = make_url(db_url)
+        if url.get_backend_name() == "sqlite":
+            return {}
+        if self.pgbouncer:
+            return {
+                "poolclass": NullPool,
+                "connect_args": _NO_PREPARED_STATEMENTS.get(url.get_driver_name(), {}),
+            }
+        return {
+            "pool_size": self.size,
+            "max_overflow": self.max_overflow,
+            "pool_timeout": self.timeout,
+            "pool_recycle": self.recycle,
+            "pool_pre_ping": self.pre_ping,
+        }
+
+
+def issue_consistency_token() -> str:
+    """
+    Token handed back to clients after a commit on the primary.
+
+    Passing it to get_read_session keeps that client's reads on the primary
+    until replicas are assumed to have caught up with the write.
+    """
+    return str(time.time_ns() // 1_000_000)
+
+
+class ReadOnlySession(Session):
+    """
+    Session for read-only requests.
+
+    Usually bound to an AUTOCOMMIT engine, so reads open no transaction and
+    closing sends no COMMIT or ROLLBACK. Pending ORM changes are refused at
+    flush instead of being written statement by statement.
+    """
+
+    def flush(self, objects=None):
+        if self.new or self.dirty or self.deleted:
+            raise InvalidRequestError("Read-only session can't flush changes")
+        super().flush(objects)
+
+
+def read_only_sessionmaker(engine: Engine) -> sessionmaker:
+    return sessionmaker(
+        bind=engine.execution_options(isolation_level="AUTOCOMMIT"),
+        class_=ReadOnlySession,
+        autoflush=False,
+        expire_on_commit=False,
+    )
+
+
+def streaming_read_sessionmaker(engine: Engine) -> sessionmaker:
+    """
+    Read-only sessions that run in a transaction, for reads through a
+    server-side cursor (yield_per): psycopg2 refuses named cursors outside a
+    transaction, so these can't use AUTOCOMMIT. The transaction is READ ONLY
+    on PostgreSQL and a deferred BEGIN on SQLite.
+    """
+    factory = sessionmaker(
+        bind=engine.execution_options(**{READ_ONLY_TRANSACTION: True}),
+        class_=ReadOnlySession,
+        autoflush=False,
+        expire_on_commit=False,
+    )
+
+    @event.listens_for(factory, "after_begin")
+    def set_read_only(session, transaction, connection):
+        if connection.dialect.name == "postgresql":
+            connection.exec_driver_sql("SET TRANSACTION READ ONLY")
+
+    return factory
 
 
 class Database:
 
-    def __init__(self, db_url: str):
-        self.engine = create_engine(db_url, echo=False)
+    def __init__(
+        self,
+        db_url: str,
+        replica_urls: Sequence[str] = (),
+        max_replica_lag: timedelta = timedelta(seconds=5),
+        pool_settings: Optional[PoolSettings] = None,
+        slow_query_log: Optional[SlowQueryLog] = None,
+    ):
+        self.pool_settings = pool_settings or PoolSettings.from_config()
+        self.slow_query_log = slow_query_log
+        self.engine = self._create_engine(db_url, "primary")
         self.SessionLocal = sessionmaker(
             bind=self.engine, autoflush=False, autocommit=False
         )
+        self.replica_engines = [
+            self._create_engine(url, f"replica{i}")
+            for i, url in enumerate(replica_urls)
+        ]
+        self.ReadSessionLocal = read_only_sessionmaker(self.engine)
+        self.StreamingReadSessionLocal = streaming_read_sessionmaker(self.engine)
+        self.replica_sessions = [
+            read_only_sessionmaker(engine) for engine in self.replica_engines
+        ]
+        self.replica_streaming_sessions = [
+            streaming_read_sessionmaker(engine) for engine in self.replica_engines
+        ]
+        self._replicas = itertools.cycle(range(len(self.replica_engines)))
+        self.max_replica_lag = max_replica_lag
+
+    def _create_engine(self, db_url: str, name: str) -> Engine:
+        engine = create_engine(
+            db_url, echo=False, **self.pool_settings.engine_options(db_url)
+        )
+        if engine.dialect.name == "sqlite":
+            apply_sqlite_profile(engine)
+        if self.slow_query_log:
+            instrument_slow_queries(engine, self.slow_query_log, name)
+        return instrument_pool(instrument_engine(engine), name)
+
+    def named_engines(self) -> Iterator[Tuple[str, Engine]]:
+        """Engines by the pool name used in metrics: primary, replica0, ..."""
+        yield "primary", self.engine
+        for i, engine in enumerate(self.replica_engines):
+            yield f"replica{i}", engine
+
+    def pool_status(self) -> List[Dict[str, Any]]:
+        """
+        Current usage of each engine's pool.
+
+        `max_connections` is the most this instance can open to that
+        database; it is None when connections aren't pooled here (PgBouncer
+        mode, in-memory SQLite).
+        """
+        status = []
+        for name, engine in self.named_engines():
+            pool = engine.pool
+            entry = {
+                "name": name,
+                "pool_class": type(pool).__name__,
+                "size": None,
+                "checked_in": None,
+                "checked_out": None,
+                "overflow": None,
+                "max_connections": None,
+            }
+            if isinstance(pool, QueuePool):
+                entry.update(
+                    size=pool.size(),
+                    checked_in=pool.checkedin(),
+                    checked_out=pool.checkedout(),
+                    # QueuePool counts overflow from -size; report real overflow
+                    overflow=max(pool.overflow(), 0),
+                    # No public accessor for the overflow limit
+                    max_connections=pool.size() + pool._max_overflow,
+                )
+            status.append(entry)
+        return status
+
+    def warm_up(self, connections: int) -> int:
+        """
+        Open pooled connections to the primary and every replica ahead of
+        traffic, so the first requests don't pay for connecting and the
+        dialect's first-connect checks.
+
+        Up to `connections` are opened per engine, capped at the pool size;
+        pools without a fixed size get one. Returns how many were opened.
+        """
+        opened = 0
+        for _, engine in self.named_engines():
+            pool = engine.pool
+            count = min(connections, pool.size()) if isinstance(pool, QueuePool) else 1
+            # Held together so the pool ends up with `count` distinct
+            # connections; autocommit, so no transaction (or lock) is held
+            autocommit = engine.execution_options(isolation_level="AUTOCOMMIT")
+            with ExitStack() as stack:
+                for _ in range(count):
+                    connection = stack.enter_context(autocommit.connect())
+                    connection.execute(text("SELECT 1"))
+                    opened += 1
+        return opened
 
     @contextmanager
     def get_session(self) -> Generator[Session, None, None]:
@@ -24,12 +294,60 @@ class Database:
         finally:
             session.close()
 
+    @contextmanager
+    def get_read_session(
+        self, consistency_token: Optional[str] = None, streaming: bool = False
+    ) -> Generator[Session, None, None]:
+        """
+        Read-only session, served by a replica when one is configured.
+
+        Falls back to the primary when the consistency token is younger than
+        max_replica_lag, so clients see their own writes. See ReadOnlySession.
+        Pass `streaming` for reads through a server-side cursor; see
+        streaming_read_sessionmaker.
+        """
+        if streaming:
+            primary, replicas = (
+                self.StreamingReadSessionLocal,
+                self.replica_streaming_sessions,
+            )
+        else:
+            primary, replicas = self.ReadSessionLocal, self.replica_sessions
+
+        if replicas and self._replica_is_fresh(consistency_token):
+            session = replicas[next(self._replicas)]()
+        else:
+            session = primary()
+        try:
+            yield session
+        finally:
+            session.close()
+
+    def _replica_is_fresh(self, consistency_token: Optional[str]) -> bool:
+        if consistency_token is None:
+            return True
+        try:
+            written_at_ms = int(consistency_token)
+        except ValueError:
+            # An unreadable token is treated as a recent write
+            return False
+        lag_ms = self.max_replica_lag.total_seconds() * 1000
+        return time.time_ns() // 1_000_000 - written_at_ms >= lag_ms
+
 
 _db_instance = None
 
 
-def get_database(db_url: str) -> Database:
+def get_database(
+    db_url: str,
+    replica_urls: Sequence[str] = (),
+    max_replica_lag: timedelta = timedelta(seconds=5),
+    pool_settings: Optional[PoolSettings] = None,
+    slow_query_log: Optional[SlowQueryLog] = None,
+) -> Database:
     global _db_instance
     if _db_instance is None:
-        _db_instance = Database(db_url)
+        _db_instance = Database(
+            db_url, replica_urls, max_replica_lag, pool_settings, slow_query_log
+        )
     return _db_instance
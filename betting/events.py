@@ -0,0 +1,47 @@
+"""In-process publish/subscribe for domain events."""
+
+import logging
+from collections import defaultdict
+from typing import Callable, Dict, List
+
+logger = logging.getLogger(__name__)
+
+# Published after a commit that changed game rows (lines, scores or status).
+# Payload: session, the session that made the change
+GAMES_CHANGED = "games_changed"
+
+# Published after a commit that refreshed team_stats rows.
+# Payload: session, the session that made the change
+TEAM_STATS_CHANGED = "team_stats_changed"
+
+# Published after commit with `payloads`, one plain dict per game or bet
+# (built before the commit expires the ORM objects). Every payload carries
+# game_id; BET_SETTLED payloads also carry the owning user_id.
+ODDS_CHANGED = "odds_changed"
+GAME_STARTED = "game_started"
+GAME_COMPLETED = "game_completed"
+BET_SETTLED = "bet_settled"
+
+_subscribers: Dict[str, List[Callable[..., None]]] = defaultdict(list)
+
+
+def subscribe(event: str, handler: Callable[..., None]):
+    _subscribers[event].append(handler)
+
+
+def unsubscribe(event: str, handler: Callable[..., None]):
+    _subscribers[event].remove(handler)
+
+
+def publish(event: str, **payload):
+    """
+    Call every handler subscribed to `event` with the payload.
+
+    Handlers run synchronously after the publisher's commit, so a failing
+    handler is logged rather than allowed to fail the write that triggered it.
+    """
+    for handler in list(_subscribers[event]):
+        try:
+            handler(**payload)
+        except Exception:
+            logger.exception(f"Handler {handler!r} failed for {event}")
@@ -0,0 +1,333 @@
+"""
+Per-request and per-job SQL statement counting, with N+1 detection, and an
+opt-in log of slow statements with their query plans.
+"""
+
+import logging
+import sys
+import threading
+import time
+from collections import Counter, deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import date, datetime, timezone
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import ORMExecuteState, Session
+
+logger = logging.getLogger(__name__)
+
+# The same statement run this many times in one unit of work is reported as
+# a likely N+1 pattern
+N_PLUS_ONE_THRESHOLD = 5
+
+
+@dataclass
+class QueryStats:
+    statements: int = 0
+    sql_time: float = 0.0
+    # Rows written, plus rows read when collected with count_rows
+    rows: int = 0
+    # BEGIN, COMMIT and ROLLBACK sent to the database
+    transactions: int = 0
+    statement_counts: Counter = field(default_factory=Counter)
+    count_rows: bool = False
+
+    def repeated_statements(
+        self, threshold: int = N_PLUS_ONE_THRESHOLD
+    ) -> List[Tuple[str, int]]:
+        """Statements executed at least `threshold` times, most frequent first."""
+        return [
+            (statement, count)
+            for statement, count in self.statement_counts.most_common()
+            if count >= threshold
+        ]
+
+    def summary(self) -> str:
+        return (
+            f"{self.statements} statements, "
+            f"{self.sql_time * 1000:.1f} ms SQL, {self.rows} rows"
+        )
+
+    def as_log_fields(self) -> Dict[str, object]:
+        return {
+            "query_count": self.statements,
+            "query_time_ms": round(self.sql_time * 1000, 3),
+            "query_rows": self.rows,
+            "query_transactions": self.transactions,
+        }
+
+    def as_headers(self) -> Dict[str, str]:
+        return {
+            "X-Query-Count": str(self.statements),
+            "X-Query-Time-Ms": f"{self.sql_time * 1000:.3f}",
+            "X-Query-Rows": str(self.rows),
+        }
+
+
+_current_stats: ContextVar[Optional[QueryStats]] = ContextVar(
+    "query_stats", default=None
+)
+
+
+@contextmanager
+def collect_query_stats(count_rows: bool = False) -> Iterator[QueryStats]:
+    """
+    Count SQL issued on instrumented engines within this block.
+
+    Stats are tracked per context, so concurrent requests and jobs each see
+    only their own statements. Rows written come from the cursor's rowcount;
+    `count_rows` also counts rows read, which buffers every non-streaming
+    session SELECT, so it is meant for debugging.
+    """
+    stats = QueryStats(count_rows=count_rows)
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+class QueryBudgetExceeded(AssertionError):
+    """Raised by query_budget when a block issues too many statements."""
+
+    pass
+
+
+@contextmanager
+def query_budget(max_statements: int) -> Iterator[QueryStats]:
+    """
+    Test helper failing when a code path issues more than `max_statements`.
+
+    Raises:
+        QueryBudgetExceeded: Listing each statement and how often it ran
+    """
+    with collect_query_stats() as stats:
+        yield stats
+
+    if stats.statements > max_statements:
+        statements = "\n".join(
+            f"  {count}x {statement}"
+            for statement, count in stats.statement_counts.most_common()
+        )
+        raise QueryBudgetExceeded(
+            f"Query budget exceeded: {stats.statements} statements "
+            f"(budget {max_statements})\n{statements}"
+        )
+
+
+def instrument_engine(engine: Engine) -> Engine:
+    """Attach statement counting to an engine. Safe to call more than once."""
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+        for name in ("begin", "commit", "rollback"):
+            event.listen(engine, name, _count_transaction_command)
+    if not event.contains(Session, "do_orm_execute", _count_selected_rows):
+        event.listen(Session, "do_orm_execute", _count_selected_rows)
+    return engine
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _current_stats.get() is not None:
+        conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    start_times = conn.info.get("query_start_time")
+    if not start_times:
+        return
+    started = start_times.pop()
+
+    stats = _current_stats.get()
+    if stats is None:
+        return
+    stats.sql_time += time.perf_counter() - started
+    stats.statements += 1
+    stats.statement_counts[statement] += 1
+    written = context is not None and (
+        context.isinsert or context.isupdate or context.isdelete
+    )
+    if written and cursor.rowcount > 0:
+        stats.rows += cursor.rowcount
+
+
+def _count_transaction_command(conn):
+    stats = _current_stats.get()
+    if stats is None:
+        return
+    # Under AUTOCOMMIT the DBAPI ignores these, so nothing reaches the server
+    if conn.get_execution_options().get("isolation_level") != "AUTOCOMMIT":
+        stats.transactions += 1
+
+
+def _count_selected_rows(orm_execute_state: ORMExecuteState):
+    """
+    Count rows returned by session SELECTs, when collecting with count_rows.
+
+    DBAPI cursors don't report SELECT row counts portably, so the result is
+    buffered here and replayed. Streaming reads are left alone.
+    """
+    stats = _current_stats.get()
+    if stats is None or not stats.count_rows or not orm_execute_state.is_select:
+        return None
+
+    options = orm_execute_state.execution_options
+    if options.get("yield_per") or options.get("stream_results"):
+        return None
+
+    frozen = orm_execute_state.invoke_statement().freeze()
+    stats.rows += len(frozen.data)
+    return frozen()
+
+
+@dataclass(frozen=True)
+class SlowQuery:
+    recorded_at: datetime
+    database: str
+    duration_ms: float
+    statement: str
+    parameters: Any
+    # Repository (or other app) function that issued the statement
+    caller: Optional[str]
+    plan: Optional[List[str]]
+
+
+class SlowQueryLog:
+    """
+    The most recent statements slower than `threshold` seconds.
+
+    Parameters are kept with their values redacted (see redact_parameters).
+    With `explain`, the plan is captured by re-running the statement under
+    EXPLAIN (PostgreSQL) or EXPLAIN QUERY PLAN (SQLite) on the same
+    connection; neither executes it.
+    """
+
+    def __init__(self, threshold: float, size: int = 100, explain: bool = True):
+        self.threshold = threshold
+        self.explain = explain
+        self._entries: deque = deque(maxlen=size)
+        self._lock = threading.Lock()
+
+    def record(self, entry: SlowQuery):
+        with self._lock:
+            self._entries.append(entry)
+        logger.warning(
+            f"Slow query ({entry.duration_ms:.1f} ms) in {entry.caller}: "
+            f"{entry.statement}",
+            extra={
+                "slow_query_ms": entry.duration_ms,
+                "slow_query_caller": entry.caller,
+                "slow_query_database": entry.database,
+                "slow_query_statement": entry.statement,
+                "slow_query_parameters": entry.parameters,
+                "slow_query_plan": entry.plan,
+            },
+        )
+
+    def entries(self) -> List[SlowQuery]:
+        """Newest first."""
+        with self._lock:
+            return list(reversed(self._entries))
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+def instrument_slow_queries(engine: Engine, log: SlowQueryLog, name: str) -> Engine:
+    """Record statements on `engine` that take longer than the log's threshold."""
+
+    def before(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("slow_query_start_time", []).append(time.perf_counter())
+
+    def after(conn, cursor, statement, parameters, context, executemany):
+        start_times = conn.info.get("slow_query_start_time")
+        if not start_times:
+            return
+        elapsed = time.perf_counter() - start_times.pop()
+        if elapsed < log.threshold:
+            return
+
+        plan = None
+        if log.explain and not executemany:
+            plan = _explain(conn, statement, parameters)
+        log.record(
+            SlowQuery(
+                recorded_at=datetime.now(timezone.utc),
+                database=name,
+                duration_ms=round(elapsed * 1000, 3),
+                statement=statement,
+                parameters=redact_parameters(parameters, executemany),
+                caller=_calling_function(),
+                plan=plan,
+            )
+        )
+
+    event.listen(engine, "before_cursor_execute", before)
+    event.listen(engine, "after_cursor_execute", after)
+    return engine
+
+
+# Values shown as-is in slow query parameters; everything else (names,
+# ids, amounts) is replaced by its type name
+_SHOWN_PARAMETER_TYPES = (bool, int, float, type(None), date)
+
+
+def redact_parameters(parameters: Any, executemany: bool = False) -> Any:
+    if executemany:
+        return f"<{len(parameters)} parameter sets>"
+    if isinstance(parameters, dict):
+        return {key: _redact(value) for key, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        return [_redact(value) for value in parameters]
+    return _redact(parameters)
+
+
+def _redact(value: Any) -> Any:
+    if isinstance(value, _SHOWN_PARAMETER_TYPES):
+        return value.isoformat() if isinstance(value, date) else value
+    return f"<{type(value).__name__}>"
+
+
+def _calling_function() -> Optional[str]:
+    """Innermost app frame outside this module: the repository method, usually."""
+    frame = sys._getframe(1)
+    while frame is not None:
+        module = frame.f_globals.get("__name__", "")
+        if module.startswith("betting.") and module != __name__:
+            return f"{module}.{frame.f_code.co_qualname}"
+        frame = frame.f_back
+    return None
+
+
+# A failed statement aborts a PostgreSQL transaction, so only statements
+# EXPLAIN accepts are explained
+_EXPLAINABLE = ("SELECT", "WITH", "INSERT", "UPDATE", "DELETE")
+
+
+def _explain(conn, statement: str, parameters: Any) -> Optional[List[str]]:
+    if not statement.lstrip().upper().startswith(_EXPLAINABLE):
+        return None
+    dialect = conn.dialect.name
+    if dialect == "postgresql":
+        prefix, column = "EXPLAIN ", 0
+    elif dialect == "sqlite":
+        prefix, column = "EXPLAIN QUERY PLAN ", 3
+    else:
+        return None
+
+    # The raw DBAPI cursor bypasses engine events, so the EXPLAIN itself is
+    # neither timed nor counted in QueryStats
+    cursor = conn.connection.dbapi_connection.cursor()
+    try:
+        cursor.execute(prefix + statement, parameters)
+        return [str(row[column]) for row in cursor.fetchall()]
+    except Exception:
+        logger.warning("Could not EXPLAIN slow query", exc_info=True)
+        return None
+    finally:
+        cursor.close()
@@ -0,0 +1,179 @@
+"""
+Background execution of admin jobs.
+
+Triggers (the /admin endpoints, Cloud Scheduler) only queue a Job row and
+return its id; the work runs on an executor. At most one job per type is
+queued or running across all instances (see Job), so overlapping or retried
+triggers share the run in progress instead of starting another.
+"""
+
+import logging
+import threading
+from concurrent.futures import Executor
+from contextlib import AbstractContextManager
+from datetime import datetime, timedelta, timezone
+from functools import partial
+from typing import Any, Callable, Dict, Mapping, Optional, Set, Tuple
+from uuid import UUID
+
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from betting.instrumentation import collect_query_stats
+from betting.models import JobStatus, JobType
+from betting.repositories import JobRepository
+
+logger = logging.getLogger(__name__)
+
+# Reports progress; also refreshes the job's heartbeat
+ProgressReporter = Callable[[str], None]
+
+# Does a job's work in `session` and returns its row counts
+JobHandler = Callable[[Session, ProgressReporter], Dict[str, Any]]
+
+SessionFactory = Callable[[], AbstractContextManager[Session]]
+
+
+class JobRunner:
+    """
+    Queues jobs and runs them on `executor`.
+
+    `session_factory` yields a session that commits on success (like
+    Database.get_session). Job bookkeeping uses its own short sessions, so
+    progress is visible while the job's work is still uncommitted. On SQLite
+    a write session holds the database lock from its first statement (see
+    apply_sqlite_profile), so handlers report progress only while their
+    session has no transaction open; a progress write that still times out
+    is logged rather than failing the job.
+
+    Active jobs whose heartbeat is older than `stale_after` are failed on
+    the next submit of any job, so a worker lost mid-run can't hold its
+    type's lock forever. A running job's heartbeat is refreshed every
+    `heartbeat_interval` (default a third of `stale_after`) on a timer, so
+    handlers that run long without reporting progress are not expired.
+    Jobs this runner is still running are never expired by its own submits.
+
+    Pass `heartbeat=False` on SQLite: a job holding the write lock longer
+    than the interval would block every beat, and with a single writer
+    there is no other instance to protect the lock from.
+    """
+
+    def __init__(
+        self,
+        handlers: Mapping[JobType, JobHandler],
+        session_factory: SessionFactory,
+        executor: Executor,
+        stale_after: timedelta,
+        heartbeat_interval: Optional[timedelta] = None,
+        heartbeat: bool = True,
+    ):
+        self.handlers = dict(handlers)
+        self.session_factory = session_factory
+        self.executor = executor
+        self.stale_after = stale_after
+        self.heartbeat_interval = heartbeat_interval or stale_after / 3
+        self.heartbeat = heartbeat
+        self._running: Set[UUID] = set()
+        self._lock = threading.Lock()
+
+    def submit(self, job_type: JobType) -> Tuple[UUID, bool]:
+        """
+        Queue a job unless one of this type is already active.
+
+        Returns:
+            (job_id, created) where job_id is the active job when not created
+        """
+        with self.session_factory() as session:
+            repo = JobRepository(session)
+            with self._lock:
+                running = set(self._running)
+            expired = repo.fail_stale(
+                datetime.now(timezone.utc) - self.stale_after, exclude=running
+            )
+            if expired:
+                logger.warning(f"Failed {expired} abandoned job(s)")
+            job, created = repo.create_unless_active(job_type)
+            repo.commit()
+            job_id = job.id
+
+        if created:
+            self.executor.submit(self._run, job_id, job_type)
+        return job_id, created
+
+    def _run(self, job_id: UUID, job_type: JobType):
+        with self._lock:
+            self._running.add(job_id)
+        try:
+            self._run_job(job_id, job_type)
+        finally:
+            with self._lock:
+                self._running.discard(job_id)
+
+    def _run_job(self, job_id: UUID, job_type: JobType):
+        self._update(
+            job_id, status=JobStatus.RUNNING, started_at=datetime.now(timezone.utc)
+        )
+        logger.info(f"Job {job_id} ({job_type.value}) started")
+
+        finished = threading.Event()
+        heartbeat = threading.Thread(
+            target=self._heartbeat,
+            args=(job_id, finished),
+            name=f"job-heartbeat-{job_id}",
+            daemon=True,
+        )
+        if self.heartbeat:
+            heartbeat.start()
+        try:
+            with collect_query_stats() as stats, self.session_factory() as session:
+                result = self.handlers[job_type](
+                    session, partial(self._progress, job_id)
+                )
+        except Exception as e:
+            logger.exception(f"Job {job_id} ({job_type.value}) failed")
+            self._update(
+                job_id,
+                status=JobStatus.FAILED,
+                finished_at=datetime.now(timezone.utc),
+                error=f"{type(e).__name__}: {e}",
+            )
+            return
+        finally:
+            finished.set()
+            if heartbeat.is_alive():
+                heartbeat.join()
+
+        recorded = self._update(
+            job_id,
+            status=JobStatus.SUCCEEDED,
+            finished_at=datetime.now(timezone.utc),
+            result={**result, **stats.as_log_fields()},
+        )
+        if not recorded:
+            logger.warning(
+                f"Job {job_id} ({job_type.value}) succeeded after it was "
+                f"failed as abandoned: {result}"
+            )
+            return
+        logger.info(f"Job {job_id} ({job_type.value}) succeeded: {result}")
+
+    def _heartbeat(self, job_id: UUID, finished: threading.Event):
+        while not finished.wait(self.heartbeat_interval.total_seconds()):
+            try:
+                self._update(job_id, updated_at=datetime.now(timezone.utc))
+            except Exception:
+                # The next beat retries; enough missed beats expire the job
+                logger.exception(f"Job {job_id} heartbeat failed")
+
+    def _progress(self, job_id: UUID, message: str):
+        try:
+            self._update(job_id, progress=message)
+        except SQLAlchemyError:
+            logger.exception(f"Job {job_id} progress update failed")
+
+    def _update(self, job_id: UUID, **values) -> bool:
+        with self.session_factory() as session:
+            repo = JobRepository(session)
+            updated = repo.update(job_id, **values)
+            repo.commit()
+        return updated
@@ -0,0 +1,121 @@
+"""
+Process metrics, served at /metrics by prometheus_client.
+
+Everything registers in prometheus_client's default registry, which also
+carries its process and GC collectors. Recording a request (in-flight gauge
+up and down plus a labelled observation) costs a few microseconds (see
+benchmarks/bench_metrics.py).
+"""
+
+import math
+import time
+
+from prometheus_client import REGISTRY, Counter, Gauge, Histogram
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import QueuePool
+
+# Seconds; spans fast cached reads up to slow upstream calls
+LATENCY_BUCKETS = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template",
+    ["method", "route", "status"],
+    buckets=LATENCY_BUCKETS,
+)
+HTTP_REQUESTS_IN_FLIGHT = Gauge(
+    "http_requests_in_flight", "HTTP requests currently being served"
+)
+
+APP_STARTUP_DURATION = Gauge(
+    "app_startup_seconds",
+    "Time spent in each startup phase of this instance",
+    ["phase"],
+)
+
+DB_POOL_CHECKOUT_DURATION = Histogram(
+    "db_pool_checkout_seconds",
+    "Time a pooled database connection is held, checkout to checkin",
+    ["pool"],
+    buckets=LATENCY_BUCKETS,
+)
+DB_POOL_SIZE = Gauge(
+    "db_pool_size", "Configured connections held by the pool", ["pool"]
+)
+DB_POOL_CHECKED_OUT = Gauge(
+    "db_pool_checked_out", "Pooled connections currently in use", ["pool"]
+)
+DB_POOL_OVERFLOW = Gauge(
+    "db_pool_overflow", "Connections open beyond the pool size", ["pool"]
+)
+DB_POOL_MAX_CONNECTIONS = Gauge(
+    "db_pool_max_connections",
+    "Most connections the pool will open (size plus max overflow)",
+    ["pool"],
+)
+
+ODDS_API_REQUEST_DURATION = Histogram(
+    "odds_api_request_duration_seconds",
+    "The Odds API call latency",
+    ["endpoint", "outcome"],
+    buckets=LATENCY_BUCKETS,
+)
+ODDS_API_REQUESTS_REMAINING = Gauge(
+    "odds_api_requests_remaining", "Quota left, from x-requests-remaining"
+)
+ODDS_API_REQUESTS_USED = Gauge(
+    "odds_api_requests_used", "Quota used, from x-requests-used"
+)
+# NaN rather than a misleading 0 until the first call reports them
+ODDS_API_REQUESTS_REMAINING.set(math.nan)
+ODDS_API_REQUESTS_USED.set(math.nan)
+
+BETS_PLACED = Counter("bets_placed_total", "Bets placed", ["bet_type"])
+BETS_SETTLED = Counter("bets_settled_total", "Bets settled", ["status"])
+
+
+def instrument_pool(engine: Engine, name: str) -> Engine:
+    """
+    Record connection hold times and expose size gauges for an engine's pool.
+
+    Hold times come from the pool's checkout/checkin events, which survive
+    Engine.dispose(). Pools without a fixed size (SQLite's defaults) report
+    hold times only; after disposing, call this again to point the size
+    gauges at the new pool.
+    """
+    held = DB_POOL_CHECKOUT_DURATION.labels(name)
+
+    @event.listens_for(engine, "checkout")
+    def checkout(dbapi_connection, connection_record, connection_proxy):
+        connection_record.info["checked_out_at"] = time.perf_counter()
+
+    @event.listens_for(engine, "checkin")
+    def checkin(dbapi_connection, connection_record):
+        checked_out_at = connection_record.info.pop("checked_out_at", None)
+        if checked_out_at is not None:
+            held.observe(time.perf_counter() - checked_out_at)
+
+    pool = engine.pool
+    if isinstance(pool, QueuePool):
+        DB_POOL_SIZE.labels(name).set_function(pool.size)
+        DB_POOL_CHECKED_OUT.labels(name).set_function(pool.checkedout)
+        # QueuePool counts overflow from -size; only report real overflow
+        DB_POOL_OVERFLOW.labels(name).set_function(lambda: max(pool.overflow(), 0))
+        DB_POOL_MAX_CONNECTIONS.labels(name).set(pool.size() + pool._max_overflow)
+    return engine
@@ -2,7 +2,12 @@ from .base import Base
 from .user import User
 from .game import Game
 from .bet import Bet
-from .enums import BetType, BetSelection, BetStatus, GameStatus
+from .odds_snapshot import OddsSnapshot
+from .job import Job
+from .performance import UserPerformance, UserPerformanceBucket, UserTeamStats
+from .team_stats import TeamStats
+from .enums import BetType, BetSelection, BetStatus, GameStatus, JobStatus, JobType
+from .enums import PerformanceDimension
 
 __all__ = [
     "Base",
@@ -10,6 +15,15 @@ __all__ = [
     "Game",
     "GameStatus",
     "Bet",
+    "OddsSnapshot",
+    "Job",
+    "JobType",
+    "JobStatus",
+    "UserPerformance",
+    "UserPerformanceBucket",
+    "UserTeamStats",
+    "TeamStats",
+    "PerformanceDimension",
     "BetType",
     "BetSelection",
     "BetStatus",
@@ -1,7 +1,7 @@
 from datetime import datetime
 from decimal import Decimal
 from uuid import UUID, uuid4
-from sqlalchemy import Numeric, Enum, ForeignKey, Uuid
+from sqlalchemy import Numeric, Enum, ForeignKey, Index, Uuid, text
 from sqlalchemy.orm import Mapped, mapped_column
 from typing import Optional
 
@@ -10,9 +10,27 @@ from .types import TZDateTime
 
 from .base import Base
 
+# Partial index predicate; enums are stored by name
+PENDING_ONLY = text("status = 'PENDING'")
+
 
 class Bet(Base):
     __tablename__ = "bets"
+    __table_args__ = (
+        Index("ix_bets_user_id_created_at_id", "user_id", "created_at", "id"),
+        Index(
+            "ix_bets_game_id_pending",
+            "game_id",
+            postgresql_where=PENDING_ONLY,
+            sqlite_where=PENDING_ONLY,
+        ),
+        Index(
+            "ix_bets_user_id_pending",
+            "user_id",
+            postgresql_where=PENDING_ONLY,
+            sqlite_where=PENDING_ONLY,
+        ),
+    )
 
     id: Mapped[UUID] = mapped_column(Uuid, primary_key=True, default=uuid4)
 
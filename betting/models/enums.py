@@ -25,3 +25,21 @@ class BetStatus(str, Enum):
     WON = "won"
     LOST = "lost"
     PUSH = "push"
+
+
+class JobType(str, Enum):
+    FETCH_GAMES = "fetch_games"
+    SCORE_GAMES = "score_games"
+    SETTLE_BETS = "settle_bets"
+
+
+class JobStatus(str, Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+class PerformanceDimension(str, Enum):
+    BET_TYPE = "bet_type"
+    MONTH = "month"
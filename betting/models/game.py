@@ -1,7 +1,7 @@
 from datetime import datetime
 from decimal import Decimal
 from uuid import UUID, uuid4
-from sqlalchemy import String, Numeric, Integer, Enum, Uuid
+from sqlalchemy import String, Numeric, Integer, Enum, Index, Uuid
 from sqlalchemy.orm import Mapped, mapped_column
 from typing import Optional
 
@@ -13,6 +13,10 @@ from .base import Base
 
 class Game(Base):
     __tablename__ = "games"
+    __table_args__ = (
+        Index("ix_games_status_commence_time", "status", "commence_time"),
+        Index("ix_games_commence_time", "commence_time"),
+    )
 
     id: Mapped[UUID] = mapped_column(Uuid, primary_key=True, default=uuid4)
     external_id: Mapped[str] = mapped_column(String(100), unique=True, nullable=False)
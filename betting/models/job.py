@@ -0,0 +1,57 @@
+from datetime import datetime
+from typing import Any, Dict, Optional
+from uuid import UUID, uuid4
+from sqlalchemy import JSON, Enum, Index, String, Text, Uuid, text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from betting.models.enums import JobStatus, JobType
+from .types import TZDateTime
+
+from .base import Base
+
+# Partial index predicate; enums are stored by name
+ACTIVE_ONLY = text("status IN ('QUEUED', 'RUNNING')")
+
+
+class Job(Base):
+    """One run of an admin job (sync, scoring, settlement).
+
+    The partial unique index allows a single queued or running job per type
+    across every instance, so overlapping triggers share one run.
+    """
+
+    __tablename__ = "jobs"
+    __table_args__ = (
+        Index(
+            "ux_jobs_job_type_active",
+            "job_type",
+            unique=True,
+            postgresql_where=ACTIVE_ONLY,
+            sqlite_where=ACTIVE_ONLY,
+        ),
+    )
+
+    id: Mapped[UUID] = mapped_column(Uuid, primary_key=True, default=uuid4)
+    job_type: Mapped[JobType] = mapped_column(Enum(JobType), nullable=False)
+    status: Mapped[JobStatus] = mapped_column(
+        Enum(JobStatus), nullable=False, default=JobStatus.QUEUED
+    )
+
+    started_at: Mapped[Optional[datetime]] = mapped_column(TZDateTime, nullable=True)
+    finished_at: Mapped[Optional[datetime]] = mapped_column(TZDateTime, nullable=True)
+
+    # Latest progress message; updated_at doubles as the worker's heartbeat
+    progress: Mapped[Optional[str]] = mapped_column(String(200), nullable=True)
+    # Row counts and other figures reported by the job
+    result: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSON, nullable=True)
+    error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+
+    @property
+    def duration_seconds(self) -> Optional[float]:
+        if self.started_at is None:
+            return None
+        end = self.finished_at or datetime.now(self.started_at.tzinfo)
+        return (end - self.started_at).total_seconds()
+
+    def __repr__(self):
+        return f"<Job(id={self.id}, {self.job_type.value}, {self.status.value})>"
@@ -0,0 +1,76 @@
+from datetime import datetime
+from decimal import Decimal
+from uuid import UUID, uuid4
+from sqlalchemy import String, Numeric, Integer, ForeignKey, Index, Uuid
+from sqlalchemy.orm import Mapped, mapped_column
+from typing import Any, Dict, Optional
+
+from .types import TZDateTime
+
+from .base import Base
+
+LINE_COLUMNS = (
+    "home_moneyline",
+    "away_moneyline",
+    "home_spread",
+    "home_spread_odds",
+    "away_spread",
+    "away_spread_odds",
+    "total_points",
+    "over_odds",
+    "under_odds",
+)
+
+
+class OddsSnapshot(Base):
+    """One bookmaker's lines for a game, stored as a run of unchanged values.
+
+    A row is only written when a price or point moves. Later syncs that see
+    the same lines extend the run (last_seen_at, sample_count) instead of
+    appending a duplicate, so the lines held from captured_at until the next
+    row's captured_at.
+
+    Prices are stored as integers (American odds are always whole numbers) to
+    keep rows compact; see OddsSnapshotRepository.prune for retention.
+    """
+
+    __tablename__ = "odds_snapshots"
+    __table_args__ = (
+        Index("ix_odds_snapshots_game_id_captured_at", "game_id", "captured_at"),
+        Index(
+            "ix_odds_snapshots_game_id_bookmaker_captured_at",
+            "game_id",
+            "bookmaker",
+            "captured_at",
+        ),
+    )
+
+    id: Mapped[UUID] = mapped_column(Uuid, primary_key=True, default=uuid4)
+    game_id: Mapped[UUID] = mapped_column(ForeignKey("games.id"), nullable=False)
+    captured_at: Mapped[datetime] = mapped_column(TZDateTime, nullable=False)
+    bookmaker: Mapped[str] = mapped_column(String(50), nullable=False)
+
+    # Run-length: last sync that observed these lines and how many did
+    last_seen_at: Mapped[datetime] = mapped_column(TZDateTime, nullable=False)
+    sample_count: Mapped[int] = mapped_column(Integer, nullable=False, default=1)
+
+    home_moneyline: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    away_moneyline: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+
+    home_spread: Mapped[Optional[Decimal]] = mapped_column(Numeric(4, 1), nullable=True)
+    home_spread_odds: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    away_spread: Mapped[Optional[Decimal]] = mapped_column(Numeric(4, 1), nullable=True)
+    away_spread_odds: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+
+    total_points: Mapped[Optional[Decimal]] = mapped_column(
+        Numeric(5, 1), nullable=True
+    )
+    over_odds: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    under_odds: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+
+    def has_lines(self, lines: Dict[str, Any]) -> bool:
+        """Check if this run already holds the given line values."""
+        return all(getattr(self, column) == lines[column] for column in LINE_COLUMNS)
+
+    def __repr__(self):
+        return f"<OddsSnapshot(game_id={self.game_id}, bookmaker={self.bookmaker}, {self.captured_at})>"
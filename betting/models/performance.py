@@ -0,0 +1,136 @@
+from datetime import datetime
+from decimal import Decimal
+from typing import Optional
+from uuid import UUID
+from sqlalchemy import Enum, Float, ForeignKey, Integer, Numeric, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from betting.models.enums import PerformanceDimension
+from .types import TZDateTime
+
+from .base import Base
+
+
+class UserPerformance(Base):
+    """Running betting performance of one user, updated as bets settle.
+
+    Each settled bet's return, (payout - stake) / stake, feeds Welford's
+    streaming mean and variance (return_mean, return_m2), from which the
+    Sharpe ratio is read. Net profit is tracked against its running peak
+    for the max drawdown. Bets are applied in (settled_at, id) order, which
+    a full recompute replays to get the same figures.
+
+    These are also the analytics spec's UserBettingStats: totals here,
+    records by bet type in UserPerformanceBucket, and win/loss streaks.
+    """
+
+    __tablename__ = "user_performance"
+
+    user_id: Mapped[UUID] = mapped_column(ForeignKey("users.id"), primary_key=True)
+
+    settled_bets: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    won: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    lost: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    push: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    total_staked: Mapped[Decimal] = mapped_column(
+        Numeric(12, 2), nullable=False, default=Decimal("0")
+    )
+    total_returned: Mapped[Decimal] = mapped_column(
+        Numeric(12, 2), nullable=False, default=Decimal("0")
+    )
+
+    return_mean: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    # Sum of squared deviations from the mean; variance is m2 / (n - 1)
+    return_m2: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+
+    net_profit: Mapped[Decimal] = mapped_column(
+        Numeric(12, 2), nullable=False, default=Decimal("0")
+    )
+    peak_profit: Mapped[Decimal] = mapped_column(
+        Numeric(12, 2), nullable=False, default=Decimal("0")
+    )
+    max_drawdown: Mapped[Decimal] = mapped_column(
+        Numeric(12, 2), nullable=False, default=Decimal("0")
+    )
+
+    # Positive for consecutive wins, negative for losses; pushes don't count
+    current_streak: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    longest_win_streak: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    longest_loss_streak: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    last_settled_at: Mapped[Optional[datetime]] = mapped_column(
+        TZDateTime, nullable=True
+    )
+
+    def __repr__(self):
+        return (
+            f"<UserPerformance(user_id={self.user_id}, "
+            f"bets={self.settled_bets}, net={self.net_profit})>"
+        )
+
+
+class UserPerformanceBucket(Base):
+    """Totals of one user's settled bets of one bet type or settled in one month."""
+
+    __tablename__ = "user_performance_buckets"
+
+    user_id: Mapped[UUID] = mapped_column(ForeignKey("users.id"), primary_key=True)
+    dimension: Mapped[PerformanceDimension] = mapped_column(
+        Enum(PerformanceDimension), primary_key=True
+    )
+    # Bet type value ("spread") or month ("2026-01")
+    key: Mapped[str] = mapped_column(String(20), primary_key=True)
+
+    bets: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    won: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    lost: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    push: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    total_staked: Mapped[Decimal] = mapped_column(
+        Numeric(12, 2), nullable=False, default=Decimal("0")
+    )
+    total_returned: Mapped[Decimal] = mapped_column(
+        Numeric(12, 2), nullable=False, default=Decimal("0")
+    )
+
+    def __repr__(self):
+        return (
+            f"<UserPerformanceBucket(user_id={self.user_id}, "
+            f"{self.dimension.value}={self.key}, bets={self.bets})>"
+        )
+
+
+class UserTeamStats(Base):
+    """One user's moneyline and spread results backing or opposing one team.
+
+    A bet on the home team counts as a bet for the home team and against
+    the away team, with the same outcome and P/L on both rows. Totals bets
+    don't involve a side and aren't counted. Pushes are the bets neither
+    won nor lost.
+    """
+
+    __tablename__ = "user_team_stats"
+
+    user_id: Mapped[UUID] = mapped_column(ForeignKey("users.id"), primary_key=True)
+    team_name: Mapped[str] = mapped_column(String(100), primary_key=True)
+
+    bets_for: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    wins_for: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    losses_for: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    pnl_for: Mapped[Decimal] = mapped_column(
+        Numeric(12, 2), nullable=False, default=Decimal("0")
+    )
+
+    bets_against: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    wins_against: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    losses_against: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    pnl_against: Mapped[Decimal] = mapped_column(
+        Numeric(12, 2), nullable=False, default=Decimal("0")
+    )
+
+    def __repr__(self):
+        return (
+            f"<UserTeamStats(user_id={self.user_id}, team={self.team_name}, "
+            f"for={self.wins_for}-{self.losses_for})>"
+        )
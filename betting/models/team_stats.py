@@ -0,0 +1,83 @@
+from datetime import datetime
+from sqlalchemy import Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .types import TZDateTime
+
+from .base import Base
+
+# Games kept in the recent_* windows and counted by the last10_* columns
+RECENT_GAMES = 10
+
+
+class TeamStats(Base):
+    """One team's straight-up, against-the-spread and totals records in a season.
+
+    Built by TeamStatsService from completed games in commence order. The
+    recent_* columns hold the last RECENT_GAMES results, oldest first, as
+    one letter per game (W/L/P, or O/U/P for totals), so newly completed
+    games can be folded in without rereading the season. ATS and totals
+    columns only count games that had a spread or total line.
+    """
+
+    __tablename__ = "team_stats"
+
+    team_name: Mapped[str] = mapped_column(String(100), primary_key=True)
+    # NBA season label, e.g. "2025-26"
+    season: Mapped[str] = mapped_column(String(7), primary_key=True)
+
+    # Straight up
+    wins: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    losses: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    home_wins: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    home_losses: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    away_wins: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    away_losses: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    # Against the spread; favorite and underdog by the team's spread sign
+    ats_wins: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    ats_losses: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    ats_pushes: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    ats_wins_home: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    ats_losses_home: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    ats_wins_away: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    ats_losses_away: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    ats_wins_as_favorite: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0
+    )
+    ats_losses_as_favorite: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0
+    )
+    ats_wins_as_underdog: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0
+    )
+    ats_losses_as_underdog: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0
+    )
+
+    # Over/under
+    overs: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    unders: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    ou_pushes: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    # Recent form
+    last10_wins: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    last10_losses: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    last10_ats_wins: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    last10_ats_losses: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    last10_overs: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    last10_unders: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    recent_su: Mapped[str] = mapped_column(String(10), nullable=False, default="")
+    recent_ats: Mapped[str] = mapped_column(String(10), nullable=False, default="")
+    recent_ou: Mapped[str] = mapped_column(String(10), nullable=False, default="")
+    # Straight up; positive for consecutive wins, negative for losses
+    current_streak: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    # Commence time of the latest game counted, the incremental refresh mark
+    last_game_at: Mapped[datetime] = mapped_column(TZDateTime, nullable=False)
+
+    def __repr__(self):
+        return (
+            f"<TeamStats({self.team_name} {self.season}, "
+            f"{self.wins}-{self.losses}, ATS {self.ats_wins}-{self.ats_losses})>"
+        )
@@ -2,15 +2,30 @@ from datetime import datetime, timezone
 from sqlalchemy import DateTime, TypeDecorator
 
 
+def as_utc(value: datetime) -> datetime:
+    """The same instant in UTC, taking naive values as UTC."""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
 class TZDateTime(TypeDecorator):
     """A DateTime type that ensures timezone-aware datetimes.
 
     PostgreSQL returns timezone-aware datetimes natively.
     SQLite returns naive datetimes - this normalizes them to UTC.
+
+    Bound values are converted to UTC (naive values are taken as UTC) so that
+    SQLite, which compares the stored text, orders and filters correctly.
     """
     impl = DateTime(timezone=True)
     cache_ok = True
 
+    def process_bind_param(self, value, dialect):
+        if value is not None:
+            return as_utc(value)
+        return value
+
     def process_result_value(self, value, dialect):
         if value is not None and value.tzinfo is None:
             return value.replace(tzinfo=timezone.utc)
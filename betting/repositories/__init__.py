@@ -1,9 +1,17 @@
 from .game_repository import GameRepository
 from .bet_repository import BetRepository
 from .user_repository import UserRepository
+from .odds_snapshot_repository import OddsSnapshotRepository
+from .job_repository import JobRepository
+from .performance_repository import PerformanceRepository
+from .team_stats_repository import TeamStatsRepository
 
 __all__ = [
     "GameRepository",
     "BetRepository",
     "UserRepository",
+    "OddsSnapshotRepository",
+    "JobRepository",
+    "PerformanceRepository",
+    "TeamStatsRepository",
 ]
@@ -1,6 +1,83 @@
-from typing import List
+from datetime import datetime
+from typing import Iterator, List, Optional, Sequence, Tuple
+from uuid import UUID
+from sqlalchemy import select, tuple_
+from sqlalchemy.engine import Row
 from sqlalchemy.orm import Session
-from betting.models import Bet, BetStatus
+from betting.models import Bet, BetStatus, BetType, Game
+from betting.models.odds_snapshot import LINE_COLUMNS
+
+# Columns projected by the history read path: BetResponse fields, including
+# the teams from the joined game, plus the created_at half of the pagination
+# key. Table columns rather than ORM attributes keep the select off ORM
+# loading.
+BET_VIEW_COLUMNS = (
+    *(
+        Bet.__table__.c[name]
+        for name in (
+            "id",
+            "user_id",
+            "game_id",
+            "bet_type",
+            "selection",
+            "odds",
+            "stake",
+            "potential_payout",
+            "status",
+            "settled_at",
+            "created_at",
+        )
+    ),
+    Game.__table__.c.home_team,
+    Game.__table__.c.away_team,
+)
+
+# Columns of a bulk export row: the bet, then the game it was placed on with
+# its latest lines and final score
+BET_EXPORT_COLUMNS = (
+    Bet.__table__.c.id.label("bet_id"),
+    *(
+        Bet.__table__.c[name]
+        for name in (
+            "user_id",
+            "game_id",
+            "bet_type",
+            "selection",
+            "odds",
+            "stake",
+            "potential_payout",
+            "status",
+            "created_at",
+            "settled_at",
+        )
+    ),
+    Game.__table__.c.home_team,
+    Game.__table__.c.away_team,
+    Game.__table__.c.commence_time,
+    Game.__table__.c.status.label("game_status"),
+    *(Game.__table__.c[name] for name in LINE_COLUMNS),
+    Game.__table__.c.home_score,
+    Game.__table__.c.away_score,
+)
+
+# Columns replayed to rebuild performance stats, see stream_settled_bets
+SETTLED_BET_COLUMNS = (
+    *(
+        Bet.__table__.c[name]
+        for name in (
+            "id",
+            "user_id",
+            "bet_type",
+            "selection",
+            "status",
+            "stake",
+            "potential_payout",
+            "settled_at",
+        )
+    ),
+    Game.__table__.c.home_team,
+    Game.__table__.c.away_team,
+)
 
 
 class BetRepository:
@@ -26,6 +103,116 @@ class BetRepository:
             .all()
         )
 
+    def find_view_by_id(self, bet_id) -> Optional[Row]:
+        """One bet as a BET_VIEW_COLUMNS row, e.g. to answer the request that
+        placed it."""
+        return self.session.execute(
+            select(*BET_VIEW_COLUMNS)
+            .join_from(Bet, Game, Bet.game_id == Game.id)
+            .where(Bet.id == bet_id)
+        ).one_or_none()
+
+    def find_bet_history_page(
+        self,
+        user_id,
+        limit: int = 50,
+        before: Optional[Tuple[datetime, UUID]] = None,
+        status: Optional[BetStatus] = None,
+        bet_type: Optional[BetType] = None,
+        created_from: Optional[datetime] = None,
+        created_to: Optional[datetime] = None,
+    ) -> List[Row]:
+        """
+        Keyset-paginated bet history, newest first, ordered by (created_at, id).
+
+        Seeks past `before` (the last row of the previous page) on the
+        (user_id, created_at, id) index, so every page costs the same.
+
+        Returns read-only rows of BET_VIEW_COLUMNS rather than tracked Bet
+        objects.
+        """
+        query = (
+            select(*BET_VIEW_COLUMNS)
+            .join_from(Bet, Game, Bet.game_id == Game.id)
+            .where(Bet.user_id == user_id)
+        )
+
+        if status:
+            query = query.where(Bet.status == status)
+        if bet_type:
+            query = query.where(Bet.bet_type == bet_type)
+        if created_from:
+            query = query.where(Bet.created_at >= created_from)
+        if created_to:
+            query = query.where(Bet.created_at < created_to)
+        if before:
+            query = query.where(tuple_(Bet.created_at, Bet.id) < tuple_(*before))
+
+        query = query.order_by(Bet.created_at.desc(), Bet.id.desc()).limit(limit)
+        return self.session.execute(query).all()
+
+    def stream_bet_export(
+        self,
+        user_id: Optional[UUID] = None,
+        batch_size: int = 1000,
+        status: Optional[BetStatus] = None,
+        bet_type: Optional[BetType] = None,
+        created_from: Optional[datetime] = None,
+        created_to: Optional[datetime] = None,
+    ) -> Iterator[Sequence[Row]]:
+        """
+        Every bet (for `user_id`, or all users) joined to its game, oldest
+        first, as batches of BET_EXPORT_COLUMNS rows.
+
+        Rows come from a server-side cursor `batch_size` at a time, so memory
+        stays flat however long the history is. The session must stay open
+        until the iterator is exhausted.
+        """
+        query = select(*BET_EXPORT_COLUMNS).join(Game, Bet.game_id == Game.id)
+
+        if user_id:
+            query = query.where(Bet.user_id == user_id)
+        if status:
+            query = query.where(Bet.status == status)
+        if bet_type:
+            query = query.where(Bet.bet_type == bet_type)
+        if created_from:
+            query = query.where(Bet.created_at >= created_from)
+        if created_to:
+            query = query.where(Bet.created_at < created_to)
+
+        query = query.order_by(Bet.created_at, Bet.id).execution_options(
+            yield_per=batch_size
+        )
+        yield from self.session.execute(query).partitions()
+
+    def stream_settled_bets(
+        self, user_id: Optional[UUID] = None, batch_size: int = 1000
+    ) -> Iterator[Sequence[Row]]:
+        """
+        Settled bets (for `user_id`, or all users) with their game's teams,
+        as batches of SETTLED_BET_COLUMNS rows.
+
+        Ordered by user, then in settlement order (settled_at, id), so each
+        user's bets arrive together and in the order they were applied.
+        """
+        query = (
+            select(*SETTLED_BET_COLUMNS)
+            .join(Game, Bet.game_id == Game.id)
+            .where(Bet.status != BetStatus.PENDING)
+        )
+        if user_id:
+            query = query.where(Bet.user_id == user_id)
+
+        query = query.order_by(Bet.user_id, Bet.settled_at, Bet.id).execution_options(
+            yield_per=batch_size
+        )
+        yield from self.session.execute(query).partitions()
+
+    def find_user_ids_with_settled_bets(self) -> List[UUID]:
+        query = select(Bet.user_id).where(Bet.status != BetStatus.PENDING).distinct()
+        return list(self.session.scalars(query))
+
     def find_pending_bets_by_game(self, game_id) -> List[Bet]:
         return (
             self.session.query(Bet)
@@ -33,6 +220,15 @@ class BetRepository:
             .all()
         )
 
+    def find_pending_bets_by_games(self, game_ids) -> List[Bet]:
+        if not game_ids:
+            return []
+        return (
+            self.session.query(Bet)
+            .filter(Bet.game_id.in_(game_ids), Bet.status == BetStatus.PENDING)
+            .all()
+        )
+
     def save(self, bet: Bet) -> Bet:
         self.session.add(bet)
         return bet
@@ -1,8 +1,50 @@
-from typing import List, Optional
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+from uuid import UUID
+from sqlalchemy.engine import Row
 from sqlalchemy.orm import Session
-from sqlalchemy import exists
+from sqlalchemy import and_, exists, func, or_, select, tuple_, update
 from betting.models import Game, GameStatus, Bet, BetStatus
 
+# Columns projected by the listing read path, one per GameResponse field.
+# Table columns rather than ORM attributes keep the select off ORM loading.
+GAME_VIEW_COLUMNS = tuple(
+    Game.__table__.c[name]
+    for name in (
+        "id",
+        "external_id",
+        "home_team",
+        "away_team",
+        "commence_time",
+        "status",
+        "home_moneyline",
+        "away_moneyline",
+        "home_spread",
+        "home_spread_odds",
+        "away_spread",
+        "away_spread_odds",
+        "total_points",
+        "over_odds",
+        "under_odds",
+        "home_score",
+        "away_score",
+    )
+)
+
+# A game is only listed once every betting line is available
+HAS_ALL_LINES = and_(
+    Game.home_moneyline.isnot(None),
+    Game.away_moneyline.isnot(None),
+    Game.home_spread.isnot(None),
+    Game.away_spread.isnot(None),
+    Game.total_points.isnot(None),
+)
+
+
+def escape_like(value: str) -> str:
+    """Escape LIKE wildcards so user input matches literally, with \\ as escape."""
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
 
 class GameRepository:
     def __init__(self, session: Session):
@@ -14,12 +56,94 @@ class GameRepository:
     def find_by_external_id(self, external_id: str) -> Optional[Game]:
         return self.session.query(Game).filter_by(external_id=external_id).first()
 
+    def find_by_external_ids(self, external_ids) -> List[Game]:
+        if not external_ids:
+            return []
+        return self.session.query(Game).filter(Game.external_id.in_(external_ids)).all()
+
     def find_all(self) -> List[Game]:
         return self.session.query(Game).all()
 
     def find_by_status(self, status: GameStatus) -> List[Game]:
         return self.session.query(Game).filter_by(status=status).all()
 
+    def find_games_with_lines(
+        self,
+        status: Optional[GameStatus] = None,
+        commence_from: Optional[datetime] = None,
+        commence_to: Optional[datetime] = None,
+        team: Optional[str] = None,
+        after: Optional[Tuple[datetime, UUID]] = None,
+        limit: int = 200,
+    ) -> List[Row]:
+        """
+        Games with complete lines in a commence_time window, oldest first.
+
+        Paginates by seeking past `after` (the last row of the previous page)
+        on (commence_time, id).
+
+        Returns read-only rows of GAME_VIEW_COLUMNS rather than tracked Game
+        objects, skipping identity-map and change-tracking overhead.
+        """
+        query = select(*GAME_VIEW_COLUMNS).where(HAS_ALL_LINES)
+
+        if status:
+            query = query.where(Game.status == status)
+        if commence_from:
+            query = query.where(Game.commence_time >= commence_from)
+        if commence_to:
+            query = query.where(Game.commence_time < commence_to)
+        if team:
+            pattern = f"%{escape_like(team)}%"
+            query = query.where(
+                or_(
+                    Game.home_team.ilike(pattern, escape="\\"),
+                    Game.away_team.ilike(pattern, escape="\\"),
+                )
+            )
+        if after:
+            query = query.where(tuple_(Game.commence_time, Game.id) > tuple_(*after))
+
+        query = query.order_by(Game.commence_time, Game.id).limit(limit)
+        return self.session.execute(query).all()
+
+    def stream_completed_games(
+        self,
+        commence_from: Optional[datetime] = None,
+        commence_to: Optional[datetime] = None,
+        batch_size: int = 10_000,
+        commence_after: Optional[datetime] = None,
+    ) -> Iterator[Sequence[Row]]:
+        """
+        Completed games in commence order as batches of GAME_VIEW_COLUMNS
+        rows, read through a server-side cursor.
+        """
+        query = select(*GAME_VIEW_COLUMNS).where(Game.status == GameStatus.COMPLETED)
+        if commence_from:
+            query = query.where(Game.commence_time >= commence_from)
+        if commence_after:
+            query = query.where(Game.commence_time > commence_after)
+        if commence_to:
+            query = query.where(Game.commence_time < commence_to)
+
+        query = query.order_by(Game.commence_time, Game.id).execution_options(
+            yield_per=batch_size
+        )
+        yield from self.session.execute(query).partitions()
+
+    def has_completed_games_updated_since(
+        self, updated_after: datetime, commence_to: datetime
+    ) -> bool:
+        """Whether a game commencing by commence_to was completed or rescored
+        after updated_after."""
+        return self.session.query(
+            exists().where(
+                Game.status == GameStatus.COMPLETED,
+                Game.commence_time <= commence_to,
+                Game.updated_at > updated_after,
+            )
+        ).scalar()
+
     def find_games_with_pending_bets(self, status: GameStatus) -> List[Game]:
         return (
             self.session.query(Game)
@@ -37,6 +161,51 @@ class GameRepository:
             self.session.query(Game).filter(Game.status != GameStatus.COMPLETED).all()
         )
 
+    def has_unfinished_games(self) -> bool:
+        return self.session.query(
+            exists().where(Game.status != GameStatus.COMPLETED)
+        ).scalar()
+
+    def find_unfinished_by_external_ids(self, external_ids) -> List[Game]:
+        if not external_ids:
+            return []
+        return (
+            self.session.query(Game)
+            .filter(
+                Game.external_id.in_(external_ids),
+                Game.status != GameStatus.COMPLETED,
+            )
+            .all()
+        )
+
+    def find_next_commence_time(self) -> Optional[datetime]:
+        return (
+            self.session.query(func.min(Game.commence_time))
+            .filter(Game.status == GameStatus.UPCOMING)
+            .scalar()
+        )
+
+    def mark_started_games(self, as_of: datetime) -> List[UUID]:
+        """
+        Move every upcoming game that commenced by as_of to IN_PROGRESS.
+
+        Returns:
+            Ids of the games that were started
+        """
+        result = self.session.execute(
+            update(Game)
+            .where(Game.status == GameStatus.UPCOMING, Game.commence_time <= as_of)
+            .values(status=GameStatus.IN_PROGRESS)
+            .returning(Game.id),
+            execution_options={"synchronize_session": "fetch"},
+        )
+        return list(result.scalars())
+
+    def update_all(self, rows: List[Dict[str, Any]]) -> None:
+        """Apply per-game column updates, keyed by id, in one batched UPDATE."""
+        if rows:
+            self.session.execute(update(Game), rows)
+
     def save(self, game: Game) -> Game:
         self.session.add(game)
         return game
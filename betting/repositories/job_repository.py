@@ -0,0 +1,87 @@
+from datetime import datetime, timezone
+from typing import Collection, Optional
+from uuid import UUID
+from sqlalchemy import update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from betting.models import Job, JobStatus, JobType
+
+ACTIVE_STATUSES = (JobStatus.QUEUED, JobStatus.RUNNING)
+
+
+class JobRepository:
+    def __init__(self, session: Session):
+        self.session = session
+
+    def find_by_id(self, job_id) -> Optional[Job]:
+        return self.session.query(Job).filter_by(id=job_id).first()
+
+    def find_active(self, job_type: JobType) -> Optional[Job]:
+        return (
+            self.session.query(Job)
+            .filter(Job.job_type == job_type, Job.status.in_(ACTIVE_STATUSES))
+            .first()
+        )
+
+    def create_unless_active(self, job_type: JobType) -> tuple[Job, bool]:
+        """
+        Queue a job of this type, or return the one already queued or running.
+
+        The active-job unique index settles races between instances: the
+        losing insert fails and the winner's job is returned instead.
+
+        Returns:
+            (job, created)
+        """
+        active = self.find_active(job_type)
+        if active:
+            return active, False
+
+        job = Job(job_type=job_type, status=JobStatus.QUEUED)
+        try:
+            with self.session.begin_nested():
+                self.session.add(job)
+        except IntegrityError:
+            return self.find_active(job_type), False
+        return job, True
+
+    def update(self, job_id, **values) -> bool:
+        """
+        Set columns on one job while it is queued or running; updated_at is
+        bumped as its heartbeat. A job already finished, e.g. failed as
+        abandoned, is left as it is.
+
+        Returns:
+            Whether the job was still active
+        """
+        result = self.session.execute(
+            update(Job)
+            .where(Job.id == job_id, Job.status.in_(ACTIVE_STATUSES))
+            .values(**values)
+        )
+        return result.rowcount > 0
+
+    def fail_stale(
+        self, heartbeat_before: datetime, exclude: Collection[UUID] = ()
+    ) -> int:
+        """
+        Fail active jobs whose worker stopped reporting, releasing the lock.
+        Jobs in `exclude` (known to be running) are left alone.
+        """
+        result = self.session.execute(
+            update(Job)
+            .where(
+                Job.status.in_(ACTIVE_STATUSES),
+                Job.updated_at < heartbeat_before,
+                Job.id.not_in(exclude),
+            )
+            .values(
+                status=JobStatus.FAILED,
+                finished_at=datetime.now(timezone.utc),
+                error="Abandoned: no heartbeat from worker",
+            )
+        )
+        return result.rowcount
+
+    def commit(self):
+        self.session.commit()
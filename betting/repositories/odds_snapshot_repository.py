@@ -0,0 +1,159 @@
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+from uuid import UUID
+from sqlalchemy import and_, delete, exists, func, insert, select
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session, aliased
+from betting.models import Game, GameStatus, OddsSnapshot
+
+# Snapshot runs plus the game's start time, which places each run relative
+# to tip-off and in its season/date partition
+COMPLETED_RUN_COLUMNS = (
+    *OddsSnapshot.__table__.c,
+    Game.__table__.c.commence_time,
+)
+
+
+class OddsSnapshotRepository:
+    def __init__(self, session: Session):
+        self.session = session
+
+    def find_by_game(
+        self, game_id, bookmaker: Optional[str] = None
+    ) -> List[OddsSnapshot]:
+        query = self.session.query(OddsSnapshot).filter_by(game_id=game_id)
+        if bookmaker:
+            query = query.filter_by(bookmaker=bookmaker)
+        return query.order_by(OddsSnapshot.captured_at).all()
+
+    def find_as_of(
+        self, game_id, bookmaker: str, at: datetime
+    ) -> Optional[OddsSnapshot]:
+        """Return the run in effect at a point in time (index seek, O(log n))."""
+        return (
+            self.session.query(OddsSnapshot)
+            .filter(
+                OddsSnapshot.game_id == game_id,
+                OddsSnapshot.bookmaker == bookmaker,
+                OddsSnapshot.captured_at <= at,
+            )
+            .order_by(OddsSnapshot.captured_at.desc())
+            .first()
+        )
+
+    def find_runs_between(
+        self, game_id, bookmaker: str, start: datetime, end: datetime
+    ) -> List[OddsSnapshot]:
+        """Return the run in effect at start plus every run that begins by end."""
+        opening = self.find_as_of(game_id, bookmaker, start)
+        runs = (
+            self.session.query(OddsSnapshot)
+            .filter(
+                OddsSnapshot.game_id == game_id,
+                OddsSnapshot.bookmaker == bookmaker,
+                OddsSnapshot.captured_at > start,
+                OddsSnapshot.captured_at <= end,
+            )
+            .order_by(OddsSnapshot.captured_at)
+            .all()
+        )
+        return ([opening] if opening else []) + runs
+
+    def stream_completed_game_runs(
+        self,
+        commence_from: Optional[datetime] = None,
+        commence_to: Optional[datetime] = None,
+        batch_size: int = 10_000,
+    ) -> Iterator[Sequence[Row]]:
+        """
+        Every snapshot run for completed games, ordered by game start then
+        capture time, as batches of COMPLETED_RUN_COLUMNS rows read through a
+        server-side cursor.
+        """
+        query = (
+            select(*COMPLETED_RUN_COLUMNS)
+            .join(Game, OddsSnapshot.game_id == Game.id)
+            .where(Game.status == GameStatus.COMPLETED)
+        )
+        if commence_from:
+            query = query.where(Game.commence_time >= commence_from)
+        if commence_to:
+            query = query.where(Game.commence_time < commence_to)
+
+        query = query.order_by(
+            Game.commence_time, OddsSnapshot.game_id, OddsSnapshot.captured_at
+        ).execution_options(yield_per=batch_size)
+        yield from self.session.execute(query).partitions()
+
+    def find_latest_runs(self, game_ids) -> Dict[Tuple[UUID, str], OddsSnapshot]:
+        """Return the current run per (game_id, bookmaker) for many games at once."""
+        if not game_ids:
+            return {}
+
+        latest = (
+            select(
+                OddsSnapshot.game_id,
+                OddsSnapshot.bookmaker,
+                func.max(OddsSnapshot.captured_at).label("captured_at"),
+            )
+            .where(OddsSnapshot.game_id.in_(game_ids))
+            .group_by(OddsSnapshot.game_id, OddsSnapshot.bookmaker)
+            .subquery()
+        )
+        runs = (
+            self.session.query(OddsSnapshot)
+            .join(
+                latest,
+                and_(
+                    OddsSnapshot.game_id == latest.c.game_id,
+                    OddsSnapshot.bookmaker == latest.c.bookmaker,
+                    OddsSnapshot.captured_at == latest.c.captured_at,
+                ),
+            )
+            .all()
+        )
+        return {(run.game_id, run.bookmaker): run for run in runs}
+
+    def save_all(self, rows: List[Dict[str, Any]]) -> int:
+        """Insert many new runs in a single batched INSERT."""
+        if not rows:
+            return 0
+        self.session.execute(insert(OddsSnapshot), rows)
+        return len(rows)
+
+    def prune(self, commenced_before: datetime) -> int:
+        """
+        Thin out history for games that started before the cutoff.
+
+        Only the opening and closing snapshot per (game, bookmaker) are kept,
+        so old games retain their line movement endpoints for backtesting
+        while intermediate rows are reclaimed.
+
+        Returns:
+            Number of snapshots deleted
+        """
+        earlier = aliased(OddsSnapshot)
+        later = aliased(OddsSnapshot)
+
+        stmt = delete(OddsSnapshot).where(
+            OddsSnapshot.game_id.in_(
+                select(Game.id).where(Game.commence_time < commenced_before)
+            ),
+            exists().where(
+                earlier.game_id == OddsSnapshot.game_id,
+                earlier.bookmaker == OddsSnapshot.bookmaker,
+                earlier.captured_at < OddsSnapshot.captured_at,
+            ),
+            exists().where(
+                later.game_id == OddsSnapshot.game_id,
+                later.bookmaker == OddsSnapshot.bookmaker,
+                later.captured_at > OddsSnapshot.captured_at,
+            ),
+        )
+        result = self.session.execute(
+            stmt, execution_options={"synchronize_session": False}
+        )
+        return result.rowcount
+
+    def commit(self):
+        self.session.commit()
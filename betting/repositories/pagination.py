@@ -0,0 +1,28 @@
+"""Opaque keyset cursors for (timestamp, id) ordered listings."""
+
+import base64
+from datetime import datetime
+from typing import Tuple
+from uuid import UUID
+
+
+def encode_cursor(timestamp: datetime, row_id: UUID) -> str:
+    """Encode the sort key of the last row on a page as an opaque cursor."""
+    raw = f"{timestamp.isoformat()}|{row_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    """
+    Decode a cursor produced by encode_cursor.
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = base64.urlsafe_b64decode(padded.encode()).decode()
+        timestamp, row_id = raw.split("|")
+        return datetime.fromisoformat(timestamp), UUID(row_id)
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
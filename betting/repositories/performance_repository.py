@@ -0,0 +1,125 @@
+from collections import defaultdict
+from typing import Collection, Iterable, List, Optional, Tuple
+from sqlalchemy import delete, insert, inspect, tuple_
+from sqlalchemy.orm import Session
+from betting.models import (
+    PerformanceDimension,
+    UserPerformance,
+    UserPerformanceBucket,
+    UserTeamStats,
+)
+
+PERFORMANCE_MODELS = (UserPerformance, UserPerformanceBucket, UserTeamStats)
+
+
+class PerformanceRepository:
+    def __init__(self, session: Session):
+        self.session = session
+
+    def find_by_user(self, user_id) -> Optional[UserPerformance]:
+        return self.session.get(UserPerformance, user_id)
+
+    def find_by_users(self, user_ids) -> List[UserPerformance]:
+        if not user_ids:
+            return []
+        return (
+            self.session.query(UserPerformance)
+            .filter(UserPerformance.user_id.in_(user_ids))
+            .all()
+        )
+
+    def find_buckets_by_user(self, user_id) -> List[UserPerformanceBucket]:
+        return (
+            self.session.query(UserPerformanceBucket)
+            .filter_by(user_id=user_id)
+            .order_by(UserPerformanceBucket.dimension, UserPerformanceBucket.key)
+            .all()
+        )
+
+    def find_buckets(
+        self, user_ids, keys: Collection[Tuple[PerformanceDimension, str]]
+    ) -> List[UserPerformanceBucket]:
+        """The given (dimension, key) buckets of each user, where they exist."""
+        if not user_ids or not keys:
+            return []
+        return (
+            self.session.query(UserPerformanceBucket)
+            .filter(
+                UserPerformanceBucket.user_id.in_(user_ids),
+                tuple_(UserPerformanceBucket.dimension, UserPerformanceBucket.key).in_(
+                    list(keys)
+                ),
+            )
+            .all()
+        )
+
+    def find_team_stats_by_user(self, user_id) -> List[UserTeamStats]:
+        return (
+            self.session.query(UserTeamStats)
+            .filter_by(user_id=user_id)
+            .order_by(UserTeamStats.team_name)
+            .all()
+        )
+
+    def find_team_stats(self, user_ids, team_names) -> List[UserTeamStats]:
+        """Each user's stats for the given teams, where they exist."""
+        if not user_ids or not team_names:
+            return []
+        return (
+            self.session.query(UserTeamStats)
+            .filter(
+                UserTeamStats.user_id.in_(user_ids),
+                UserTeamStats.team_name.in_(list(team_names)),
+            )
+            .all()
+        )
+
+    def find_top_teams(
+        self, user_id, limit: int, best: bool = True
+    ) -> List[UserTeamStats]:
+        """Teams the user has made (best) or lost (worst) the most backing."""
+        query = self.session.query(UserTeamStats).filter_by(user_id=user_id)
+        if best:
+            query = query.filter(UserTeamStats.pnl_for > 0).order_by(
+                UserTeamStats.pnl_for.desc(), UserTeamStats.team_name
+            )
+        else:
+            query = query.filter(UserTeamStats.pnl_for < 0).order_by(
+                UserTeamStats.pnl_for, UserTeamStats.team_name
+            )
+        return query.limit(limit).all()
+
+    def delete_by_user(self, user_id):
+        for model in PERFORMANCE_MODELS[::-1]:
+            self.session.execute(delete(model).where(model.user_id == user_id))
+
+    def delete_all(self):
+        for model in PERFORMANCE_MODELS[::-1]:
+            self.session.execute(delete(model))
+
+    def save_all(self, rows: Iterable) -> None:
+        self.session.add_all(rows)
+
+    def insert_all(self, rows: Iterable) -> int:
+        """
+        Insert new rows with one batched INSERT per table.
+
+        The rows are read, not added to the session, so a backfill's memory
+        doesn't grow with the number of users.
+        """
+        values = defaultdict(list)
+        for row in rows:
+            values[type(row)].append(
+                {
+                    attr.key: getattr(row, attr.key)
+                    for attr in inspect(type(row)).column_attrs
+                    # Unset columns take their defaults (created_at, updated_at)
+                    if getattr(row, attr.key) is not None
+                }
+            )
+        for model, model_values in values.items():
+            self.session.execute(insert(model), model_values)
+        return sum(len(v) for v in values.values())
+
+    def commit(self):
+        self.session.commit()
@@ -0,0 +1,72 @@
+from datetime import datetime
+from typing import Collection, Dict, List, Optional, Sequence, Tuple
+from sqlalchemy import func, select, tuple_
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session
+from betting.models import TeamStats
+
+# Everything a refresh reads back and writes; timestamps are left to defaults
+TEAM_STATS_COLUMNS = tuple(
+    column
+    for column in TeamStats.__table__.c
+    if column.name not in ("created_at", "updated_at")
+)
+
+# INSERT ... ON CONFLICT DO UPDATE for each supported database
+UPSERT_INSERTS = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+
+
+class TeamStatsRepository:
+    def __init__(self, session: Session):
+        self.session = session
+
+    def find_by_season(self, season: str) -> Sequence[Row]:
+        """Every team's row for the season as read-only rows, by team name."""
+        return self.session.execute(
+            select(TeamStats.__table__)
+            .where(TeamStats.season == season)
+            .order_by(TeamStats.team_name)
+        ).all()
+
+    def find_by_keys(self, keys: Collection[Tuple[str, str]]) -> List[Dict]:
+        """TEAM_STATS_COLUMNS of the given (team_name, season) rows as dicts."""
+        if not keys:
+            return []
+        rows = self.session.execute(
+            select(*TEAM_STATS_COLUMNS).where(
+                tuple_(TeamStats.team_name, TeamStats.season).in_(list(keys))
+            )
+        )
+        return [row._asdict() for row in rows]
+
+    def find_watermark(self) -> Tuple[Optional[datetime], Optional[datetime]]:
+        """
+        (latest game counted, latest refresh) over every row, or (None, None)
+        before the first refresh.
+        """
+        return tuple(
+            self.session.execute(
+                select(func.max(TeamStats.last_game_at), func.max(TeamStats.updated_at))
+            ).one()
+        )
+
+    def upsert_all(self, rows: List[Dict]) -> int:
+        """Insert the rows, overwriting any that already exist, in one batch."""
+        if not rows:
+            return 0
+        insert = UPSERT_INSERTS[self.session.get_bind().dialect.name]
+        statement = insert(TeamStats.__table__)
+        statement = statement.on_conflict_do_update(
+            index_elements=[TeamStats.team_name, TeamStats.season],
+            set_={
+                column.name: statement.excluded[column.name]
+                for column in TeamStats.__table__.c
+                if not column.primary_key and column.name != "created_at"
+            },
+        )
+        self.session.execute(statement, rows)
+        return len(rows)
+
+    def commit(self):
+        self.session.commit()
@@ -1,5 +1,5 @@
 from decimal import Decimal
-from typing import Optional
+from typing import List, Optional
 from sqlalchemy.orm import Session
 from betting.models import User
 
@@ -11,6 +11,11 @@ class UserRepository:
     def find_by_id(self, user_id) -> Optional[User]:
         return self.session.query(User).filter_by(id=user_id).first()
 
+    def find_by_ids(self, user_ids) -> List[User]:
+        if not user_ids:
+            return []
+        return self.session.query(User).filter(User.id.in_(user_ids)).all()
+
     def find_by_username(self, username: str) -> Optional[User]:
         return self.session.query(User).filter_by(username=username).first()
 
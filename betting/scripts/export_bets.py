@@ -0,0 +1,65 @@
+"""Export bet history with game lines and scores as NDJSON or CSV."""
+
+import argparse
+import sys
+
+from betting.config import config
+from betting.database import get_database
+from betting.instrumentation import collect_query_stats
+from betting.repositories import UserRepository
+from betting.services import BetExportService, ExportFormat
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "username", nargs="?", help="Export only this user's bets (default: all)"
+    )
+    parser.add_argument(
+        "--format",
+        choices=[f.value for f in ExportFormat],
+        default=ExportFormat.NDJSON.value,
+    )
+    parser.add_argument(
+        "--output", "-o", help="File to write (default: stdout)", default=None
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=1000,
+        help="Rows fetched from the database cursor at a time",
+    )
+    args = parser.parse_args()
+
+    db = get_database(config.DATABASE_URL)
+
+    # Progress goes to stderr so stdout can carry the export itself
+    with collect_query_stats() as stats, db.get_session() as session:
+        user_id = None
+        if args.username:
+            user = UserRepository(session).find_by_username(args.username)
+            if not user:
+                print(f"✗ User '{args.username}' not found", file=sys.stderr)
+                sys.exit(1)
+            user_id = user.id
+
+        chunks = BetExportService(session, batch_size=args.batch_size).export(
+            ExportFormat(args.format), user_id=user_id
+        )
+
+        output = open(args.output, "wb") if args.output else sys.stdout.buffer
+        try:
+            written = 0
+            for chunk in chunks:
+                output.write(chunk)
+                written += len(chunk)
+        finally:
+            if args.output:
+                output.close()
+
+        print(f"✓ Wrote {written} bytes", file=sys.stderr)
+        print(f"SQL: {stats.summary()}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
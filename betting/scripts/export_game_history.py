@@ -0,0 +1,67 @@
+"""Export completed games and odds history as a partitioned Arrow or Parquet dataset."""
+
+import argparse
+import sys
+from datetime import datetime
+from pathlib import Path
+
+from betting.config import config
+from betting.database import get_database
+from betting.instrumentation import collect_query_stats
+from betting.services import GameHistoryExportService, HistoryFormat, HistoryTable
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("output_dir", type=Path, help="Empty or new directory")
+    parser.add_argument(
+        "--format",
+        choices=[f.value for f in HistoryFormat],
+        default=HistoryFormat.PARQUET.value,
+    )
+    parser.add_argument(
+        "--table",
+        choices=[t.value for t in HistoryTable],
+        action="append",
+        help="Table to export (repeatable; default: games and odds)",
+    )
+    parser.add_argument(
+        "--from",
+        dest="commence_from",
+        type=datetime.fromisoformat,
+        help="Only games starting at or after this ISO time",
+    )
+    parser.add_argument(
+        "--to",
+        dest="commence_to",
+        type=datetime.fromisoformat,
+        help="Only games starting before this ISO time",
+    )
+    args = parser.parse_args()
+
+    if args.output_dir.exists() and any(args.output_dir.iterdir()):
+        print(f"✗ {args.output_dir} is not empty", file=sys.stderr)
+        sys.exit(1)
+
+    tables = [HistoryTable(t) for t in args.table or [t.value for t in HistoryTable]]
+    export_format = HistoryFormat(args.format)
+    db = get_database(config.DATABASE_URL)
+
+    with collect_query_stats() as stats, db.get_session() as session:
+        service = GameHistoryExportService(session)
+        for table in tables:
+            # One dataset per table: output_dir/games/season=.../date=.../
+            service.write_dataset(
+                args.output_dir / table.value,
+                table,
+                export_format,
+                args.commence_from,
+                args.commence_to,
+            )
+            print(f"✓ Wrote {args.output_dir / table.value}")
+
+        print(f"SQL: {stats.summary()}")
+
+
+if __name__ == "__main__":
+    main()
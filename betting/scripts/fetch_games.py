@@ -1,6 +1,7 @@
 """Script to fetch games from The Odds API and populate the database."""
 
 from betting.database import get_database
+from betting.instrumentation import collect_query_stats
 from betting.services.game_sync_service import GameSyncService
 from betting.config import config
 
@@ -10,7 +11,7 @@ def main():
 
     db = get_database(config.DATABASE_URL)
 
-    with db.get_session() as session:
+    with collect_query_stats() as stats, db.get_session() as session:
         sync_service = GameSyncService(session)
 
         try:
@@ -20,10 +21,13 @@ def main():
             print(f"  Created: {result['created']} games")
             print(f"  Updated: {result['updated']} games")
             print(f"  Total from API: {result['total']} games")
+            print(f"  Line changes: {result['line_changes']} recorded")
 
         except Exception as e:
             print(f"\n✗ Error: {str(e)}")
             raise
+        finally:
+            print(f"\nSQL: {stats.summary()}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,38 @@
+"""Thin odds snapshots for games past the retention window to opening/closing lines."""
+
+import argparse
+from datetime import datetime, timedelta, timezone
+
+from betting.config import config
+from betting.database import get_database
+from betting.instrumentation import collect_query_stats
+from betting.repositories import OddsSnapshotRepository
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--days",
+        type=int,
+        default=config.ODDS_SNAPSHOT_RETENTION_DAYS,
+        help="Keep full history for games that commenced within this many days",
+    )
+    args = parser.parse_args()
+
+    if not args.days:
+        print("✓ Retention disabled (ODDS_SNAPSHOT_RETENTION_DAYS=0), nothing pruned")
+        return
+
+    db = get_database(config.DATABASE_URL)
+    cutoff = datetime.now(timezone.utc) - timedelta(days=args.days)
+
+    with collect_query_stats() as stats, db.get_session() as session:
+        repo = OddsSnapshotRepository(session)
+        deleted = repo.prune(commenced_before=cutoff)
+        repo.commit()
+        print(f"✓ Pruned {deleted} snapshots for games before {cutoff:%Y-%m-%d}")
+        print(f"SQL: {stats.summary()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Check or rebuild users' performance stats from their full bet history."""
+
+import argparse
+import sys
+
+from betting.config import config
+from betting.database import get_database
+from betting.instrumentation import collect_query_stats
+from betting.repositories import BetRepository, UserRepository
+from betting.services import PerformanceService
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "username", nargs="?", help="Only this user (default: every user with bets)"
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Compare stored stats with a recompute without changing them",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=1000,
+        help="Bets fetched from the database cursor at a time",
+    )
+    args = parser.parse_args()
+
+    db = get_database(config.DATABASE_URL)
+
+    with collect_query_stats() as stats, db.get_session() as session:
+        service = PerformanceService(session, batch_size=args.batch_size)
+        mismatched = 0
+
+        if args.username:
+            user = UserRepository(session).find_by_username(args.username)
+            if not user:
+                print(f"✗ User '{args.username}' not found")
+                sys.exit(1)
+            user_ids = [user.id]
+        elif args.check:
+            user_ids = BetRepository(session).find_user_ids_with_settled_bets()
+        else:
+            # One pass over every settled bet, committed as one transaction;
+            # run it while no settlement job is active
+            users = service.rebuild_all()
+            print(f"✓ Rebuilt stats for {users} users")
+            user_ids = []
+
+        for user_id in user_ids:
+            if args.check:
+                differences = service.verify(user_id)
+                if differences:
+                    mismatched += 1
+                    print(f"✗ {user_id}")
+                    for difference in differences:
+                        print(f"    {difference}")
+            else:
+                accumulator = service.rebuild(user_id)
+                print(
+                    f"✓ {user_id}: {accumulator.performance.settled_bets} settled bets"
+                )
+
+        if args.check:
+            print(f"\n{len(user_ids) - mismatched}/{len(user_ids)} users match")
+        print(f"SQL: {stats.summary()}")
+
+    if mismatched:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+"""Fold newly completed games into team_stats, or rebuild it from every game."""
+
+import argparse
+
+from betting.config import config
+from betting.database import get_database
+from betting.instrumentation import collect_query_stats
+from betting.services import TeamStatsService
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Recompute every team's records from all completed games",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=10_000,
+        help="Games fetched from the database cursor at a time",
+    )
+    args = parser.parse_args()
+
+    db = get_database(config.DATABASE_URL)
+
+    with collect_query_stats() as stats, db.get_session() as session:
+        result = TeamStatsService(session, batch_size=args.batch_size).refresh(
+            full=args.full
+        )
+        print(
+            f"✓ {result['mode'].capitalize()} refresh: "
+            f"{result['games']} games, {result['teams']} team seasons updated"
+        )
+        print(f"SQL: {stats.summary()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,6 @@
 import argparse
 from betting.database import get_database
+from betting.instrumentation import collect_query_stats
 from betting.config import config
 from betting.services import GameScoringService, BetSettlementService
 from betting.models import BetStatus
@@ -17,7 +18,7 @@ def main():
 
     db = get_database(config.DATABASE_URL)
 
-    with db.get_session() as session:
+    with collect_query_stats() as stats, db.get_session() as session:
         try:
             print("\nUpdating completed games scores")
             update_service = GameScoringService(session)
@@ -32,6 +33,8 @@ def main():
         except Exception as e:
             print(f"\n✗ Error: {str(e)}")
             raise
+        finally:
+            print(f"\nSQL: {stats.summary()}")
 
 
 if __name__ == "__main__":
@@ -1,6 +1,7 @@
 import argparse
 
 from betting.database import get_database
+from betting.instrumentation import collect_query_stats
 from betting.config import config
 from betting.models.game import GameStatus
 from betting.repositories.game_repository import GameRepository
@@ -28,7 +29,7 @@ def main():
 
     db = get_database(config.DATABASE_URL)
 
-    with db.get_session() as session:
+    with collect_query_stats() as stats, db.get_session() as session:
         try:
             print("\nChecking for games with pending bets and updating scores...")
 
@@ -113,6 +114,8 @@ def main():
         except Exception as e:
             print(f"\n✗ Error: {str(e)}")
             raise
+        finally:
+            print(f"\nSQL: {stats.summary()}")
 
 
 if __name__ == "__main__":
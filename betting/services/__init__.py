@@ -13,7 +13,18 @@ from .betting_service import (
 )
 from .game_sync_service import GameSyncService
 from .game_update_service import GameScoringService
+from .performance_service import PerformanceService
 from .bet_settlement_service import BetSettlementService
+from .line_history import LineHistoryService
+from .game_status_service import GameStatusService, GameStatusSweeper
+from .bet_export import BetExportService, ExportFormat
+from .game_history_export import (
+    GameHistoryExportService,
+    HistoryFormat,
+    HistoryTable,
+    season_for,
+)
+from .team_stats_service import TeamStatsService
 
 __all__ = [
     "american_to_decimal_odds",
@@ -27,5 +38,16 @@ __all__ = [
     "InvalidBetError",
     "GameSyncService",
     "GameScoringService",
+    "PerformanceService",
     "BetSettlementService",
+    "LineHistoryService",
+    "GameStatusService",
+    "GameStatusSweeper",
+    "BetExportService",
+    "ExportFormat",
+    "GameHistoryExportService",
+    "HistoryFormat",
+    "HistoryTable",
+    "season_for",
+    "TeamStatsService",
 ]
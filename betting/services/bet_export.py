@@ -0,0 +1,96 @@
+"""Streaming bulk export of bet history as NDJSON or CSV."""
+
+import csv
+import io
+from datetime import datetime
+from enum import Enum
+from typing import Iterable, Iterator, Optional, Sequence
+from uuid import UUID
+
+from pydantic_core import to_json
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session
+
+from betting.models import BetStatus, BetType
+from betting.repositories.bet_repository import BET_EXPORT_COLUMNS, BetRepository
+
+
+class ExportFormat(str, Enum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+    @property
+    def media_type(self) -> str:
+        return {
+            ExportFormat.NDJSON: "application/x-ndjson",
+            ExportFormat.CSV: "text/csv",
+        }[self]
+
+
+EXPORT_FIELDS = [column.name for column in BET_EXPORT_COLUMNS]
+
+
+class BetExportService:
+    def __init__(self, session: Session, batch_size: int = 1000):
+        self.bet_repo = BetRepository(session)
+        self.batch_size = batch_size
+
+    def export(
+        self,
+        export_format: ExportFormat,
+        user_id: Optional[UUID] = None,
+        status: Optional[BetStatus] = None,
+        bet_type: Optional[BetType] = None,
+        created_from: Optional[datetime] = None,
+        created_to: Optional[datetime] = None,
+    ) -> Iterator[bytes]:
+        """
+        Encode a user's (or every user's) bet history, oldest first.
+
+        Yields one chunk per database batch, so the caller can stream it to
+        a response or file without holding the history in memory.
+        """
+        batches = self.bet_repo.stream_bet_export(
+            user_id,
+            batch_size=self.batch_size,
+            status=status,
+            bet_type=bet_type,
+            created_from=created_from,
+            created_to=created_to,
+        )
+        if export_format == ExportFormat.CSV:
+            return encode_csv(batches)
+        return encode_ndjson(batches)
+
+
+def encode_ndjson(batches: Iterable[Sequence[Row]]) -> Iterator[bytes]:
+    for batch in batches:
+        yield b"".join(to_json(row._asdict()) + b"\n" for row in batch)
+
+
+def encode_csv(batches: Iterable[Sequence[Row]]) -> Iterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_FIELDS)
+
+    for batch in batches:
+        writer.writerows(map(_csv_row, batch))
+        yield buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+
+    # Header-only export when there are no bets
+    if buffer.tell():
+        yield buffer.getvalue().encode()
+
+
+def _csv_row(row: Row) -> list:
+    # Match the NDJSON encoding: enum values and ISO 8601 timestamps
+    return [
+        (
+            value.value
+            if isinstance(value, Enum)
+            else value.isoformat() if isinstance(value, datetime) else value
+        )
+        for value in row
+    ]
@@ -1,9 +1,12 @@
 from datetime import datetime, timezone
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
 from decimal import Decimal
 from sqlalchemy.orm import Session
+from betting.events import BET_SETTLED, publish
+from betting.metrics import BETS_SETTLED
 from betting.models import Bet, BetStatus, BetType, Game, User
 from .bet_settlement import settle_bet
+from .performance_service import PerformanceService
 from betting.repositories import BetRepository, UserRepository
 
 
@@ -12,19 +15,41 @@ class BetSettlementService:
         self.session = session
         self.bet_repo = BetRepository(session)
         self.user_repo = UserRepository(session)
+        self.performance_service = PerformanceService(session)
 
     def settle_bets_for_games(self, completed_games: List[Game]) -> List[Bet]:
         settled_bets = []
+        settlements = []
+        pending = self._load_pending_bets(completed_games)
+
+        for game, bet, user in pending:
+            outcome = self._determine_bet_outcome(bet, game)
+            payout = self._process_bet_outcome(bet, outcome, user)
+            settled_bets.append(bet)
+            settlements.append(
+                {
+                    "bet_id": bet.id,
+                    "user_id": user.id,
+                    "game_id": game.id,
+                    "status": outcome,
+                    "payout": payout,
+                }
+            )
 
-        for game in completed_games:
-            game_bets = self.bet_repo.find_pending_bets_by_game(game.id)
-
-            for bet in game_bets:
-                outcome = self._determine_bet_outcome(bet, game)
-                self._process_bet_outcome(bet, outcome)
-                settled_bets.append(bet)
+        # Balances are final only once every bet for the user is processed
+        for settlement, (_, _, user) in zip(settlements, pending):
+            settlement["balance"] = user.balance
 
+        # Committed together, so stats never count a bet the ledger doesn't
+        self.performance_service.record_settlements(
+            [(game, bet) for game, bet, _ in pending]
+        )
         self.bet_repo.commit()
+
+        for settlement in settlements:
+            BETS_SETTLED.labels(settlement["status"].value).inc()
+        if settlements:
+            publish(BET_SETTLED, payloads=settlements)
         return settled_bets
 
     def preview_settlements(self, completed_games: List[Game]) -> Dict[str, Any]:
@@ -36,37 +61,56 @@ class BetSettlementService:
             "total_payout": Decimal("0"),
         }
 
-        for game in completed_games:
-            game_bets = self.bet_repo.find_pending_bets_by_game(game.id)
-
-            for bet in game_bets:
-                outcome = self._determine_bet_outcome(bet, game)
-                user = self.user_repo.find_by_id(bet.user_id)
-
-                payout = Decimal("0")
-                if outcome == BetStatus.WON:
-                    payout = bet.potential_payout
-                    preview_data["won_count"] += 1
-                    preview_data["total_payout"] += payout
-                elif outcome == BetStatus.LOST:
-                    preview_data["lost_count"] += 1
-                elif outcome == BetStatus.PUSH:
-                    payout = bet.stake
-                    preview_data["push_count"] += 1
-                    preview_data["total_payout"] += payout
-
-                preview_data["bets"].append(
-                    {
-                        "bet": bet,
-                        "game": game,
-                        "outcome": outcome,
-                        "payout": payout,
-                        "user": user,
-                    }
-                )
+        for game, bet, user in self._load_pending_bets(completed_games):
+            outcome = self._determine_bet_outcome(bet, game)
+
+            payout = Decimal("0")
+            if outcome == BetStatus.WON:
+                payout = bet.potential_payout
+                preview_data["won_count"] += 1
+                preview_data["total_payout"] += payout
+            elif outcome == BetStatus.LOST:
+                preview_data["lost_count"] += 1
+            elif outcome == BetStatus.PUSH:
+                payout = bet.stake
+                preview_data["push_count"] += 1
+                preview_data["total_payout"] += payout
+
+            preview_data["bets"].append(
+                {
+                    "bet": bet,
+                    "game": game,
+                    "outcome": outcome,
+                    "payout": payout,
+                    "user": user,
+                }
+            )
 
         return preview_data
 
+    def _load_pending_bets(
+        self, completed_games: List[Game]
+    ) -> List[Tuple[Game, Bet, User]]:
+        """
+        Pending bets on the given games with their game and user.
+
+        Loads bets and users in one query each rather than per game and bet.
+        Results follow the order of completed_games.
+        """
+        games_by_id = {game.id: game for game in completed_games}
+        bets = self.bet_repo.find_pending_bets_by_games(list(games_by_id))
+        users_by_id = {
+            user.id: user
+            for user in self.user_repo.find_by_ids(list({b.user_id for b in bets}))
+        }
+
+        game_order = {game_id: i for i, game_id in enumerate(games_by_id)}
+        bets.sort(key=lambda bet: game_order[bet.game_id])
+
+        return [
+            (games_by_id[bet.game_id], bet, users_by_id[bet.user_id]) for bet in bets
+        ]
+
     def _determine_bet_outcome(self, bet: Bet, game: Game) -> BetStatus:
         if bet.bet_type == BetType.MONEYLINE:
             return settle_bet(
@@ -94,13 +138,16 @@ class BetSettlementService:
                 total_line=game.total_points,
             )
 
-    def _process_bet_outcome(self, bet: Bet, outcome: BetStatus):
+    def _process_bet_outcome(self, bet: Bet, outcome: BetStatus, user: User) -> Decimal:
+        """Settle the bet, credit the user and return the amount credited."""
         bet.status = outcome
         bet.settled_at = datetime.now(timezone.utc)
 
-        user = self.user_repo.find_by_id(bet.user_id)
-
+        payout = Decimal("0")
         if outcome == BetStatus.WON:
-            user.balance += bet.potential_payout
+            payout = bet.potential_payout
         elif outcome == BetStatus.PUSH:
-            user.balance += bet.stake
+            payout = bet.stake
+
+        user.balance += payout
+        return payout
@@ -2,14 +2,18 @@
 
 from datetime import datetime, timezone
 from decimal import Decimal
-from typing import Optional
+from typing import Optional, Tuple
 from uuid import UUID
 
+from sqlalchemy.engine import Row
 from sqlalchemy.orm import Session
 
+from betting.metrics import BETS_PLACED
 from betting.models import User, Game, Bet, BetType, BetSelection, BetStatus, GameStatus
+from betting.services.game_status_service import GameStatusService
 from betting.services.odds_calculator import calculate_payout
 from betting.repositories import UserRepository, GameRepository, BetRepository
+from betting.repositories.pagination import encode_cursor, decode_cursor
 
 
 class BettingError(Exception):
@@ -67,6 +71,17 @@ class BettingService:
         if stake <= 0:
             raise InvalidBetError("Stake must be greater than 0")
 
+        game = self.game_repo.find_by_id(game_id)
+        if not game:
+            raise InvalidBetError("Game not found")
+
+        # A game past tip-off that no sweep has reached yet is started in a
+        # transaction of its own, so the status check alone is authoritative
+        # and the bet's transaction only writes when a bet is placed
+        now = datetime.now(timezone.utc)
+        if game.status == GameStatus.UPCOMING and game.commence_time <= now:
+            GameStatusService(self.session).start_due_games(now)
+
         user = self.user_repo.find_by_id(user_id)
         if not user:
             raise InvalidBetError("User not found")
@@ -76,18 +91,11 @@ class BettingService:
                 f"Insufficient balance. Available: ${user.balance}, Required: ${stake}"
             )
 
-        game = self.game_repo.find_by_id(game_id)
-        if not game:
-            raise InvalidBetError("Game not found")
-
         if game.status != GameStatus.UPCOMING:
             raise InvalidBetError(
                 "Cannot bet on a game that has already started or completed"
             )
 
-        if game.commence_time <= datetime.now(timezone.utc):
-            raise InvalidBetError("Game has already started")
-
         # Get odds for the bet type and selection
         odds = self._get_odds(game, bet_type, selection)
         if odds is None:
@@ -117,6 +125,7 @@ class BettingService:
         self.bet_repo.save(bet)
         self.bet_repo.commit()
         self.session.refresh(bet)
+        BETS_PLACED.labels(bet_type.value).inc()
 
         return bet
 
@@ -168,3 +177,55 @@ class BettingService:
     def get_bet_history(self, user_id: UUID, limit: int = 50) -> list[Bet]:
         """Get bet history for a user."""
         return self.bet_repo.find_bet_history_by_user(user_id, limit)
+
+    def get_bet_history_page(
+        self,
+        user_id: UUID,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        status: Optional[BetStatus] = None,
+        bet_type: Optional[BetType] = None,
+        created_from: Optional[datetime] = None,
+        created_to: Optional[datetime] = None,
+    ) -> Tuple[list[Row], Optional[str]]:
+        """
+        Get one page of a user's bet history, newest first.
+
+        Args:
+            user_id: User's UUID
+            limit: Maximum bets to return
+            cursor: next_cursor from the previous page, or None for the first
+            status: Only include bets with this status
+            bet_type: Only include bets of this type
+            created_from: Only include bets placed at or after this time
+            created_to: Only include bets placed before this time
+
+        Returns:
+            (bets, next_cursor) where bets are read-only rows of
+            BET_VIEW_COLUMNS and next_cursor is None on the last page
+
+        Raises:
+            InvalidBetError: If the cursor is malformed
+        """
+        try:
+            before = decode_cursor(cursor) if cursor else None
+        except ValueError as e:
+            raise InvalidBetError(str(e))
+
+        # Fetch one extra row to learn whether another page exists
+        bets = self.bet_repo.find_bet_history_page(
+            user_id,
+            limit=limit + 1,
+            before=before,
+            status=status,
+            bet_type=bet_type,
+            created_from=created_from,
+            created_to=created_to,
+        )
+
+        next_cursor = None
+        if len(bets) > limit:
+            bets = bets[:limit]
+            next_cursor = encode_cursor(bets[-1].created_at, bets[-1].id)
+
+        return bets, next_cursor
@@ -0,0 +1,254 @@
+"""
+Columnar export of completed games and their odds history.
+
+Writes Apache Arrow IPC files or Parquet with types taken from the database
+columns: Numeric as decimal128(precision, scale), timestamps as UTC
+microseconds, enums dictionary-encoded. Every row carries `season` and
+`date` (UTC commence date) so datasets can be partitioned on them.
+
+pyarrow is imported lazily; it is only needed by callers of this module.
+"""
+
+from datetime import datetime
+from enum import Enum
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Iterator, List, Optional, Sequence
+
+from sqlalchemy import BigInteger, Column, Integer, Numeric, String, Uuid
+from sqlalchemy import Enum as SqlEnum
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session
+
+from betting.models.types import TZDateTime
+from betting.repositories import GameRepository, OddsSnapshotRepository
+from betting.repositories.game_repository import GAME_VIEW_COLUMNS
+from betting.repositories.odds_snapshot_repository import COMPLETED_RUN_COLUMNS
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+PARTITION_FIELDS = ("season", "date")
+
+
+class HistoryFormat(str, Enum):
+    ARROW = "arrow"
+    PARQUET = "parquet"
+
+    @property
+    def media_type(self) -> str:
+        return {
+            HistoryFormat.ARROW: "application/vnd.apache.arrow.file",
+            HistoryFormat.PARQUET: "application/vnd.apache.parquet",
+        }[self]
+
+
+class HistoryTable(str, Enum):
+    GAMES = "games"
+    ODDS = "odds"
+
+
+def season_for(commence_time: datetime) -> str:
+    """NBA season label, e.g. "2025-26" for games from August 2025 to July 2026."""
+    start = commence_time.year if commence_time.month >= 8 else commence_time.year - 1
+    return f"{start}-{(start + 1) % 100:02d}"
+
+
+class GameHistoryExportService:
+    def __init__(self, session: Session, batch_size: int = 10_000):
+        self.game_repo = GameRepository(session)
+        self.snapshot_repo = OddsSnapshotRepository(session)
+        self.batch_size = batch_size
+
+    def record_batches(
+        self,
+        table: HistoryTable,
+        commence_from: Optional[datetime] = None,
+        commence_to: Optional[datetime] = None,
+    ) -> "Iterator[pa.RecordBatch]":
+        """One Arrow record batch per database batch, in commence order."""
+        if table == HistoryTable.ODDS:
+            columns = COMPLETED_RUN_COLUMNS
+            batches = self.snapshot_repo.stream_completed_game_runs(
+                commence_from, commence_to, batch_size=self.batch_size
+            )
+        else:
+            columns = GAME_VIEW_COLUMNS
+            batches = self.game_repo.stream_completed_games(
+                commence_from, commence_to, batch_size=self.batch_size
+            )
+
+        converter = _BatchConverter(columns)
+        for batch in batches:
+            yield converter.convert(batch)
+
+    def schema(self, table: HistoryTable) -> "pa.Schema":
+        columns = (
+            COMPLETED_RUN_COLUMNS if table == HistoryTable.ODDS else GAME_VIEW_COLUMNS
+        )
+        return _BatchConverter(columns).schema
+
+    def stream(
+        self,
+        table: HistoryTable,
+        export_format: HistoryFormat,
+        commence_from: Optional[datetime] = None,
+        commence_to: Optional[datetime] = None,
+    ) -> Iterator[bytes]:
+        """
+        Encode a single Arrow IPC or Parquet file, yielding bytes as each
+        batch (Parquet row group) is written rather than buffering the file.
+        """
+        sink = _ChunkSink()
+        writer = _open_writer(sink, self.schema(table), export_format)
+        try:
+            for batch in self.record_batches(table, commence_from, commence_to):
+                writer.write_batch(batch)
+                yield sink.take()
+        finally:
+            writer.close()
+        yield sink.take()
+
+    def write_dataset(
+        self,
+        base_dir: Path,
+        table: HistoryTable,
+        export_format: HistoryFormat,
+        commence_from: Optional[datetime] = None,
+        commence_to: Optional[datetime] = None,
+    ) -> None:
+        """
+        Write a Hive-partitioned dataset, `base_dir/season=2025-26/date=2026-01-10/`.
+
+        Batches are pulled from the database on this thread (pyarrow's writer
+        would otherwise read the cursor from its own threads) and each is
+        written as its own files, so `base_dir` should start out empty.
+        Arrow files are written uncompressed so readers can memory-map them
+        (pyarrow.memory_map / pyarrow.dataset) without copying.
+        """
+        import pyarrow as pa
+        import pyarrow.dataset as ds
+
+        schema = self.schema(table)
+        partitioning = ds.partitioning(
+            pa.schema([schema.field(name) for name in PARTITION_FIELDS]),
+            flavor="hive",
+        )
+        extension = "arrow" if export_format == HistoryFormat.ARROW else "parquet"
+
+        for number, batch in enumerate(
+            self.record_batches(table, commence_from, commence_to)
+        ):
+            ds.write_dataset(
+                batch,
+                base_dir,
+                format="ipc" if export_format == HistoryFormat.ARROW else "parquet",
+                partitioning=partitioning,
+                basename_template=f"part-{number}-{{i}}.{extension}",
+                existing_data_behavior="overwrite_or_ignore",
+            )
+
+
+class _BatchConverter:
+    """Turns rows of SQLAlchemy columns into Arrow batches with matching types."""
+
+    def __init__(self, columns: Sequence[Column]):
+        import pyarrow as pa
+
+        self._commence_index = [column.name for column in columns].index(
+            "commence_time"
+        )
+        fields = []
+        self._converters: List[Optional[Callable]] = []
+        for column in columns:
+            arrow_type, convert = _arrow_type(column)
+            fields.append(pa.field(column.name, arrow_type, column.nullable))
+            self._converters.append(convert)
+        fields += [
+            pa.field("season", pa.string(), nullable=False),
+            pa.field("date", pa.date32(), nullable=False),
+        ]
+        self.schema = pa.schema(fields)
+
+    def convert(self, rows: Sequence[Row]) -> "pa.RecordBatch":
+        import pyarrow as pa
+
+        arrays = []
+        for index, (field, convert) in enumerate(zip(self.schema, self._converters)):
+            values = [row[index] for row in rows]
+            if convert:
+                values = [None if v is None else convert(v) for v in values]
+            arrays.append(pa.array(values, type=field.type))
+
+        commence_times = [row[self._commence_index] for row in rows]
+        arrays.append(pa.array([season_for(t) for t in commence_times], pa.string()))
+        # commence_time is UTC-aware, so this is the UTC calendar date
+        arrays.append(pa.array([t.date() for t in commence_times], pa.date32()))
+        return pa.RecordBatch.from_arrays(arrays, schema=self.schema)
+
+
+def _arrow_type(column: Column):
+    """Arrow type for a column, plus a converter for values pyarrow can't take."""
+    import pyarrow as pa
+
+    column_type = column.type
+    if isinstance(column_type, TZDateTime):
+        return pa.timestamp("us", tz="UTC"), None
+    if isinstance(column_type, SqlEnum):
+        return pa.dictionary(pa.int8(), pa.string()), _enum_value
+    if isinstance(column_type, Numeric):
+        return pa.decimal128(column_type.precision, column_type.scale), None
+    if isinstance(column_type, BigInteger):
+        return pa.int64(), None
+    if isinstance(column_type, Integer):
+        return pa.int32(), None
+    if isinstance(column_type, Uuid):
+        return pa.string(), str
+    if isinstance(column_type, String):
+        return pa.string(), None
+    raise TypeError(f"No Arrow type for {column.name}: {column_type!r}")
+
+
+def _enum_value(value: Enum) -> str:
+    return value.value
+
+
+def _open_writer(sink, schema: "pa.Schema", export_format: HistoryFormat):
+    import pyarrow as pa
+
+    if export_format == HistoryFormat.PARQUET:
+        import pyarrow.parquet as pq
+
+        return pq.ParquetWriter(sink, schema)
+    return pa.ipc.new_file(sink, schema)
+
+
+class _ChunkSink:
+    """Write-only file object that hands back what was written since last take."""
+
+    closed = False
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+        self._position = 0
+
+    def write(self, data) -> int:
+        chunk = bytes(data)
+        self._chunks.append(chunk)
+        self._position += len(chunk)
+        return len(chunk)
+
+    def tell(self) -> int:
+        return self._position
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+    def writable(self) -> bool:
+        return True
+
+    def take(self) -> bytes:
+        data, self._chunks = b"".join(self._chunks), []
+        return data
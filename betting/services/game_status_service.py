@@ -0,0 +1,77 @@
+"""Moving games from UPCOMING to IN_PROGRESS once they tip off."""
+
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from sqlalchemy.orm import Session
+
+from betting.events import GAMES_CHANGED, GAME_STARTED, publish
+from betting.repositories import GameRepository
+
+
+class GameStatusService:
+    def __init__(self, session: Session):
+        self.session = session
+        self.game_repo = GameRepository(session)
+
+    def start_due_games(self, now: Optional[datetime] = None) -> int:
+        """
+        Mark every upcoming game whose commence_time has passed as IN_PROGRESS.
+
+        Runs as a single UPDATE backed by the (status, commence_time) index.
+
+        Returns:
+            Number of games moved to IN_PROGRESS
+        """
+        started = self.game_repo.mark_started_games(now or datetime.now(timezone.utc))
+        self.game_repo.commit()
+
+        if started:
+            publish(GAMES_CHANGED, session=self.session)
+            publish(GAME_STARTED, payloads=[{"game_id": id} for id in started])
+        return len(started)
+
+
+class GameStatusSweeper:
+    """
+    Lazily runs start_due_games from read paths without sweeping on every call.
+
+    A sweep runs when the interval has elapsed or the earliest upcoming game
+    is due, whichever comes first. The interval bounds staleness when another
+    instance syncs in a game that starts sooner than this one knows about.
+    """
+
+    def __init__(self, interval: timedelta):
+        self.interval = interval
+        self._next_sweep_at: Optional[datetime] = None
+        self._lock = threading.Lock()
+
+    def is_due(self, now: Optional[datetime] = None) -> bool:
+        """Whether sweep_if_due would sweep now, without claiming the slot."""
+        now = now or datetime.now(timezone.utc)
+        with self._lock:
+            return self._next_sweep_at is None or now >= self._next_sweep_at
+
+    def sweep_if_due(self, session: Session, now: Optional[datetime] = None) -> int:
+        now = now or datetime.now(timezone.utc)
+
+        with self._lock:
+            if self._next_sweep_at is not None and now < self._next_sweep_at:
+                return 0
+            # Claim the slot before sweeping so concurrent readers don't pile on
+            self._next_sweep_at = now + self.interval
+
+        started = GameStatusService(session).start_due_games(now)
+        next_commence_time = GameRepository(session).find_next_commence_time()
+
+        with self._lock:
+            if next_commence_time is not None:
+                self._next_sweep_at = min(self._next_sweep_at, next_commence_time)
+
+        return started
+
+    def reset(self):
+        """Force the next call to sweep, e.g. after new games were synced."""
+        with self._lock:
+            self._next_sweep_at = None
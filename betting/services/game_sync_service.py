@@ -1,38 +1,131 @@
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any, Dict, List
+from uuid import uuid4
 from sqlalchemy.orm import Session
+from betting.events import GAMES_CHANGED, ODDS_CHANGED, publish
 from betting.models import Game
-from betting.the_odds_api import TheOddsApiClient
-from betting.repositories import GameRepository
+from betting.models.odds_snapshot import LINE_COLUMNS
+from betting.repositories import GameRepository, OddsSnapshotRepository
+
+if TYPE_CHECKING:
+    from betting.the_odds_api import TheOddsApiClient
+
+# American prices are whole numbers; snapshots store them as integers
+SNAPSHOT_PRICE_COLUMNS = (
+    "home_moneyline",
+    "away_moneyline",
+    "home_spread_odds",
+    "away_spread_odds",
+    "over_odds",
+    "under_odds",
+)
 
 
 class GameSyncService:
-    def __init__(self, session: Session, api_client: TheOddsApiClient = None):
+    def __init__(self, session: Session, api_client: "TheOddsApiClient" = None):
         self.session = session
-        self.api_client = api_client or TheOddsApiClient()
+        if api_client is None:
+            # Deferred so API instances don't import requests on a cold start
+            from betting.the_odds_api import TheOddsApiClient
+
+            api_client = TheOddsApiClient()
+        self.api_client = api_client
         self.game_repo = GameRepository(session)
+        self.snapshot_repo = OddsSnapshotRepository(session)
 
     def sync_games(self) -> dict:
-        games = self.api_client.get_nba_games()
+        games = self.api_client.get_nba_games_with_snapshots()
+        captured_at = datetime.now(timezone.utc)
 
         created_count = 0
         updated_count = 0
+        snapshot_rows = []
+        odds_changes = []
+
+        existing = {
+            game.external_id: game
+            for game in self.game_repo.find_by_external_ids(
+                [game_data["external_id"] for game_data, _ in games]
+            )
+        }
+
+        for game_data, snapshots in games:
+            game = existing.get(game_data["external_id"])
 
-        for game_data in games:
-            existing_game = self.game_repo.find_by_external_id(game_data["external_id"])
+            lines = {column: game_data[column] for column in LINE_COLUMNS}
 
-            if existing_game:
+            if game:
+                if any(getattr(game, column) != lines[column] for column in lines):
+                    odds_changes.append({"game_id": game.id, **lines})
+                # The feed always reports UPCOMING; status is ours once created
                 for key, value in game_data.items():
-                    if key != "external_id":
-                        setattr(existing_game, key, value)
+                    if key not in ("external_id", "status"):
+                        setattr(game, key, value)
                 updated_count += 1
             else:
-                new_game = Game(**game_data)
-                self.game_repo.save(new_game)
+                game = Game(id=uuid4(), **game_data)
+                self.game_repo.save(game)
+                odds_changes.append({"game_id": game.id, **lines})
                 created_count += 1
 
+            snapshot_rows.extend(
+                self._snapshot_row(game, captured_at, snapshot)
+                for snapshot in snapshots
+            )
+
+        self.session.flush()
+        line_change_count = self._record_line_changes(snapshot_rows, captured_at)
+
         self.game_repo.commit()
+        publish(GAMES_CHANGED, session=self.session)
+        if odds_changes:
+            publish(ODDS_CHANGED, payloads=odds_changes)
 
         return {
             "created": created_count,
             "updated": updated_count,
             "total": len(games),
+            "line_changes": line_change_count,
+        }
+
+    def _record_line_changes(
+        self, snapshot_rows: List[Dict[str, Any]], captured_at: datetime
+    ) -> int:
+        """
+        Delta-encode this sync's snapshots against the current run per bookmaker.
+
+        Unchanged lines extend the existing run in place; only rows whose
+        prices or points moved are inserted (in one batch).
+
+        Returns:
+            Number of new runs inserted
+        """
+        latest_runs = self.snapshot_repo.find_latest_runs(
+            list({row["game_id"] for row in snapshot_rows})
+        )
+
+        new_rows = []
+        for row in snapshot_rows:
+            run = latest_runs.get((row["game_id"], row["bookmaker"]))
+            if run is not None and run.has_lines(row):
+                run.last_seen_at = captured_at
+                run.sample_count += 1
+            else:
+                new_rows.append(row)
+
+        self.session.flush()
+        return self.snapshot_repo.save_all(new_rows)
+
+    def _snapshot_row(
+        self, game: Game, captured_at: datetime, snapshot: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        row = {
+            "game_id": game.id,
+            "captured_at": captured_at,
+            "last_seen_at": captured_at,
+            **snapshot,
         }
+        for column in SNAPSHOT_PRICE_COLUMNS:
+            if row[column] is not None:
+                row[column] = int(row[column])
+        return row
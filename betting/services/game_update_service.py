@@ -1,20 +1,26 @@
-from typing import List, Dict, Any
+from typing import TYPE_CHECKING, List, Dict, Any
 from sqlalchemy.orm import Session
+from betting.events import GAMES_CHANGED, GAME_COMPLETED, publish
 from betting.models import Game, GameStatus
 from betting.repositories import GameRepository
-from betting.the_odds_api.client import TheOddsApiClient
+
+if TYPE_CHECKING:
+    from betting.the_odds_api import TheOddsApiClient
 
 
 class GameScoringService:
-    def __init__(self, session: Session, api_client: TheOddsApiClient = None):
+    def __init__(self, session: Session, api_client: "TheOddsApiClient" = None):
         self.session = session
         self.game_repo = GameRepository(session)
-        self.api_client = api_client or TheOddsApiClient()
+        if api_client is None:
+            # Deferred so API instances don't import requests on a cold start
+            from betting.the_odds_api import TheOddsApiClient
 
-    def update_completed_games(self, days_from: int = 1) -> List[Game]:
-        pending_games = self.game_repo.find_unfinished_games()
+            api_client = TheOddsApiClient()
+        self.api_client = api_client
 
-        if not pending_games:
+    def update_completed_games(self, days_from: int = 1) -> List[Game]:
+        if not self.game_repo.has_unfinished_games():
             return []
 
         score_data_list = self.api_client.get_nba_scores(days_from=days_from)
@@ -27,22 +33,46 @@ class GameScoringService:
     def _update_games_from_scores(
         self, score_data_list: List[Dict[str, Any]]
     ) -> List[Game]:
+        # One IN query for every unfinished game the API reported on; games
+        # we already completed are filtered out in SQL rather than one by one
+        unfinished = self.game_repo.find_unfinished_by_external_ids(
+            [score_data["external_id"] for score_data in score_data_list]
+        )
+        games_by_external_id = {game.external_id: game for game in unfinished}
+
         updated_games = []
+        score_rows = []
 
         for score_data in score_data_list:
-            game = self.game_repo.find_by_external_id(score_data["external_id"])
+            game = games_by_external_id.pop(score_data["external_id"], None)
 
             if not game:
                 continue
 
-            if game.status == GameStatus.COMPLETED:
-                continue
-
-            game.home_score = score_data["home_score"]
-            game.away_score = score_data["away_score"]
-            game.status = GameStatus.COMPLETED
-
+            score_rows.append(
+                {
+                    "id": game.id,
+                    "home_score": score_data["home_score"],
+                    "away_score": score_data["away_score"],
+                    "status": GameStatus.COMPLETED,
+                }
+            )
             updated_games.append(game)
 
+        self.game_repo.update_all(score_rows)
         self.game_repo.commit()
+
+        if updated_games:
+            publish(GAMES_CHANGED, session=self.session)
+            publish(
+                GAME_COMPLETED,
+                payloads=[
+                    {
+                        "game_id": row["id"],
+                        "home_score": row["home_score"],
+                        "away_score": row["away_score"],
+                    }
+                    for row in score_rows
+                ],
+            )
         return updated_games
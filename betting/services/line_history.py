@@ -0,0 +1,79 @@
+"""Reading delta-encoded odds runs back as point-in-time lines and time series."""
+
+from bisect import bisect_right
+from datetime import datetime, timedelta
+from typing import List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy.orm import Session
+
+from betting.models import OddsSnapshot
+from betting.models.types import as_utc
+from betting.repositories import OddsSnapshotRepository
+
+MAX_SERIES_POINTS = 5000
+
+
+class LineHistory:
+    """Sorted odds runs for one game and bookmaker, queryable by time."""
+
+    def __init__(self, runs: List[OddsSnapshot]):
+        self.runs = runs
+        self._starts = [run.captured_at for run in runs]
+
+    def as_of(self, at: datetime) -> Optional[OddsSnapshot]:
+        """Return the run in effect at the given time, or None before the first."""
+        index = bisect_right(self._starts, as_utc(at)) - 1
+        return self.runs[index] if index >= 0 else None
+
+    def resample(
+        self, start: datetime, end: datetime, step: timedelta
+    ) -> List[Tuple[datetime, Optional[OddsSnapshot]]]:
+        """
+        Expand the runs into a dense series sampled every step from start to end.
+
+        Returns:
+            List of (sample time, run in effect or None)
+        """
+        points = []
+        at = start
+        while at <= end:
+            points.append((at, self.as_of(at)))
+            at += step
+        return points
+
+
+class LineHistoryService:
+    def __init__(self, session: Session):
+        self.session = session
+        self.snapshot_repo = OddsSnapshotRepository(session)
+
+    def get_line_as_of(
+        self, game_id: UUID, bookmaker: str, at: datetime
+    ) -> Optional[OddsSnapshot]:
+        """Get the lines a bookmaker was offering for a game at a point in time."""
+        return self.snapshot_repo.find_as_of(game_id, bookmaker, as_utc(at))
+
+    def get_line_series(
+        self,
+        game_id: UUID,
+        bookmaker: str,
+        start: datetime,
+        end: datetime,
+        step: timedelta,
+    ) -> List[Tuple[datetime, Optional[OddsSnapshot]]]:
+        """
+        Get a dense time series of a bookmaker's lines for a game. Naive
+        times are taken as UTC, like stored ones.
+
+        Raises:
+            ValueError: If the window is empty or would exceed MAX_SERIES_POINTS
+        """
+        start, end = as_utc(start), as_utc(end)
+        if step <= timedelta(0) or end < start:
+            raise ValueError("Series requires start <= end and a positive step")
+        if (end - start) / step >= MAX_SERIES_POINTS:
+            raise ValueError(f"Series is limited to {MAX_SERIES_POINTS} points")
+
+        runs = self.snapshot_repo.find_runs_between(game_id, bookmaker, start, end)
+        return LineHistory(runs).resample(start, end, step)
@@ -0,0 +1,495 @@
+"""
+Betting performance kept as running statistics.
+
+Settlement applies each bet to its user's UserPerformance row, bet type and
+month buckets and team stats in constant time, so reading ROI, Sharpe
+ratio, max drawdown, streaks or best teams never scans bet history.
+Replaying the history (recompute) gives the same figures, which is how they
+are verified and rebuilt.
+"""
+
+import math
+from collections import defaultdict
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+from uuid import UUID
+
+from sqlalchemy.orm import Session
+
+from betting.models import (
+    Bet,
+    BetSelection,
+    BetStatus,
+    BetType,
+    Game,
+    PerformanceDimension,
+    UserPerformance,
+    UserPerformanceBucket,
+    UserTeamStats,
+)
+from betting.repositories import BetRepository, PerformanceRepository
+
+ZERO = Decimal("0")
+
+# Floats accumulated in a different order can differ in the last bits
+FLOAT_TOLERANCE = 1e-9
+
+# Best and worst teams reported by /users/{id}/stats
+TOP_TEAMS = 3
+
+
+class SettledBet(NamedTuple):
+    """A settled bet with its game's teams; SETTLED_BET_COLUMNS rows match it."""
+
+    id: UUID
+    user_id: UUID
+    bet_type: BetType
+    selection: BetSelection
+    status: BetStatus
+    stake: Decimal
+    potential_payout: Decimal
+    settled_at: datetime
+    home_team: str
+    away_team: str
+
+    @classmethod
+    def of(cls, bet: Bet, game: Game) -> "SettledBet":
+        return cls(
+            bet.id,
+            bet.user_id,
+            bet.bet_type,
+            bet.selection,
+            bet.status,
+            bet.stake,
+            bet.potential_payout,
+            bet.settled_at,
+            game.home_team,
+            game.away_team,
+        )
+
+
+def bet_payout(status: BetStatus, stake: Decimal, potential_payout: Decimal) -> Decimal:
+    """Amount credited for a settled bet, stake included."""
+    if status == BetStatus.WON:
+        return potential_payout
+    if status == BetStatus.PUSH:
+        return stake
+    return ZERO
+
+
+def next_streak(streak: int, status: BetStatus) -> int:
+    """Streak after a settled bet: wins count up from 1, losses down from -1."""
+    if status == BetStatus.WON:
+        return streak + 1 if streak > 0 else 1
+    if status == BetStatus.LOST:
+        return streak - 1 if streak < 0 else -1
+    return streak
+
+
+def team_sides(bet: SettledBet) -> Optional[Tuple[str, str]]:
+    """(team backed, team opposed), or None for totals bets."""
+    if bet.bet_type == BetType.OVER_UNDER:
+        return None
+    if bet.selection == BetSelection.HOME:
+        return bet.home_team, bet.away_team
+    return bet.away_team, bet.home_team
+
+
+def bucket_keys(
+    bet_type: BetType, settled_at: datetime
+) -> Tuple[Tuple[PerformanceDimension, str], ...]:
+    return (
+        (PerformanceDimension.BET_TYPE, bet_type.value),
+        (PerformanceDimension.MONTH, settled_at.strftime("%Y-%m")),
+    )
+
+
+class PerformanceAccumulator:
+    """One user's performance rows, updated one settled bet at a time."""
+
+    def __init__(
+        self,
+        user_id: UUID,
+        performance: Optional[UserPerformance] = None,
+        buckets: Iterable[UserPerformanceBucket] = (),
+        teams: Iterable[UserTeamStats] = (),
+    ):
+        self.user_id = user_id
+        self.performance = performance or UserPerformance(
+            user_id=user_id,
+            settled_bets=0,
+            won=0,
+            lost=0,
+            push=0,
+            total_staked=ZERO,
+            total_returned=ZERO,
+            return_mean=0.0,
+            return_m2=0.0,
+            net_profit=ZERO,
+            peak_profit=ZERO,
+            max_drawdown=ZERO,
+            current_streak=0,
+            longest_win_streak=0,
+            longest_loss_streak=0,
+        )
+        self.buckets = {(bucket.dimension, bucket.key): bucket for bucket in buckets}
+        self.teams = {team.team_name: team for team in teams}
+
+    def add(self, bet: SettledBet):
+        status, stake, settled_at = bet.status, bet.stake, bet.settled_at
+        payout = bet_payout(status, stake, bet.potential_payout)
+        p = self.performance
+        _count(p, status, stake, payout)
+
+        # Welford's update of the mean and variance of per-bet returns
+        bet_return = float((payout - stake) / stake)
+        p.settled_bets += 1
+        delta = bet_return - p.return_mean
+        p.return_mean += delta / p.settled_bets
+        p.return_m2 += delta * (bet_return - p.return_mean)
+
+        p.net_profit += payout - stake
+        p.peak_profit = max(p.peak_profit, p.net_profit)
+        p.max_drawdown = max(p.max_drawdown, p.peak_profit - p.net_profit)
+        p.last_settled_at = settled_at
+
+        p.current_streak = next_streak(p.current_streak, status)
+        p.longest_win_streak = max(p.longest_win_streak, p.current_streak)
+        p.longest_loss_streak = max(p.longest_loss_streak, -p.current_streak)
+
+        for dimension, key in bucket_keys(bet.bet_type, settled_at):
+            bucket = self.buckets.get((dimension, key))
+            if bucket is None:
+                bucket = self.buckets[(dimension, key)] = UserPerformanceBucket(
+                    user_id=self.user_id,
+                    dimension=dimension,
+                    key=key,
+                    bets=0,
+                    won=0,
+                    lost=0,
+                    push=0,
+                    total_staked=ZERO,
+                    total_returned=ZERO,
+                )
+            bucket.bets += 1
+            _count(bucket, status, stake, payout)
+
+        sides = team_sides(bet)
+        if sides:
+            backed, opposed = (self._team(name) for name in sides)
+            backed.bets_for += 1
+            backed.pnl_for += payout - stake
+            opposed.bets_against += 1
+            opposed.pnl_against += payout - stake
+            if status == BetStatus.WON:
+                backed.wins_for += 1
+                opposed.wins_against += 1
+            elif status == BetStatus.LOST:
+                backed.losses_for += 1
+                opposed.losses_against += 1
+
+    def _team(self, team_name: str) -> UserTeamStats:
+        team = self.teams.get(team_name)
+        if team is None:
+            team = self.teams[team_name] = UserTeamStats(
+                user_id=self.user_id,
+                team_name=team_name,
+                bets_for=0,
+                wins_for=0,
+                losses_for=0,
+                pnl_for=ZERO,
+                bets_against=0,
+                wins_against=0,
+                losses_against=0,
+                pnl_against=ZERO,
+            )
+        return team
+
+    def rows(self) -> List[Any]:
+        return [self.performance, *self.buckets.values(), *self.teams.values()]
+
+
+def _count(row, status: BetStatus, stake: Decimal, payout: Decimal):
+    if status == BetStatus.WON:
+        row.won += 1
+    elif status == BetStatus.LOST:
+        row.lost += 1
+    elif status == BetStatus.PUSH:
+        row.push += 1
+    row.total_staked += stake
+    row.total_returned += payout
+
+
+def _roi(staked: Decimal, returned: Decimal) -> Optional[float]:
+    return float((returned - staked) / staked) if staked else None
+
+
+def summarize(
+    performance: UserPerformance, buckets: Iterable[UserPerformanceBucket]
+) -> Dict[str, Any]:
+    """The /users/{id}/performance figures, read off the running stats."""
+    p = performance
+    decided = p.won + p.lost
+    deviation = (
+        math.sqrt(p.return_m2 / (p.settled_bets - 1)) if p.settled_bets > 1 else 0.0
+    )
+
+    by_bet_type = {}
+    by_month = []
+    for bucket in sorted(buckets, key=lambda b: b.key):
+        roi = _roi(bucket.total_staked, bucket.total_returned)
+        if bucket.dimension == PerformanceDimension.BET_TYPE:
+            by_bet_type[bucket.key] = {"count": bucket.bets, "roi": roi}
+        else:
+            by_month.append({"month": bucket.key, "bets": bucket.bets, "roi": roi})
+
+    return {
+        "user_id": p.user_id,
+        "total_bets": p.settled_bets,
+        "record": {"won": p.won, "lost": p.lost, "push": p.push},
+        "win_rate": p.won / decided if decided else None,
+        "roi": _roi(p.total_staked, p.total_returned),
+        "total_staked": p.total_staked,
+        "total_returned": p.total_returned,
+        "net_profit": p.net_profit,
+        # Per bet, with no risk-free rate
+        "sharpe_ratio": p.return_mean / deviation if deviation else None,
+        "max_drawdown": p.max_drawdown,
+        "breakdown": {"by_bet_type": by_bet_type, "by_month": by_month},
+    }
+
+
+def summarize_stats(
+    performance: UserPerformance,
+    buckets: Iterable[UserPerformanceBucket],
+    best_teams: Sequence[UserTeamStats],
+    worst_teams: Sequence[UserTeamStats],
+) -> Dict[str, Any]:
+    """The /users/{id}/stats figures: records, P/L, best teams and streaks."""
+    p = performance
+    by_bet_type = {
+        bucket.key: {
+            "wins": bucket.won,
+            "losses": bucket.lost,
+            "pushes": bucket.push,
+            "pnl": bucket.total_returned - bucket.total_staked,
+        }
+        for bucket in buckets
+        if bucket.dimension == PerformanceDimension.BET_TYPE
+    }
+    return {
+        "user_id": p.user_id,
+        "total_bets": p.settled_bets,
+        "total_wins": p.won,
+        "total_losses": p.lost,
+        "total_pushes": p.push,
+        "total_staked": p.total_staked,
+        "total_pnl": p.net_profit,
+        "by_bet_type": by_bet_type,
+        "best_teams": list(best_teams),
+        "worst_teams": list(worst_teams),
+        "current_streak": p.current_streak,
+        "longest_win_streak": p.longest_win_streak,
+        "longest_loss_streak": p.longest_loss_streak,
+    }
+
+
+class PerformanceService:
+    def __init__(self, session: Session, batch_size: int = 1000):
+        self.bet_repo = BetRepository(session)
+        self.performance_repo = PerformanceRepository(session)
+        self.batch_size = batch_size
+
+    def record_settlements(self, settled: Sequence[Tuple[Game, Bet]]) -> None:
+        """
+        Apply newly settled bets, with their games, to their users' stats.
+
+        Loads the affected rows in three queries for the whole batch and
+        applies each bet in O(1). The caller commits with the settlement.
+        """
+        if not settled:
+            return
+        bets = sorted(
+            (SettledBet.of(bet, game) for game, bet in settled),
+            key=lambda bet: (bet.settled_at, bet.id),
+        )
+        user_ids = list({bet.user_id for bet in bets})
+        keys = {
+            key for bet in bets for key in bucket_keys(bet.bet_type, bet.settled_at)
+        }
+        team_names = {name for bet in bets for name in team_sides(bet) or ()}
+
+        buckets = defaultdict(list)
+        for bucket in self.performance_repo.find_buckets(user_ids, keys):
+            buckets[bucket.user_id].append(bucket)
+        teams = defaultdict(list)
+        for team in self.performance_repo.find_team_stats(user_ids, team_names):
+            teams[team.user_id].append(team)
+        accumulators = {
+            performance.user_id: PerformanceAccumulator(
+                performance.user_id,
+                performance,
+                buckets[performance.user_id],
+                teams[performance.user_id],
+            )
+            for performance in self.performance_repo.find_by_users(user_ids)
+        }
+
+        for bet in bets:
+            accumulator = accumulators.get(bet.user_id)
+            if accumulator is None:
+                accumulator = accumulators[bet.user_id] = PerformanceAccumulator(
+                    bet.user_id
+                )
+            accumulator.add(bet)
+
+        for accumulator in accumulators.values():
+            self.performance_repo.save_all(accumulator.rows())
+
+    def get_performance(self, user_id: UUID) -> Dict[str, Any]:
+        performance = self.performance_repo.find_by_user(user_id)
+        if performance is None:
+            return summarize(PerformanceAccumulator(user_id).performance, [])
+        return summarize(
+            performance, self.performance_repo.find_buckets_by_user(user_id)
+        )
+
+    def get_stats(self, user_id: UUID) -> Dict[str, Any]:
+        performance = self.performance_repo.find_by_user(user_id)
+        if performance is None:
+            return summarize_stats(
+                PerformanceAccumulator(user_id).performance, [], [], []
+            )
+        return summarize_stats(
+            performance,
+            self.performance_repo.find_buckets_by_user(user_id),
+            self.performance_repo.find_top_teams(user_id, TOP_TEAMS, best=True),
+            self.performance_repo.find_top_teams(user_id, TOP_TEAMS, best=False),
+        )
+
+    def get_team_stats(self, user_id: UUID) -> List[UserTeamStats]:
+        return self.performance_repo.find_team_stats_by_user(user_id)
+
+    def recompute(self, user_id: UUID) -> PerformanceAccumulator:
+        """Performance rebuilt from the full bet history, not saved."""
+        accumulator = PerformanceAccumulator(user_id)
+        for batch in self.bet_repo.stream_settled_bets(user_id, self.batch_size):
+            for bet in batch:
+                accumulator.add(bet)
+        return accumulator
+
+    def verify(self, user_id: UUID) -> List[str]:
+        """Differences between the stored stats and a full recompute, if any."""
+        expected = self.recompute(user_id)
+        stored = PerformanceAccumulator(
+            user_id,
+            self.performance_repo.find_by_user(user_id),
+            self.performance_repo.find_buckets_by_user(user_id),
+            self.performance_repo.find_team_stats_by_user(user_id),
+        )
+
+        differences = _compare(
+            "performance", expected.performance, stored.performance, _PERFORMANCE_FIELDS
+        )
+        for key in sorted(expected.buckets.keys() | stored.buckets.keys()):
+            label = f"{key[0].value}={key[1]}"
+            if key not in stored.buckets:
+                differences.append(f"{label}: missing")
+            elif key not in expected.buckets:
+                differences.append(f"{label}: has no settled bets")
+            else:
+                differences += _compare(
+                    label, expected.buckets[key], stored.buckets[key], _BUCKET_FIELDS
+                )
+        for name in sorted(expected.teams.keys() | stored.teams.keys()):
+            if name not in stored.teams:
+                differences.append(f"{name}: missing")
+            elif name not in expected.teams:
+                differences.append(f"{name}: has no settled bets")
+            else:
+                differences += _compare(
+                    name, expected.teams[name], stored.teams[name], _TEAM_FIELDS
+                )
+        return differences
+
+    def rebuild(self, user_id: UUID) -> PerformanceAccumulator:
+        """Replace a user's stored stats with a full recompute; the caller commits."""
+        accumulator = self.recompute(user_id)
+        self.performance_repo.delete_by_user(user_id)
+        if accumulator.performance.settled_bets:
+            self.performance_repo.save_all(accumulator.rows())
+        return accumulator
+
+    def rebuild_all(self) -> int:
+        """
+        Replace every user's stats with a recompute in one pass over all
+        settled bets; the caller commits. Returns the number of users.
+
+        Bets arrive grouped by user, so only one user's rows are built at a
+        time, and they are inserted in batches without entering the session.
+        """
+        self.performance_repo.delete_all()
+        users = 0
+        pending: List[Any] = []
+        accumulator = None
+        for batch in self.bet_repo.stream_settled_bets(batch_size=self.batch_size):
+            for bet in batch:
+                if accumulator is None or bet.user_id != accumulator.user_id:
+                    if accumulator is not None:
+                        pending += accumulator.rows()
+                    accumulator = PerformanceAccumulator(bet.user_id)
+                    users += 1
+                accumulator.add(bet)
+            if len(pending) >= self.batch_size:
+                self.performance_repo.insert_all(pending)
+                pending = []
+
+        if accumulator is not None:
+            pending += accumulator.rows()
+        self.performance_repo.insert_all(pending)
+        return users
+
+
+_BUCKET_FIELDS = ("bets", "won", "lost", "push", "total_staked", "total_returned")
+_PERFORMANCE_FIELDS = (
+    "settled_bets",
+    "won",
+    "lost",
+    "push",
+    "total_staked",
+    "total_returned",
+    "return_mean",
+    "return_m2",
+    "net_profit",
+    "peak_profit",
+    "max_drawdown",
+    "current_streak",
+    "longest_win_streak",
+    "longest_loss_streak",
+)
+_TEAM_FIELDS = (
+    "bets_for",
+    "wins_for",
+    "losses_for",
+    "pnl_for",
+    "bets_against",
+    "wins_against",
+    "losses_against",
+    "pnl_against",
+)
+
+
+def _compare(label: str, expected, stored, fields: Sequence[str]) -> List[str]:
+    differences = []
+    for field in fields:
+        want, have = getattr(expected, field), getattr(stored, field)
+        if isinstance(want, float):
+            same = math.isclose(
+                want, have, rel_tol=FLOAT_TOLERANCE, abs_tol=FLOAT_TOLERANCE
+            )
+        else:
+            same = want == have
+        if not same:
+            differences.append(f"{label}.{field}: stored {have}, recomputed {want}")
+    return differences
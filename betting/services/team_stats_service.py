@@ -0,0 +1,162 @@
+"""
+Season records per team: straight up, against the spread and over/under.
+
+A refresh is one pass over completed games in commence order, folding each
+game into its two teams' rows. Outcomes come from bet_settlement, so an
+ATS win is exactly a spread bet on that team that would have won. Rows keep
+their latest game and recent results, so an incremental refresh reads only
+games that commenced after the last one counted.
+"""
+
+from typing import Any, Dict, Iterable, Tuple
+
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session
+
+from betting.events import TEAM_STATS_CHANGED, publish
+from betting.models import BetSelection, BetStatus, BetType, TeamStats
+from betting.models.team_stats import RECENT_GAMES
+from betting.repositories import GameRepository, TeamStatsRepository
+
+from .bet_settlement import settle_bet
+from .game_history_export import season_for
+from .performance_service import next_streak
+
+ATS_LETTERS = {BetStatus.WON: "W", BetStatus.LOST: "L", BetStatus.PUSH: "P"}
+# Outcome of an OVER bet, as the game went
+OU_LETTERS = {BetStatus.WON: "O", BetStatus.LOST: "U", BetStatus.PUSH: "P"}
+
+
+def new_team_stats(team_name: str, season: str) -> Dict[str, Any]:
+    """A team's row before any games: every counter at its column default."""
+    row = {
+        column.name: column.default.arg
+        for column in TeamStats.__table__.c
+        if column.default is not None and column.default.is_scalar
+    }
+    row.update(team_name=team_name, season=season)
+    return row
+
+
+def add_result(recent: str, letter: str) -> str:
+    return (recent + letter)[-RECENT_GAMES:]
+
+
+def apply_game(stats: Dict[str, Any], game: Row, home: bool) -> None:
+    """Fold one completed game into a team's row, from that team's side."""
+    selection = BetSelection.HOME if home else BetSelection.AWAY
+    side = "home" if home else "away"
+    scores = (game.home_score, game.away_score)
+
+    won = settle_bet(BetType.MONEYLINE, selection, *scores) == BetStatus.WON
+    result = "wins" if won else "losses"
+    stats[result] += 1
+    stats[f"{side}_{result}"] += 1
+    stats["current_streak"] = next_streak(
+        stats["current_streak"], BetStatus.WON if won else BetStatus.LOST
+    )
+    stats["recent_su"] = add_result(stats["recent_su"], "W" if won else "L")
+
+    spread = game.home_spread if home else game.away_spread
+    if spread is not None:
+        ats = settle_bet(BetType.SPREAD, selection, *scores, spread=spread)
+        if ats == BetStatus.PUSH:
+            stats["ats_pushes"] += 1
+        else:
+            result = "wins" if ats == BetStatus.WON else "losses"
+            stats[f"ats_{result}"] += 1
+            stats[f"ats_{result}_{side}"] += 1
+            if spread < 0:
+                stats[f"ats_{result}_as_favorite"] += 1
+            elif spread > 0:
+                stats[f"ats_{result}_as_underdog"] += 1
+        stats["recent_ats"] = add_result(stats["recent_ats"], ATS_LETTERS[ats])
+
+    if game.total_points is not None:
+        ou = settle_bet(
+            BetType.OVER_UNDER, BetSelection.OVER, *scores, total_line=game.total_points
+        )
+        stats[{"O": "overs", "U": "unders", "P": "ou_pushes"}[OU_LETTERS[ou]]] += 1
+        stats["recent_ou"] = add_result(stats["recent_ou"], OU_LETTERS[ou])
+
+    stats["last_game_at"] = game.commence_time
+
+
+def count_recent(stats: Dict[str, Any]) -> None:
+    """Derive the last10_* counters from the recent_* results."""
+    stats["last10_wins"] = stats["recent_su"].count("W")
+    stats["last10_losses"] = stats["recent_su"].count("L")
+    stats["last10_ats_wins"] = stats["recent_ats"].count("W")
+    stats["last10_ats_losses"] = stats["recent_ats"].count("L")
+    stats["last10_overs"] = stats["recent_ou"].count("O")
+    stats["last10_unders"] = stats["recent_ou"].count("U")
+
+
+def team_seasons(game: Row) -> Iterable[Tuple[Tuple[str, str], bool]]:
+    """((team_name, season), is_home) for both teams in the game."""
+    season = season_for(game.commence_time)
+    yield (game.home_team, season), True
+    yield (game.away_team, season), False
+
+
+class TeamStatsService:
+    def __init__(self, session: Session, batch_size: int = 10_000):
+        self.session = session
+        self.game_repo = GameRepository(session)
+        self.team_stats_repo = TeamStatsRepository(session)
+        self.batch_size = batch_size
+
+    def get_season(self, season: str):
+        return self.team_stats_repo.find_by_season(season)
+
+    def refresh(self, full: bool = False) -> Dict[str, Any]:
+        """
+        Bring team_stats up to date with completed games and commit.
+
+        Incremental unless `full` or there is nothing to build on. A game
+        that commenced by the last one counted but was completed or rescored
+        since the last refresh can't be folded in out of order, so its
+        presence also forces a full pass.
+
+        Returns:
+            Dict with the mode used, games read and team rows written
+        """
+        last_game_at, refreshed_at = self.team_stats_repo.find_watermark()
+        if last_game_at is None or (
+            not full
+            and self.game_repo.has_completed_games_updated_since(
+                refreshed_at, commence_to=last_game_at
+            )
+        ):
+            full = True
+
+        rows: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        games = 0
+        for batch in self.game_repo.stream_completed_games(
+            commence_after=None if full else last_game_at,
+            batch_size=self.batch_size,
+        ):
+            if not full:
+                # Fold new games into the rows they continue
+                keys = {key for game in batch for key, _ in team_seasons(game)}
+                for row in self.team_stats_repo.find_by_keys(keys - rows.keys()):
+                    rows[(row["team_name"], row["season"])] = row
+
+            for game in batch:
+                games += 1
+                for key, home in team_seasons(game):
+                    if key not in rows:
+                        rows[key] = new_team_stats(*key)
+                    apply_game(rows[key], game, home)
+
+        for row in rows.values():
+            count_recent(row)
+        written = self.team_stats_repo.upsert_all(list(rows.values()))
+        self.team_stats_repo.commit()
+        publish(TEAM_STATS_CHANGED, session=self.session)
+
+        return {
+            "mode": "full" if full else "incremental",
+            "games": games,
+            "teams": written,
+        }
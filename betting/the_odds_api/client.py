@@ -1,6 +1,12 @@
-from typing import List, Dict, Any
+import time
+from typing import List, Dict, Any, Tuple
 import requests
 from betting.config import config
+from betting.metrics import (
+    ODDS_API_REQUEST_DURATION,
+    ODDS_API_REQUESTS_REMAINING,
+    ODDS_API_REQUESTS_USED,
+)
 from .parser import OddsParser
 
 
@@ -28,6 +34,21 @@ class TheOddsApiClient:
         raw_data = self._fetch_nba_odds(markets)
         return [OddsParser.parse_game(game_data) for game_data in raw_data]
 
+    def get_nba_games_with_snapshots(
+        self, markets: str = "h2h,spreads,totals"
+    ) -> List[Tuple[Dict[str, Any], List[Dict[str, Any]]]]:
+        """
+        Fetch NBA games once and parse both the game row and per-bookmaker odds.
+
+        Returns:
+            List of (game dict ready for Game(**dict), list of snapshot dicts)
+        """
+        raw_data = self._fetch_nba_odds(markets)
+        return [
+            (OddsParser.parse_game(game_data), OddsParser.parse_snapshots(game_data))
+            for game_data in raw_data
+        ]
+
     def get_nba_scores(self, days_from: int = 1) -> List[Dict[str, Any]]:
         """
         Fetch NBA game scores and return parsed data ready for database update.
@@ -57,11 +78,11 @@ class TheOddsApiClient:
             "regions": "us",
             "markets": markets,
             "oddsFormat": "american",
-            "bookmakers": "betmgm",
+            "bookmakers": config.ODDS_API_BOOKMAKER,
         }
 
         try:
-            response = requests.get(url, params=params, timeout=10)
+            response = self._get("odds", url, params)
             response.raise_for_status()
             return response.json()
         except requests.RequestException as e:
@@ -77,18 +98,41 @@ class TheOddsApiClient:
         }
 
         try:
-            response = requests.get(url, params=params, timeout=10)
+            response = self._get("scores", url, params)
             response.raise_for_status()
             return response.json()
         except requests.RequestException as e:
             raise OddsAPIError(f"Failed to fetch scores: {str(e)}")
 
     def check_usage(self) -> Dict[str, Any]:
-        response = requests.get(
-            f"{self.base_url}/sports", params={"apiKey": self.api_key}, timeout=10
+        response = self._get(
+            "sports", f"{self.base_url}/sports", {"apiKey": self.api_key}
         )
 
         return {
             "requests_remaining": response.headers.get("x-requests-remaining"),
             "requests_used": response.headers.get("x-requests-used"),
         }
+
+    def _get(self, endpoint: str, url: str, params: Dict[str, Any]):
+        """GET with latency and quota recorded in the API metrics."""
+        started = time.perf_counter()
+        outcome = "error"
+        try:
+            response = requests.get(url, params=params, timeout=10)
+            outcome = str(response.status_code)
+        finally:
+            ODDS_API_REQUEST_DURATION.labels(endpoint, outcome).observe(
+                time.perf_counter() - started
+            )
+
+        for header, gauge in (
+            ("x-requests-remaining", ODDS_API_REQUESTS_REMAINING),
+            ("x-requests-used", ODDS_API_REQUESTS_USED),
+        ):
+            try:
+                gauge.set(float(response.headers[header]))
+            except (KeyError, TypeError, ValueError):
+                # Missing or malformed quota headers must not fail the call
+                pass
+        return response
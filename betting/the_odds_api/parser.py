@@ -1,7 +1,8 @@
 from datetime import datetime
 from decimal import Decimal
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from betting.models import GameStatus
+from betting.models.odds_snapshot import LINE_COLUMNS
 
 
 class OddsParser:
@@ -88,7 +89,37 @@ class OddsParser:
         if not bookmakers:
             return best_odds
 
-        bookmaker = bookmakers[0]
+        best_odds.update(
+            OddsParser._extract_bookmaker_odds(bookmakers[0], home_team, away_team)
+        )
+
+        return best_odds
+
+    @staticmethod
+    def parse_snapshots(game_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Parse one odds snapshot per bookmaker from The Odds API response.
+
+        Returns a list of dicts with bookmaker plus the nine line columns,
+        ready to be stamped with game_id/captured_at and inserted.
+        """
+        home_team = game_data["home_team"]
+        away_team = game_data["away_team"]
+
+        return [
+            {
+                "bookmaker": bookmaker["key"],
+                **OddsParser._extract_bookmaker_odds(bookmaker, home_team, away_team),
+            }
+            for bookmaker in game_data.get("bookmakers", [])
+        ]
+
+    @staticmethod
+    def _extract_bookmaker_odds(
+        bookmaker: Dict[str, Any], home_team: str, away_team: str
+    ) -> Dict[str, Optional[Decimal]]:
+        """Extract the line columns offered by a single bookmaker."""
+        odds = {key: None for key in LINE_COLUMNS}
 
         for market in bookmaker.get("markets", []):
             market_key = market["key"]
@@ -97,28 +128,28 @@ class OddsParser:
             if market_key == "h2h":
                 for outcome in outcomes:
                     if outcome["name"] == home_team:
-                        best_odds["home_moneyline"] = Decimal(str(outcome["price"]))
+                        odds["home_moneyline"] = Decimal(str(outcome["price"]))
                     elif outcome["name"] == away_team:
-                        best_odds["away_moneyline"] = Decimal(str(outcome["price"]))
+                        odds["away_moneyline"] = Decimal(str(outcome["price"]))
 
             elif market_key == "spreads":
                 for outcome in outcomes:
                     if outcome["name"] == home_team:
-                        best_odds["home_spread"] = Decimal(str(outcome["point"]))
-                        best_odds["home_spread_odds"] = Decimal(str(outcome["price"]))
+                        odds["home_spread"] = Decimal(str(outcome["point"]))
+                        odds["home_spread_odds"] = Decimal(str(outcome["price"]))
                     elif outcome["name"] == away_team:
-                        best_odds["away_spread"] = Decimal(str(outcome["point"]))
-                        best_odds["away_spread_odds"] = Decimal(str(outcome["price"]))
+                        odds["away_spread"] = Decimal(str(outcome["point"]))
+                        odds["away_spread_odds"] = Decimal(str(outcome["price"]))
 
             elif market_key == "totals":
                 for outcome in outcomes:
                     if outcome["name"] == "Over":
-                        best_odds["total_points"] = Decimal(str(outcome["point"]))
-                        best_odds["over_odds"] = Decimal(str(outcome["price"]))
+                        odds["total_points"] = Decimal(str(outcome["point"]))
+                        odds["over_odds"] = Decimal(str(outcome["price"]))
                     elif outcome["name"] == "Under":
-                        best_odds["under_odds"] = Decimal(str(outcome["price"]))
+                        odds["under_odds"] = Decimal(str(outcome["price"]))
 
-        return best_odds
+        return odds
 
     @staticmethod
     def parse_scores(score_data: Dict[str, Any]) -> Dict[str, Any]:
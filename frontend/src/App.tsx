@@ -1,6 +1,6 @@
 import { useEffect, useState } from 'react';
 import { BrowserRouter, Routes, Route } from 'react-router-dom';
-import type { Game, Bet } from './api';
+import type { Game, Bet, UserStats } from './api';
 import { api } from './api';
 import { Layout } from './components/Layout';
 import { GamesPage } from './pages/GamesPage';
@@ -133,6 +133,7 @@ function LoginPage({ onLogin, error }: { onLogin: (username: string) => void; er
 function App() {
   const [games, setGames] = useState<Game[]>([]);
   const [bets, setBets] = useState<Bet[]>([]);
+  const [stats, setStats] = useState<UserStats | null>(null);
   const [balance, setBalance] = useState<string | null>(null);
   const [userId, setUserId] = useState(USER_ID);
   const [username, setUsername] = useState(USERNAME);
@@ -148,9 +149,23 @@ function App() {
       localStorage.setItem('userId', userId);
       api.getUserBalance(userId).then(data => setBalance(data.balance)).catch(console.error);
       api.getUserBets(userId).then(setBets).catch(console.error);
+      api.getUserStats(userId).then(setStats).catch(console.error);
     }
   }, [userId]);
 
+  useEffect(() => {
+    return api.subscribeEvents(userId, (type) => {
+      if (type !== 'bet_settled') {
+        api.getGames().then(setGames).catch(console.error);
+      }
+      if (userId && (type === 'bet_settled' || type === 'reset')) {
+        api.getUserBalance(userId).then(data => setBalance(data.balance)).catch(console.error);
+        api.getUserBets(userId).then(setBets).catch(console.error);
+        api.getUserStats(userId).then(setStats).catch(console.error);
+      }
+    });
+  }, [userId]);
+
   const handlePlaceBet = async (betType: string, selection: string, stake: string) => {
     if (!selectedGame || !userId) return;
     try {
@@ -191,6 +206,7 @@ function App() {
     setUsername('');
     setBalance(null);
     setBets([]);
+    setStats(null);
   };
 
   if (!userId) {
@@ -205,7 +221,7 @@ function App() {
         <Route element={<Layout balance={balance} username={username} onLogout={handleLogout} />}>
           <Route path="/" element={<GamesPage games={games} onPlaceBet={setSelectedGame} />} />
           <Route path="/bets" element={<BetsPage bets={bets} games={games} />} />
-          <Route path="/history" element={<HistoryPage bets={bets} games={games} />} />
+          <Route path="/history" element={<HistoryPage bets={bets} stats={stats} />} />
         </Route>
       </Routes>
 
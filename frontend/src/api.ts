@@ -31,6 +31,8 @@ export interface Bet {
   potential_payout: string;
   status: 'pending' | 'won' | 'lost' | 'push';
   settled_at: string | null;
+  home_team: string;
+  away_team: string;
 }
 
 export interface User {
@@ -39,31 +41,81 @@ export interface User {
   balance: string;
 }
 
+export interface UserTeamStats {
+  team_name: string;
+  bets_for: number;
+  wins_for: number;
+  losses_for: number;
+  pnl_for: string;
+  bets_against: number;
+  wins_against: number;
+  losses_against: number;
+  pnl_against: string;
+}
+
+export interface UserStats {
+  user_id: string;
+  total_bets: number;
+  total_wins: number;
+  total_losses: number;
+  total_pushes: number;
+  total_staked: string;
+  total_pnl: string;
+  by_bet_type: Record<string, { wins: number; losses: number; pushes: number; pnl: string }>;
+  best_teams: UserTeamStats[];
+  worst_teams: UserTeamStats[];
+  // Positive for consecutive wins, negative for losses
+  current_streak: number;
+  longest_win_streak: number;
+  longest_loss_streak: number;
+}
+
+export type StreamEventType =
+  | 'odds_changed'
+  | 'game_started'
+  | 'game_completed'
+  | 'bet_settled'
+  | 'reset';
+
 class ApiClient {
   private baseUrl: string;
+  // Latest X-Consistency-Token from a write, echoed so reads see that write
+  private consistencyToken: string | null = null;
 
   constructor(baseUrl: string) {
     this.baseUrl = baseUrl;
   }
 
-  private async request<T>(
+  private async send(
     endpoint: string,
     options: RequestInit = {}
-  ): Promise<T> {
+  ): Promise<Response> {
     const url = `${this.baseUrl}${endpoint}`;
     const res = await fetch(url, {
       ...options,
       headers: {
         'Content-Type': 'application/json',
+        ...(this.consistencyToken && { 'X-Consistency-Token': this.consistencyToken }),
         ...options.headers,
       },
     });
 
+    const token = res.headers.get('X-Consistency-Token');
+    if (token) this.consistencyToken = token;
+
     if (!res.ok) {
       const err = await res.json().catch(() => ({ detail: 'Request failed' }));
       throw new Error(err.detail || `Request failed: ${res.status}`);
     }
 
+    return res;
+  }
+
+  private async request<T>(
+    endpoint: string,
+    options: RequestInit = {}
+  ): Promise<T> {
+    const res = await this.send(endpoint, options);
     return res.json();
   }
 
@@ -73,7 +125,23 @@ class ApiClient {
   }
 
   async getUserBets(userId: string): Promise<Bet[]> {
-    return this.request<Bet[]>(`/users/${userId}/bets`);
+    const bets: Bet[] = [];
+    let cursor: string | null = null;
+
+    // Follow X-Next-Cursor until the full history has been read
+    do {
+      const query = new URLSearchParams({ limit: '500' });
+      if (cursor) query.set('cursor', cursor);
+      const res = await this.send(`/users/${userId}/bets?${query}`);
+      bets.push(...(await res.json() as Bet[]));
+      cursor = res.headers.get('X-Next-Cursor');
+    } while (cursor);
+
+    return bets;
+  }
+
+  async getUserStats(userId: string): Promise<UserStats> {
+    return this.request<UserStats>(`/users/${userId}/stats`);
   }
 
   async getUserBalance(userId: string): Promise<{ user_id: string; balance: string }> {
@@ -103,6 +171,27 @@ class ApiClient {
     return this.createUser(username);
   }
 
+  // Live updates from /events; EventSource reconnects with Last-Event-ID on
+  // its own. `reset` means events were missed and state should be refetched.
+  subscribeEvents(
+    userId: string | null,
+    onEvent: (type: StreamEventType, data: unknown) => void
+  ): () => void {
+    const query = userId ? `?user_id=${userId}` : '';
+    const source = new EventSource(`${this.baseUrl}/events${query}`);
+    const types: StreamEventType[] = [
+      'odds_changed',
+      'game_started',
+      'game_completed',
+      'bet_settled',
+      'reset',
+    ];
+    for (const type of types) {
+      source.addEventListener(type, (e) => onEvent(type, JSON.parse((e as MessageEvent).data)));
+    }
+    return () => source.close();
+  }
+
   async placeBet(
     userId: string,
     gameId: string,
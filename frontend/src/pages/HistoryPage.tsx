@@ -1,9 +1,9 @@
-import type { Game, Bet } from '../api';
+import type { Bet, UserStats, UserTeamStats } from '../api';
 import './HistoryPage.css';
 
 interface HistoryPageProps {
   bets: Bet[];
-  games: Game[];
+  stats: UserStats | null;
 }
 
 function formatOdds(odds: string | null): string {
@@ -12,6 +12,21 @@ function formatOdds(odds: string | null): string {
   return num > 0 ? `+${num}` : `${num}`;
 }
 
+function formatMoney(amount: string): string {
+  const num = parseFloat(amount);
+  return `${num >= 0 ? '+' : '-'}$${Math.abs(num).toFixed(2)}`;
+}
+
+function formatStreak(streak: number): string {
+  if (streak === 0) return '-';
+  return streak > 0 ? `W${streak}` : `L${-streak}`;
+}
+
+function formatTeam(team: UserTeamStats | undefined): string {
+  if (!team) return '-';
+  return `${team.team_name} (${team.wins_for}-${team.losses_for}, ${formatMoney(team.pnl_for)})`;
+}
+
 function formatDate(dateStr: string): string {
   const date = new Date(dateStr);
   return date.toLocaleDateString('en-US', {
@@ -20,7 +35,7 @@ function formatDate(dateStr: string): string {
   });
 }
 
-export function HistoryPage({ bets, games }: HistoryPageProps) {
+export function HistoryPage({ bets, stats }: HistoryPageProps) {
   const settledBets = bets
     .filter(b => b.status !== 'pending')
     .sort((a, b) => {
@@ -29,17 +44,8 @@ export function HistoryPage({ bets, games }: HistoryPageProps) {
       return new Date(b.settled_at).getTime() - new Date(a.settled_at).getTime();
     });
 
-  const getGame = (gameId: string) => games.find(g => g.id === gameId);
-
-  const totalStaked = settledBets.reduce((sum, b) => sum + parseFloat(b.stake), 0);
-  const totalReturns = settledBets.reduce((sum, b) => {
-    if (b.status === 'won') return sum + parseFloat(b.potential_payout);
-    if (b.status === 'push') return sum + parseFloat(b.stake);
-    return sum;
-  }, 0);
-  const netProfit = totalReturns - totalStaked;
-  const winCount = settledBets.filter(b => b.status === 'won').length;
-  const lossCount = settledBets.filter(b => b.status === 'lost').length;
+  // Totals, streaks and team records are kept by the server as bets settle
+  const netProfit = stats ? parseFloat(stats.total_pnl) : 0;
 
   return (
     <div className="page history-page">
@@ -48,18 +54,34 @@ export function HistoryPage({ bets, games }: HistoryPageProps) {
       <div className="stats-bar">
         <div className="stat">
           <span className="stat-label">Record</span>
-          <span className="stat-value">{winCount}W - {lossCount}L</span>
+          <span className="stat-value">
+            {stats ? `${stats.total_wins}W - ${stats.total_losses}L` : '-'}
+          </span>
         </div>
         <div className="stat">
           <span className="stat-label">Staked</span>
-          <span className="stat-value">${totalStaked.toFixed(2)}</span>
+          <span className="stat-value">
+            {stats ? `$${parseFloat(stats.total_staked).toFixed(2)}` : '-'}
+          </span>
         </div>
         <div className="stat">
           <span className="stat-label">Net P/L</span>
           <span className={`stat-value ${netProfit >= 0 ? 'positive' : 'negative'}`}>
-            {netProfit >= 0 ? '+' : ''}${netProfit.toFixed(2)}
+            {stats ? formatMoney(stats.total_pnl) : '-'}
           </span>
         </div>
+        <div className="stat">
+          <span className="stat-label">Streak</span>
+          <span className="stat-value">{stats ? formatStreak(stats.current_streak) : '-'}</span>
+        </div>
+        <div className="stat">
+          <span className="stat-label">Best Team</span>
+          <span className="stat-value">{formatTeam(stats?.best_teams[0])}</span>
+        </div>
+        <div className="stat">
+          <span className="stat-label">Worst Team</span>
+          <span className="stat-value">{formatTeam(stats?.worst_teams[0])}</span>
+        </div>
       </div>
 
       {settledBets.length === 0 ? (
@@ -80,27 +102,24 @@ export function HistoryPage({ bets, games }: HistoryPageProps) {
               </tr>
             </thead>
             <tbody>
-              {settledBets.map(bet => {
-                const game = getGame(bet.game_id);
-                return (
-                  <tr key={bet.id} className={bet.status}>
-                    <td className="date-cell">
-                      {bet.settled_at ? formatDate(bet.settled_at) : '-'}
-                    </td>
-                    <td className="game-cell">
-                      {game ? `${game.away_team} @ ${game.home_team}` : 'Unknown'}
-                    </td>
-                    <td className="type-cell">{bet.bet_type.replace('_', '/')}</td>
-                    <td className="pick-cell">{bet.selection}</td>
-                    <td className="odds-cell">{formatOdds(bet.odds)}</td>
-                    <td className="stake-cell">${bet.stake}</td>
-                    <td className="payout-cell">${bet.potential_payout}</td>
-                    <td className={`result-cell ${bet.status}`}>
-                      {bet.status.toUpperCase()}
-                    </td>
-                  </tr>
-                );
-              })}
+              {settledBets.map(bet => (
+                <tr key={bet.id} className={bet.status}>
+                  <td className="date-cell">
+                    {bet.settled_at ? formatDate(bet.settled_at) : '-'}
+                  </td>
+                  <td className="game-cell">
+                    {`${bet.away_team} @ ${bet.home_team}`}
+                  </td>
+                  <td className="type-cell">{bet.bet_type.replace('_', '/')}</td>
+                  <td className="pick-cell">{bet.selection}</td>
+                  <td className="odds-cell">{formatOdds(bet.odds)}</td>
+                  <td className="stake-cell">${bet.stake}</td>
+                  <td className="payout-cell">${bet.potential_payout}</td>
+                  <td className={`result-cell ${bet.status}`}>
+                    {bet.status.toUpperCase()}
+                  </td>
+                </tr>
+              ))}
             </tbody>
           </table>
         </div>
@@ -10,4 +10,5 @@ gcloud run deploy betting-api \
   --source . \
   --region us-west1 \
   --allow-unauthenticated \
+  --no-cpu-throttling \
   --set-env-vars "DATABASE_URL=${DATABASE_URL},ODDS_API_KEY=${ODDS_API_KEY},ADMIN_API_KEY=${ADMIN_API_KEY}"
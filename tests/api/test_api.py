@@ -1,18 +1,58 @@
+import csv
+import io
+import json
+import time
+from concurrent.futures import Executor, Future
+from contextlib import contextmanager
 from datetime import datetime, timedelta, timezone
 from decimal import Decimal
 from unittest.mock import patch, MagicMock
 from uuid import uuid4
 import pytest
 from fastapi.testclient import TestClient
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
-from betting.api.http_api import app, get_session
+from betting.api.http_api import (
+    ADMIN_JOBS,
+    app,
+    get_job_runner,
+    get_session,
+    get_session_scope,
+    get_read_session,
+    get_streaming_read_session,
+    game_status_sweeper,
+    games_cache,
+    slow_query_log,
+    team_stats_cache,
+)
+from betting.database import Database
+from betting.events import GAMES_CHANGED, publish
+from betting.instrumentation import SlowQuery, instrument_engine
+from betting.jobs import JobRunner
+from betting.metrics import REGISTRY
 from betting.models.base import Base
 from betting.models.game import Game, GameStatus
 from betting.models.user import User
-from betting.models.enums import BetStatus
+from betting.models.bet import Bet
+from betting.models.enums import BetSelection, BetStatus, BetType, JobStatus, JobType
+from betting.models.job import Job
+from betting.models.odds_snapshot import OddsSnapshot
+from betting.api.schemas import BetResponse, GameResponse
+from betting.repositories.bet_repository import BET_VIEW_COLUMNS
+from betting.repositories.game_repository import GAME_VIEW_COLUMNS
+from betting.services import BetSettlementService, TeamStatsService
+
+
+class InlineExecutor(Executor):
+    """Runs jobs during the request so tests can assert on their outcome."""
+
+    def submit(self, fn, *args, **kwargs):
+        future = Future()
+        future.set_result(fn(*args, **kwargs))
+        return future
 
 
 @pytest.fixture
@@ -23,7 +63,7 @@ def engine():
         poolclass=StaticPool,
     )
     Base.metadata.create_all(engine)
-    return engine
+    return instrument_engine(engine)
 
 
 @pytest.fixture
@@ -49,7 +89,27 @@ def client(engine):
         finally:
             session.close()
 
+    def override_get_read_session():
+        session = Session()
+        try:
+            yield session
+        finally:
+            session.close()
+
     app.dependency_overrides[get_session] = override_get_session
+    app.dependency_overrides[get_read_session] = override_get_read_session
+    app.dependency_overrides[get_streaming_read_session] = override_get_read_session
+    app.dependency_overrides[get_session_scope] = lambda: contextmanager(
+        override_get_session
+    )
+    app.dependency_overrides[get_job_runner] = lambda: JobRunner(
+        ADMIN_JOBS,
+        contextmanager(override_get_session),
+        InlineExecutor(),
+        stale_after=timedelta(minutes=15),
+    )
+    games_cache.clear()
+    team_stats_cache.clear()
     yield TestClient(app)
     app.dependency_overrides.clear()
 
@@ -91,6 +151,50 @@ def test_health_check(client):
     assert response.json() == {"status": "healthy"}
 
 
+def test_startup_warms_pool_and_games_cache(tmp_path):
+    db = Database(f"sqlite:///{tmp_path / 'betting.db'}")
+    Base.metadata.create_all(db.engine)
+    games_cache.clear()
+
+    with patch("betting.api.http_api.get_db", return_value=db):
+        with TestClient(app):
+            assert db.engine.pool.checkedin() == 2
+            assert games_cache.get(None).body == b"[]"
+
+    metrics = generate_latest(REGISTRY).decode()
+    assert 'app_startup_seconds{phase="import"}' in metrics
+    assert 'app_startup_seconds{phase="warmup"}' in metrics
+    db.engine.dispose()
+
+
+def test_metrics_report_route_latency_and_bets(client, user, game):
+    client.get("/games")
+    client.get(f"/users/{user.id}/bets")
+    client.post(
+        "/bets",
+        params={"user_id": str(user.id)},
+        json={
+            "game_id": str(game.id),
+            "bet_type": "over_under",
+            "selection": "over",
+            "stake": "10.00",
+        },
+    )
+
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == CONTENT_TYPE_LATEST
+    body = response.text
+    assert (
+        'http_request_duration_seconds_count{method="GET",route="/games",status="200"}'
+        in body
+    )
+    assert 'route="/users/{user_id}/bets"' in body
+    assert 'method="POST",route="/bets"' in body
+    assert 'bets_placed_total{bet_type="over_under"}' in body
+    assert "http_requests_in_flight 1.0" in body
+
+
 def test_list_games_empty(client):
     response = client.get("/games")
     assert response.status_code == 200
@@ -165,6 +269,226 @@ def test_list_games_filter_by_status_completed(client, game, db_session):
     assert games[0]["status"] == "completed"
 
 
+def make_listed_game(external_id, commence_time, **overrides):
+    fields = dict(
+        external_id=external_id,
+        home_team="Celtics",
+        away_team="Heat",
+        commence_time=commence_time,
+        home_moneyline=Decimal("-110"),
+        away_moneyline=Decimal("100"),
+        home_spread=Decimal("-3.5"),
+        home_spread_odds=Decimal("-110"),
+        away_spread=Decimal("3.5"),
+        away_spread_odds=Decimal("-110"),
+        total_points=Decimal("210.5"),
+        over_odds=Decimal("-110"),
+        under_odds=Decimal("-110"),
+        status=GameStatus.UPCOMING,
+    )
+    fields.update(overrides)
+    return Game(**fields)
+
+
+def test_list_games_excludes_games_missing_lines(client, game, db_session):
+    db_session.add(
+        make_listed_game(
+            "no_total",
+            datetime.now(timezone.utc) + timedelta(hours=3),
+            total_points=None,
+        )
+    )
+    db_session.commit()
+
+    response = client.get("/games")
+    assert [g["external_id"] for g in response.json()] == ["test_game_1"]
+
+
+def test_list_games_default_window_skips_old_seasons(client, game, db_session):
+    db_session.add(
+        make_listed_game(
+            "last_season",
+            datetime.now(timezone.utc) - timedelta(days=200),
+            status=GameStatus.COMPLETED,
+        )
+    )
+    db_session.commit()
+
+    response = client.get("/games")
+    assert [g["external_id"] for g in response.json()] == ["test_game_1"]
+
+    response = client.get(
+        "/games",
+        params={
+            "from": (datetime.now(timezone.utc) - timedelta(days=365)).isoformat(),
+            "to": (datetime.now(timezone.utc) - timedelta(days=100)).isoformat(),
+        },
+    )
+    assert [g["external_id"] for g in response.json()] == ["last_season"]
+
+
+def test_list_games_filter_by_team(client, game, db_session):
+    db_session.add(
+        make_listed_game("celtics", datetime.now(timezone.utc) + timedelta(hours=3))
+    )
+    db_session.commit()
+
+    response = client.get("/games", params={"team": "celtics"})
+    assert [g["external_id"] for g in response.json()] == ["celtics"]
+
+
+def test_list_games_team_filter_matches_wildcards_literally(client, game):
+    for team in ("%", "L_kers", "\\"):
+        response = client.get("/games", params={"team": team})
+        assert response.json() == []
+
+
+def test_list_games_etag_returns_304_when_unchanged(client, game):
+    response = client.get("/games")
+    etag = response.headers["ETag"]
+
+    response = client.get("/games", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+    assert response.content == b""
+
+    response = client.get("/games", headers={"If-None-Match": '"stale"'})
+    assert response.status_code == 200
+    assert response.json()[0]["external_id"] == "test_game_1"
+
+
+def test_list_games_serves_cache_until_games_change(client, game, db_session):
+    first = client.get("/games")
+
+    db_session.add(
+        make_listed_game("late_add", datetime.now(timezone.utc) + timedelta(hours=3))
+    )
+    db_session.commit()
+    assert client.get("/games").content == first.content
+
+    publish(GAMES_CHANGED, session=db_session)
+
+    response = client.get("/games")
+    assert response.headers["ETag"] != first.headers["ETag"]
+    assert [g["external_id"] for g in response.json()] == [
+        "test_game_1",
+        "late_add",
+    ]
+
+
+def test_list_games_caches_only_the_default_page_size(client, game):
+    response = client.get("/games", params={"limit": 10})
+    assert response.status_code == 200
+    assert "ETag" not in response.headers
+    assert response.json()[0]["external_id"] == "test_game_1"
+
+    client.get("/games", params={"status": "upcoming"})
+    assert games_cache.get(GameStatus.UPCOMING) is not None
+    assert games_cache.get(None) is None
+
+
+def test_list_games_cache_matches_uncached_response(client, game):
+    cached = client.get("/games", params={"status": "upcoming"})
+    uncached = client.get("/games", params={"status": "upcoming", "team": "a"})
+
+    assert "ETag" in cached.headers
+    assert "ETag" not in uncached.headers
+    assert cached.content == uncached.content
+
+
+def test_query_stats_headers_in_debug_mode(client, game):
+    with patch("betting.api.http_api.config.DEBUG", True):
+        response = client.get("/games")
+
+    assert int(response.headers["X-Query-Count"]) >= 1
+    assert int(response.headers["X-Query-Rows"]) == 1
+    assert float(response.headers["X-Query-Time-Ms"]) > 0
+
+
+def test_query_stats_headers_hidden_by_default(client, game):
+    response = client.get("/games")
+    assert "X-Query-Count" not in response.headers
+
+
+@pytest.mark.parametrize(
+    "schema, columns",
+    [(GameResponse, GAME_VIEW_COLUMNS), (BetResponse, BET_VIEW_COLUMNS)],
+)
+def test_view_columns_cover_response_fields(schema, columns):
+    assert set(schema.model_fields) <= {column.key for column in columns}
+
+
+def test_list_games_paginates_in_commence_order(client, db_session):
+    start = datetime.now(timezone.utc) + timedelta(hours=1)
+    db_session.add_all(
+        [make_listed_game(f"g{i}", start + timedelta(hours=i)) for i in range(5)]
+    )
+    db_session.commit()
+
+    response = client.get("/games", params={"limit": 3})
+    assert [g["external_id"] for g in response.json()] == ["g0", "g1", "g2"]
+
+    response = client.get(
+        "/games", params={"limit": 3, "cursor": response.headers["X-Next-Cursor"]}
+    )
+    assert [g["external_id"] for g in response.json()] == ["g3", "g4"]
+    assert "X-Next-Cursor" not in response.headers
+
+
+def test_list_games_marks_started_games_in_progress(client, game, db_session):
+    game.commence_time = datetime.now(timezone.utc) - timedelta(minutes=1)
+    db_session.commit()
+    game_status_sweeper.reset()
+
+    response = client.get("/games?status=upcoming")
+    assert response.status_code == 200
+    assert response.json() == []
+
+    response = client.get("/games?status=in_progress")
+    assert [g["id"] for g in response.json()] == [str(game.id)]
+
+
+def test_list_games_opens_a_write_session_only_for_a_due_sweep(client, game):
+    open_session = app.dependency_overrides[get_session_scope]()
+    opened = []
+
+    def session_scope():
+        opened.append(True)
+        return open_session()
+
+    app.dependency_overrides[get_session_scope] = lambda: session_scope
+    game_status_sweeper.reset()
+
+    client.get("/games")
+    client.get("/games")
+    assert len(opened) == 1
+
+    game_status_sweeper.reset()
+    client.get("/games")
+    assert len(opened) == 2
+
+
+def test_game_history_exports_completed_games_as_arrow(client, game, db_session):
+    pa = pytest.importorskip("pyarrow")
+    completed = make_listed_game(
+        "history_game",
+        datetime(2026, 1, 10, tzinfo=timezone.utc),
+        status=GameStatus.COMPLETED,
+        home_score=101,
+        away_score=99,
+    )
+    db_session.add(completed)
+    db_session.commit()
+
+    response = client.get("/games/history")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/vnd.apache.arrow.file"
+    table = pa.ipc.open_file(pa.py_buffer(response.content)).read_all()
+    assert table.column("id").to_pylist() == [str(completed.id)]
+    assert table.column("home_score").to_pylist() == [101]
+    assert table.column("season").to_pylist() == ["2025-26"]
+
+
 def test_place_bet_success(client, user, game):
     response = client.post(
         "/bets",
@@ -182,6 +506,8 @@ def test_place_bet_success(client, user, game):
     assert data["bet_type"] == "moneyline"
     assert data["selection"] == "home"
     assert data["status"] == "pending"
+    assert (data["home_team"], data["away_team"]) == ("Lakers", "Warriors")
+    assert response.headers["X-Consistency-Token"].isdigit()
 
 
 def test_place_bet_insufficient_balance(client, user, game):
@@ -257,6 +583,105 @@ def test_get_user_bets_with_bets(client, user, game):
     assert bets[0]["stake"] == "100.00"
 
 
+def test_get_user_bets_names_teams_of_games_no_longer_listed(
+    client, user, game, db_session
+):
+    client.post(
+        "/bets",
+        params={"user_id": str(user.id)},
+        json={
+            "game_id": str(game.id),
+            "bet_type": "moneyline",
+            "selection": "home",
+            "stake": "10.00",
+        },
+    )
+    game.commence_time = datetime.now(timezone.utc) - timedelta(days=30)
+    game.status = GameStatus.COMPLETED
+    db_session.commit()
+
+    assert client.get("/games").json() == []
+    [bet] = client.get(f"/users/{user.id}/bets").json()
+    assert (bet["home_team"], bet["away_team"]) == ("Lakers", "Warriors")
+
+
+def test_get_user_bets_paginates_with_cursor_header(client, user, game):
+    for _ in range(3):
+        client.post(
+            "/bets",
+            params={"user_id": str(user.id)},
+            json={
+                "game_id": str(game.id),
+                "bet_type": "moneyline",
+                "selection": "home",
+                "stake": "10.00",
+            },
+        )
+
+    response = client.get(f"/users/{user.id}/bets", params={"limit": 2})
+    assert response.status_code == 200
+    assert len(response.json()) == 2
+    cursor = response.headers["X-Next-Cursor"]
+
+    response = client.get(
+        f"/users/{user.id}/bets", params={"limit": 2, "cursor": cursor}
+    )
+    assert len(response.json()) == 1
+    assert "X-Next-Cursor" not in response.headers
+
+
+def test_get_user_bets_invalid_cursor(client, user):
+    response = client.get(f"/users/{user.id}/bets", params={"cursor": "garbage"})
+    assert response.status_code == 400
+
+
+def test_export_user_bets_ndjson_joins_game(client, user, game):
+    for stake in ("10.00", "20.00"):
+        client.post(
+            "/bets",
+            params={"user_id": str(user.id)},
+            json={
+                "game_id": str(game.id),
+                "bet_type": "spread",
+                "selection": "away",
+                "stake": stake,
+            },
+        )
+
+    response = client.get(f"/users/{user.id}/bets/export")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert [row["stake"] for row in rows] == ["10.00", "20.00"]
+    assert rows[0]["home_team"] == "Lakers"
+    assert rows[0]["away_spread"] == "5.5"
+    assert rows[0]["game_status"] == "upcoming"
+    assert rows[0]["home_score"] is None
+
+
+def test_export_user_bets_csv(client, user, game):
+    client.post(
+        "/bets",
+        params={"user_id": str(user.id)},
+        json={
+            "game_id": str(game.id),
+            "bet_type": "moneyline",
+            "selection": "home",
+            "stake": "10.00",
+        },
+    )
+
+    response = client.get(f"/users/{user.id}/bets/export", params={"format": "csv"})
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    assert f"bets-{user.id}.csv" in response.headers["content-disposition"]
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert len(rows) == 1
+    assert rows[0]["bet_type"] == "moneyline"
+    assert rows[0]["home_moneyline"] == "-110.00"
+    assert rows[0]["settled_at"] == ""
+
+
 def test_get_balance(client, user):
     response = client.get(f"/users/{user.id}/balance")
     assert response.status_code == 200
@@ -271,6 +696,113 @@ def test_get_balance_user_not_found(client):
     assert "User not found" in response.json()["detail"]
 
 
+def test_get_performance_after_settlement(client, user, game, db_session):
+    for selection in ("home", "away"):
+        client.post(
+            "/bets",
+            params={"user_id": str(user.id)},
+            json={
+                "game_id": str(game.id),
+                "bet_type": "moneyline",
+                "selection": selection,
+                "stake": "100.00",
+            },
+        )
+    game.status = GameStatus.COMPLETED
+    game.home_score, game.away_score = 110, 100
+    db_session.commit()
+    BetSettlementService(db_session).settle_bets_for_games([game])
+
+    response = client.get(f"/users/{user.id}/performance")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total_bets"] == 2
+    assert data["record"] == {"won": 1, "lost": 1, "push": 0}
+    assert data["win_rate"] == 0.5
+    assert data["total_staked"] == "200.00"
+    assert data["net_profit"] == "-9.09"
+    assert data["breakdown"]["by_bet_type"]["moneyline"]["count"] == 2
+
+
+def test_get_performance_without_settled_bets(client, user):
+    response = client.get(f"/users/{user.id}/performance")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total_bets"] == 0
+    assert data["roi"] is None
+    assert data["breakdown"] == {"by_bet_type": {}, "by_month": []}
+
+
+def test_get_stats_after_settlement(client, user, game, db_session):
+    for bet_type, selection in [("moneyline", "home"), ("spread", "away")]:
+        client.post(
+            "/bets",
+            params={"user_id": str(user.id)},
+            json={
+                "game_id": str(game.id),
+                "bet_type": bet_type,
+                "selection": selection,
+                "stake": "100.00",
+            },
+        )
+    game.status = GameStatus.COMPLETED
+    game.home_score, game.away_score = 110, 100
+    db_session.commit()
+    BetSettlementService(db_session).settle_bets_for_games([game])
+
+    response = client.get(f"/users/{user.id}/stats")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert (data["total_wins"], data["total_losses"]) == (1, 1)
+    assert data["by_bet_type"]["moneyline"]["pnl"] == "90.91"
+    assert [team["team_name"] for team in data["best_teams"]] == ["Lakers"]
+    assert [team["team_name"] for team in data["worst_teams"]] == ["Warriors"]
+    assert abs(data["current_streak"]) == 1
+
+    teams = client.get(f"/users/{user.id}/stats/teams").json()
+    assert [team["team_name"] for team in teams] == ["Lakers", "Warriors"]
+    assert teams[0]["bets_against"] == 1
+    assert teams[0]["pnl_against"] == "-100.00"
+
+
+def test_team_stats_for_current_season(client, game, db_session):
+    assert client.get("/teams/stats").json() == []
+
+    game.status = GameStatus.COMPLETED
+    game.home_score, game.away_score = 110, 100
+    db_session.commit()
+    TeamStatsService(db_session).refresh()
+
+    response = client.get("/teams/stats")
+
+    assert response.status_code == 200
+    teams = response.json()
+    assert [team["team_name"] for team in teams] == ["Lakers", "Warriors"]
+    assert (teams[0]["wins"], teams[0]["ats_wins"], teams[0]["unders"]) == (1, 1, 1)
+    assert teams[1]["recent_su"] == "L"
+
+    etag = response.headers["ETag"]
+    response = client.get("/teams/stats", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+
+
+def test_team_stats_by_season(client):
+    assert client.get("/teams/stats", params={"season": "2019-20"}).json() == []
+    assert client.get("/teams/stats", params={"season": "2019"}).status_code == 422
+
+
+def test_get_stats_user_not_found(client):
+    assert client.get(f"/users/{uuid4()}/stats").status_code == 404
+    assert client.get(f"/users/{uuid4()}/stats/teams").status_code == 404
+
+
+def test_get_performance_user_not_found(client):
+    response = client.get(f"/users/{uuid4()}/performance")
+    assert response.status_code == 404
+
+
 def test_balance_decreases_after_bet(client, user, game):
     client.post(
         "/bets",
@@ -298,6 +830,7 @@ def test_create_user(client):
     assert data["username"] == "newuser"
     assert data["balance"] == "1000.00"
     assert "id" in data
+    assert "X-Consistency-Token" in response.headers
 
 
 def test_create_user_custom_balance(client):
@@ -400,12 +933,14 @@ def test_admin_fetch_games_success(mock_sync_service, mock_config, client):
         headers={"X-Admin-Key": "test-key"},
     )
 
-    assert response.status_code == 200
+    assert response.status_code == 202
     data = response.json()
-    assert data["status"] == "success"
-    assert data["created"] == 5
-    assert data["updated"] == 2
-    assert data["total"] == 7
+    assert response.headers["Location"] == f"/admin/jobs/{data['id']}"
+    assert data["job_type"] == "fetch_games"
+    assert data["status"] == "succeeded"
+    assert data["result"]["created"] == 5
+    assert data["result"]["updated"] == 2
+    assert data["result"]["total"] == 7
     mock_service_instance.sync_games.assert_called_once()
 
 
@@ -426,10 +961,11 @@ def test_admin_score_games_success(mock_scoring_service, mock_config, client):
         headers={"X-Admin-Key": "test-key"},
     )
 
-    assert response.status_code == 200
+    assert response.status_code == 202
     data = response.json()
-    assert data["status"] == "success"
-    assert data["games_updated"] == 3
+    assert data["status"] == "succeeded"
+    assert data["result"]["games_updated"] == 3
+    assert data["result"]["team_stats"]["mode"] == "full"
     mock_service_instance.update_completed_games.assert_called_once_with(days_from=2)
 
 
@@ -466,10 +1002,312 @@ def test_admin_settle_bets_success(
         headers={"X-Admin-Key": "test-key"},
     )
 
+    assert response.status_code == 202
+    data = response.json()
+    assert data["status"] == "succeeded"
+    assert data["result"]["bets_settled"] == 4
+    assert data["result"]["won"] == 2
+    assert data["result"]["lost"] == 1
+    assert data["result"]["push"] == 1
+    assert data["progress"] == "Settling bets for completed games"
+    assert data["duration_seconds"] >= 0
+
+
+@patch("betting.api.http_api.config")
+@patch("betting.api.http_api.GameScoringService")
+def test_admin_job_failure_is_recorded(mock_scoring_service, mock_config, client):
+    mock_config.ADMIN_API_KEY = "test-key"
+    mock_scoring_service.return_value.update_completed_games.side_effect = RuntimeError(
+        "upstream timeout"
+    )
+
+    response = client.post("/admin/score-games", headers={"X-Admin-Key": "test-key"})
+
+    assert response.status_code == 202
+    job_id = response.json()["id"]
+    response = client.get(f"/admin/jobs/{job_id}", headers={"X-Admin-Key": "test-key"})
     assert response.status_code == 200
     data = response.json()
-    assert data["status"] == "success"
-    assert data["bets_settled"] == 4
-    assert data["won"] == 2
-    assert data["lost"] == 1
-    assert data["push"] == 1
+    assert data["status"] == "failed"
+    assert data["error"] == "RuntimeError: upstream timeout"
+    assert data["finished_at"] is not None
+
+
+@patch("betting.api.http_api.config")
+@patch("betting.api.http_api.GameScoringService")
+def test_admin_job_already_running_is_not_started_again(
+    mock_scoring_service, mock_config, client, db_session
+):
+    mock_config.ADMIN_API_KEY = "test-key"
+    running = Job(job_type=JobType.SCORE_GAMES, status=JobStatus.RUNNING)
+    db_session.add(running)
+    db_session.commit()
+
+    response = client.post("/admin/score-games", headers={"X-Admin-Key": "test-key"})
+
+    assert response.status_code == 202
+    assert response.json()["id"] == str(running.id)
+    assert response.json()["status"] == "running"
+    mock_scoring_service.assert_not_called()
+
+
+@pytest.fixture
+def file_database(tmp_path):
+    # A file-backed database takes real write locks, which StaticPool hides
+    db = Database(f"sqlite:///{tmp_path / 'betting.db'}")
+    Base.metadata.create_all(db.engine)
+    with db.get_session() as session:
+        user = User(username="bettor", balance=Decimal("100.00"))
+        game = Game(
+            external_id="finished",
+            home_team="Lakers",
+            away_team="Warriors",
+            commence_time=datetime.now(timezone.utc) - timedelta(hours=3),
+            status=GameStatus.COMPLETED,
+            home_score=110,
+            away_score=100,
+        )
+        session.add_all([user, game])
+        session.flush()
+        session.add(
+            Bet(
+                user_id=user.id,
+                game_id=game.id,
+                bet_type=BetType.MONEYLINE,
+                selection=BetSelection.HOME,
+                odds=Decimal("-110"),
+                stake=Decimal("10.00"),
+                potential_payout=Decimal("19.09"),
+            )
+        )
+    yield db
+    db.engine.dispose()
+
+
+def run_job_on(db: Database, job_type: JobType) -> Job:
+    runner = JobRunner(
+        ADMIN_JOBS, db.get_session, InlineExecutor(), stale_after=timedelta(minutes=15)
+    )
+    started = time.perf_counter()
+    job_id, _ = runner.submit(job_type)
+
+    # Well inside the 5 s busy timeout: nothing waited on the job's lock
+    assert time.perf_counter() - started < 2
+    with db.get_read_session() as session:
+        return session.get(Job, job_id)
+
+
+def test_settle_job_on_file_backed_sqlite_records_progress(file_database):
+    job = run_job_on(file_database, JobType.SETTLE_BETS)
+
+    assert job.status == JobStatus.SUCCEEDED
+    assert job.progress == "Settling bets for completed games"
+    assert job.result["bets_settled"] == 1
+
+
+@patch("betting.api.http_api.GameScoringService")
+def test_score_job_on_file_backed_sqlite_records_progress(
+    mock_scoring_service, file_database
+):
+    def update_completed_games(days_from):
+        # Like the real service: commit, then hand back the (expired) games
+        session = mock_scoring_service.call_args.args[0]
+        games = session.query(Game).all()
+        session.commit()
+        return games
+
+    mock_scoring_service.return_value.update_completed_games = update_completed_games
+
+    job = run_job_on(file_database, JobType.SCORE_GAMES)
+
+    assert job.status == JobStatus.SUCCEEDED
+    assert job.progress == "Refreshing team stats"
+    assert job.result["team_stats"]["teams"] == 2
+
+
+@patch("betting.api.http_api.config")
+def test_admin_job_not_found(mock_config, client):
+    mock_config.ADMIN_API_KEY = "test-key"
+    response = client.get(f"/admin/jobs/{uuid4()}", headers={"X-Admin-Key": "test-key"})
+    assert response.status_code == 404
+
+
+def test_admin_job_requires_auth(client):
+    response = client.get(
+        f"/admin/jobs/{uuid4()}", headers={"X-Admin-Key": "wrong-key"}
+    )
+    assert response.status_code == 401
+
+
+@patch("betting.api.http_api.config")
+def test_admin_db_pool_reports_each_pool(mock_config, client, tmp_path):
+    mock_config.ADMIN_API_KEY = "test-key"
+    db = Database(f"sqlite:///{tmp_path / 'betting.db'}")
+
+    with patch("betting.api.http_api.get_db", return_value=db):
+        response = client.get("/admin/db-pool", headers={"X-Admin-Key": "test-key"})
+
+    assert response.status_code == 200
+    [pool] = response.json()
+    assert pool["name"] == "primary"
+    assert pool["pool_class"] == "QueuePool"
+    assert pool["max_connections"] == 15
+    db.engine.dispose()
+
+
+@patch("betting.api.http_api.config")
+def test_admin_slow_queries_newest_first(mock_config, client):
+    mock_config.ADMIN_API_KEY = "test-key"
+    for ms in (120.0, 250.0):
+        slow_query_log.record(
+            SlowQuery(
+                recorded_at=datetime.now(timezone.utc),
+                database="primary",
+                duration_ms=ms,
+                statement="SELECT * FROM bets WHERE user_id = ?",
+                parameters=["<str>"],
+                caller="betting.repositories.bet_repository.BetRepository.find",
+                plan=["SCAN bets"],
+            )
+        )
+
+    response = client.get(
+        "/admin/slow-queries", params={"limit": 1}, headers={"X-Admin-Key": "test-key"}
+    )
+    slow_query_log.clear()
+
+    assert response.status_code == 200
+    [entry] = response.json()
+    assert entry["duration_ms"] == 250.0
+    assert entry["plan"] == ["SCAN bets"]
+
+
+def test_list_odds_snapshots(client, game, db_session):
+    captured_at = datetime.now(timezone.utc)
+    db_session.add_all(
+        [
+            OddsSnapshot(
+                game_id=game.id,
+                captured_at=captured_at - timedelta(minutes=10),
+                last_seen_at=captured_at - timedelta(minutes=5),
+                bookmaker="betmgm",
+                home_moneyline=-110,
+            ),
+            OddsSnapshot(
+                game_id=game.id,
+                captured_at=captured_at,
+                last_seen_at=captured_at,
+                bookmaker="betmgm",
+                home_moneyline=-120,
+                home_spread=Decimal("-6.5"),
+            ),
+        ]
+    )
+    db_session.commit()
+
+    response = client.get("/odds/snapshots", params={"game_id": str(game.id)})
+    assert response.status_code == 200
+    snapshots = response.json()
+    assert [s["home_moneyline"] for s in snapshots] == [-110, -120]
+    assert snapshots[1]["home_spread"] == "-6.5"
+
+
+def test_list_odds_snapshots_game_not_found(client):
+    response = client.get("/odds/snapshots", params={"game_id": str(uuid4())})
+    assert response.status_code == 404
+
+
+def test_get_odds_series(client, game, db_session):
+    start = datetime(2024, 1, 15, 12, 0, tzinfo=timezone.utc)
+    db_session.add_all(
+        [
+            OddsSnapshot(
+                game_id=game.id,
+                captured_at=start,
+                last_seen_at=start + timedelta(minutes=20),
+                sample_count=5,
+                bookmaker="betmgm",
+                home_moneyline=-110,
+            ),
+            OddsSnapshot(
+                game_id=game.id,
+                captured_at=start + timedelta(minutes=25),
+                last_seen_at=start + timedelta(minutes=25),
+                bookmaker="betmgm",
+                home_moneyline=-130,
+            ),
+        ]
+    )
+    db_session.commit()
+
+    response = client.get(
+        "/odds/series",
+        params={
+            "game_id": str(game.id),
+            "start": (start - timedelta(minutes=10)).isoformat(),
+            "end": (start + timedelta(minutes=30)).isoformat(),
+            "step_seconds": 600,
+        },
+    )
+    assert response.status_code == 200
+    points = response.json()
+    assert [p["home_moneyline"] for p in points] == [None, -110, -110, -110, -130]
+
+    response = client.get(
+        "/odds/as-of",
+        params={
+            "game_id": str(game.id),
+            "at": (start + timedelta(minutes=24)).isoformat(),
+        },
+    )
+    assert response.status_code == 200
+    assert response.json()["home_moneyline"] == -110
+    assert response.json()["sample_count"] == 5
+
+
+def test_get_odds_series_takes_naive_times_as_utc(client, game, db_session):
+    start = datetime(2024, 1, 15, 12, 0, tzinfo=timezone.utc)
+    db_session.add(
+        OddsSnapshot(
+            game_id=game.id,
+            captured_at=start,
+            last_seen_at=start,
+            bookmaker="betmgm",
+            home_moneyline=-110,
+        )
+    )
+    db_session.commit()
+
+    response = client.get(
+        "/odds/series",
+        params={
+            "game_id": str(game.id),
+            "start": "2024-01-15T11:50:00",
+            "end": "2024-01-15T12:10:00Z",
+            "step_seconds": 600,
+        },
+    )
+    assert response.status_code == 200
+    points = response.json()
+    assert [p["home_moneyline"] for p in points] == [None, -110, -110]
+    assert datetime.fromisoformat(points[1]["at"]) == start
+
+    response = client.get(
+        "/odds/as-of",
+        params={"game_id": str(game.id), "at": "2024-01-15T12:05:00"},
+    )
+    assert response.status_code == 200
+    assert response.json()["home_moneyline"] == -110
+
+
+def test_get_odds_series_rejects_too_many_points(client, game):
+    response = client.get(
+        "/odds/series",
+        params={
+            "game_id": str(game.id),
+            "start": "2024-01-01T00:00:00Z",
+            "end": "2024-06-01T00:00:00Z",
+            "step_seconds": 1,
+        },
+    )
+    assert response.status_code == 400
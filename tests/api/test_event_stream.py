@@ -0,0 +1,133 @@
+import asyncio
+from uuid import uuid4
+
+import pytest
+
+from betting.api.event_stream import RESET_EVENT, EventBroker, sse_stream
+from betting.api.http_api import event_broker
+from betting.events import ODDS_CHANGED, publish
+
+
+class FakeRequest:
+    """Stands in for a Starlette request; disconnects after `polls` checks."""
+
+    def __init__(self, polls: int = 1):
+        self.polls = polls
+
+    async def is_disconnected(self) -> bool:
+        self.polls -= 1
+        return self.polls < 0
+
+
+def collect(stream) -> list[bytes]:
+    async def run():
+        return [chunk async for chunk in stream]
+
+    return asyncio.run(run())
+
+
+@pytest.fixture
+def broker():
+    return EventBroker(buffer_size=4)
+
+
+class TestEventBroker:
+    def test_events_after_returns_newer_events_in_order(self, broker: EventBroker):
+        start = broker.last_id
+        for i in range(3):
+            broker.publish("odds_changed", {"n": i})
+
+        events = broker.events_after(start + 1)
+
+        assert [event.data for event in events] == [b'{"n":1}', b'{"n":2}']
+
+    def test_replay_is_possible_only_while_buffered(self, broker: EventBroker):
+        start = broker.last_id
+        for i in range(6):
+            broker.publish("odds_changed", {"n": i})
+
+        assert not broker.can_replay(start)
+        assert broker.can_replay(broker.last_id - 4)
+        assert broker.can_replay(broker.last_id)
+        assert len(broker.events_after(start)) == 4
+
+    def test_relay_keeps_owner_of_private_payloads(self, broker: EventBroker):
+        user_id = uuid4()
+        broker.relay("bet_settled", [{"game_id": uuid4(), "user_id": user_id}])
+
+        (event,) = broker.events_after(broker.last_id - 1)
+
+        assert event.user_id == user_id
+        assert event.visible_to(user_id)
+        assert not event.visible_to(uuid4())
+        assert not event.visible_to(None)
+
+    def test_wait_wakes_on_publish_from_another_thread(self, broker: EventBroker):
+        async def run():
+            cursor = broker.last_id
+            waiter = asyncio.create_task(broker.wait(cursor))
+            await asyncio.sleep(0)
+            await asyncio.to_thread(broker.publish, "game_started", {})
+            await asyncio.wait_for(waiter, 1)
+
+        asyncio.run(run())
+
+
+class TestSseStream:
+    def test_replays_events_after_cursor(self, broker: EventBroker):
+        cursor = broker.last_id
+        broker.publish("game_started", {"game_id": "a"})
+
+        chunks = collect(sse_stream(broker, FakeRequest(), cursor, keepalive=0.01))
+
+        assert chunks[0] == (
+            b'id: %d\nevent: game_started\ndata: {"game_id":"a"}\n\n' % (cursor + 1)
+        )
+
+    def test_resets_when_cursor_fell_out_of_buffer(self, broker: EventBroker):
+        cursor = broker.last_id
+        for i in range(6):
+            broker.publish("odds_changed", {"n": i})
+
+        chunks = collect(sse_stream(broker, FakeRequest(), cursor, keepalive=0.01))
+
+        assert chunks[0].startswith(
+            b"id: %d\nevent: %s\n" % (broker.last_id, RESET_EVENT.encode())
+        )
+        assert not any(b"odds_changed" in chunk for chunk in chunks)
+
+    def test_filters_private_events_and_types(self, broker: EventBroker):
+        user_id = uuid4()
+        cursor = broker.last_id
+        broker.relay("bet_settled", [{"user_id": user_id}, {"user_id": uuid4()}])
+        broker.publish("odds_changed", {})
+        broker.publish("game_started", {})
+
+        chunks = collect(
+            sse_stream(
+                broker,
+                FakeRequest(),
+                cursor,
+                user_id=user_id,
+                types={"bet_settled", "game_started"},
+                keepalive=0.01,
+            )
+        )
+
+        events = [chunk.split(b"\n")[1] for chunk in chunks if chunk.startswith(b"id")]
+        assert events == [b"event: bet_settled", b"event: game_started"]
+        assert str(user_id).encode() in chunks[0]
+
+    def test_sends_keepalive_while_idle(self, broker: EventBroker):
+        chunks = collect(sse_stream(broker, FakeRequest(), None, keepalive=0.01))
+
+        assert chunks == [b": keepalive\n\n"]
+
+
+def test_api_broker_relays_domain_events():
+    cursor = event_broker.last_id
+    publish(ODDS_CHANGED, payloads=[{"game_id": "a"}, {"game_id": "b"}])
+
+    events = event_broker.events_after(cursor)
+    assert [event.type for event in events] == [ODDS_CHANGED, ODDS_CHANGED]
+    assert [event.user_id for event in events] == [None, None]
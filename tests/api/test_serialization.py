@@ -0,0 +1,114 @@
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+import pytest
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from betting.api.schemas import BetResponse, GameResponse, OddsSnapshotResponse
+from betting.api.serialization import RowSerializer
+from betting.models import Base, Bet, BetSelection, BetType, Game, GameStatus, User
+from betting.models.odds_snapshot import OddsSnapshot
+from betting.repositories import BetRepository, GameRepository
+from betting.repositories import OddsSnapshotRepository
+
+
+@pytest.fixture
+def db_session():
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine)
+    session = Session()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def game(db_session):
+    game = Game(
+        external_id="game_ñ",
+        home_team="Señores",
+        away_team="Warriors",
+        commence_time=datetime.now(timezone.utc) + timedelta(hours=2),
+        home_moneyline=Decimal("-110"),
+        away_moneyline=Decimal("120.50"),
+        home_spread=Decimal("-5.5"),
+        home_spread_odds=Decimal("-110"),
+        away_spread=Decimal("5.5"),
+        away_spread_odds=Decimal("-110"),
+        total_points=Decimal("215"),
+        over_odds=Decimal("-110"),
+        under_odds=Decimal("-110"),
+        status=GameStatus.UPCOMING,
+    )
+    db_session.add(game)
+    db_session.commit()
+    return game
+
+
+def response_model_json(model, items):
+    """What FastAPI renders for `items` through response_model=list[model]."""
+    adapter = TypeAdapter(list[model])
+    validated = adapter.validate_python(items, from_attributes=True)
+    return JSONResponse(adapter.dump_python(validated, mode="json")).body
+
+
+def test_game_rows_match_response_model_bytes(db_session, game):
+    rows = GameRepository(db_session).find_games_with_lines()
+
+    assert RowSerializer(GameResponse).dump_rows(rows) == response_model_json(
+        GameResponse, rows
+    )
+
+
+def test_bet_rows_match_response_model_bytes(db_session, game):
+    user = User(username="bettor", balance=Decimal("100"))
+    db_session.add(user)
+    db_session.flush()
+    db_session.add(
+        Bet(
+            user_id=user.id,
+            game_id=game.id,
+            bet_type=BetType.SPREAD,
+            selection=BetSelection.AWAY,
+            odds=Decimal("-110"),
+            stake=Decimal("25.00"),
+            potential_payout=Decimal("47.73"),
+        )
+    )
+    db_session.commit()
+
+    rows = BetRepository(db_session).find_bet_history_page(user.id)
+
+    # created_at is selected for the cursor but is not part of BetResponse
+    assert RowSerializer(BetResponse).dump_rows(rows) == response_model_json(
+        BetResponse, rows
+    )
+    assert b"created_at" not in RowSerializer(BetResponse).dump_rows(rows)
+
+
+def test_orm_objects_match_response_model_bytes(db_session, game):
+    db_session.add(
+        OddsSnapshot(
+            game_id=game.id,
+            captured_at=datetime.now(timezone.utc),
+            last_seen_at=datetime.now(timezone.utc),
+            bookmaker="betmgm",
+            home_moneyline=-110,
+            total_points=Decimal("215.5"),
+        )
+    )
+    db_session.commit()
+
+    snapshots = OddsSnapshotRepository(db_session).find_by_game(game.id)
+
+    assert RowSerializer(OddsSnapshotResponse).dump_objects(
+        snapshots
+    ) == response_model_json(OddsSnapshotResponse, snapshots)
+
+
+def test_empty_list(db_session):
+    assert RowSerializer(GameResponse).dump_rows([]) == b"[]"
+    assert RowSerializer(GameResponse).dump_objects([]) == b"[]"
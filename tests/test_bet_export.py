@@ -0,0 +1,120 @@
+import csv
+import io
+import json
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm.session import Session
+
+from betting.models import Base, Bet, BetSelection, BetStatus, BetType
+from betting.models import Game, GameStatus, User
+from betting.repositories import BetRepository
+from betting.repositories.bet_repository import BET_EXPORT_COLUMNS
+from betting.services import BetExportService, ExportFormat
+from betting.services.bet_export import EXPORT_FIELDS
+
+
+@pytest.fixture
+def db_session():
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine)
+    session = Session()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def users(db_session: Session):
+    users = [User(username="alice"), User(username="bob")]
+    game = Game(
+        external_id="game1",
+        home_team="Lakers",
+        away_team="Warriors",
+        commence_time=datetime(2026, 1, 10, tzinfo=timezone.utc),
+        status=GameStatus.COMPLETED,
+        home_moneyline=Decimal("-150"),
+        home_score=110,
+        away_score=100,
+    )
+    db_session.add_all(users + [game])
+    db_session.flush()
+
+    placed = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    for i in range(5):
+        for user in users:
+            db_session.add(
+                Bet(
+                    user_id=user.id,
+                    game_id=game.id,
+                    bet_type=BetType.MONEYLINE,
+                    selection=BetSelection.HOME,
+                    odds=Decimal("-150"),
+                    stake=Decimal(i + 1),
+                    potential_payout=Decimal("16.67"),
+                    status=BetStatus.WON,
+                    created_at=placed + timedelta(hours=i),
+                )
+            )
+    db_session.commit()
+    return users
+
+
+class TestStreamBetExport:
+    def test_yields_batches_oldest_first(self, db_session: Session, users):
+        batches = list(
+            BetRepository(db_session).stream_bet_export(users[0].id, batch_size=2)
+        )
+
+        assert [len(batch) for batch in batches] == [2, 2, 1]
+        rows = [row for batch in batches for row in batch]
+        assert [row.stake for row in rows] == [Decimal(i) for i in range(1, 6)]
+        assert all(row.user_id == users[0].id for row in rows)
+        assert rows[0].home_score == 110
+        assert rows[0].game_status == GameStatus.COMPLETED
+
+    def test_without_user_exports_everyone(self, db_session: Session, users):
+        batches = BetRepository(db_session).stream_bet_export(batch_size=100)
+
+        assert sum(len(batch) for batch in batches) == 10
+
+    def test_export_fields_follow_columns(self):
+        assert EXPORT_FIELDS[0] == "bet_id"
+        assert len(EXPORT_FIELDS) == len(set(EXPORT_FIELDS)) == len(BET_EXPORT_COLUMNS)
+
+
+class TestBetExportService:
+    def test_ndjson_is_one_object_per_line(self, db_session: Session, users):
+        chunks = BetExportService(db_session, batch_size=2).export(
+            ExportFormat.NDJSON, user_id=users[1].id
+        )
+        chunks = list(chunks)
+
+        assert len(chunks) == 3
+        rows = [json.loads(line) for line in b"".join(chunks).splitlines()]
+        assert len(rows) == 5
+        assert list(rows[0]) == EXPORT_FIELDS
+        assert rows[0]["status"] == "won"
+        assert rows[0]["home_moneyline"] == "-150.00"
+
+    def test_csv_has_header_and_plain_values(self, db_session: Session, users):
+        body = b"".join(
+            BetExportService(db_session, batch_size=3).export(
+                ExportFormat.CSV, user_id=users[0].id
+            )
+        )
+
+        rows = list(csv.DictReader(io.StringIO(body.decode())))
+        assert len(rows) == 5
+        assert rows[0]["status"] == "won"
+        assert rows[0]["game_status"] == "completed"
+        assert rows[0]["created_at"].startswith("2026-01-01T00:00:00")
+        assert rows[0]["away_moneyline"] == ""
+
+    def test_csv_without_bets_is_header_only(self, db_session: Session):
+        body = b"".join(BetExportService(db_session).export(ExportFormat.CSV))
+
+        assert body.decode().splitlines() == [",".join(EXPORT_FIELDS)]
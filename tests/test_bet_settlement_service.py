@@ -0,0 +1,131 @@
+from datetime import datetime, timezone
+from decimal import Decimal
+from unittest.mock import MagicMock
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm.session import Session
+
+from betting.events import BET_SETTLED
+from betting.instrumentation import instrument_engine, query_budget
+from betting.models import Base, Bet, BetSelection, BetStatus, BetType
+from betting.models import Game, GameStatus, User
+from betting.repositories import GameRepository
+from betting.services import BetSettlementService
+
+
+@pytest.fixture
+def db_session():
+    engine = instrument_engine(create_engine("sqlite:///:memory:"))
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine)
+    session = Session()
+    yield session
+    session.close()
+
+
+def seed(session: Session, game_count: int, user_count: int):
+    users = [
+        User(username=f"user{i}", balance=Decimal("100.00")) for i in range(user_count)
+    ]
+    games = [
+        Game(
+            external_id=f"game{i}",
+            home_team="Lakers",
+            away_team="Warriors",
+            commence_time=datetime.now(timezone.utc),
+            status=GameStatus.COMPLETED,
+            home_score=110,
+            away_score=100,
+            home_spread=Decimal("-5.5"),
+            away_spread=Decimal("5.5"),
+            total_points=Decimal("215.5"),
+        )
+        for i in range(game_count)
+    ]
+    session.add_all(users + games)
+    session.flush()
+
+    for game in games:
+        for user in users:
+            session.add(
+                Bet(
+                    user_id=user.id,
+                    game_id=game.id,
+                    bet_type=BetType.MONEYLINE,
+                    selection=BetSelection.HOME,
+                    odds=Decimal("-110"),
+                    stake=Decimal("10.00"),
+                    potential_payout=Decimal("19.09"),
+                )
+            )
+    session.commit()
+    # Load games the way the settlement job does, so the budgets below
+    # don't count refreshing them after the commit
+    return (
+        GameRepository(session).find_games_with_pending_bets(GameStatus.COMPLETED),
+        users,
+    )
+
+
+class TestSettleBetsForGames:
+    def test_settles_and_credits_winnings(self, db_session: Session):
+        games, users = seed(db_session, game_count=2, user_count=2)
+
+        settled = BetSettlementService(db_session).settle_bets_for_games(games)
+
+        assert len(settled) == 4
+        assert all(bet.status == BetStatus.WON for bet in settled)
+        assert all(bet.settled_at is not None for bet in settled)
+        assert all(user.balance == Decimal("138.18") for user in users)
+
+    def test_publishes_settlements_with_final_balances(
+        self, db_session: Session, monkeypatch
+    ):
+        publish = MagicMock()
+        monkeypatch.setattr("betting.services.bet_settlement_service.publish", publish)
+        games, users = seed(db_session, game_count=2, user_count=2)
+        user_ids = {user.id for user in users}
+        game_ids = {game.id for game in games}
+
+        BetSettlementService(db_session).settle_bets_for_games(games)
+
+        publish.assert_called_once()
+        assert publish.call_args.args == (BET_SETTLED,)
+        payloads = publish.call_args.kwargs["payloads"]
+        assert len(payloads) == 4
+        assert {p["user_id"] for p in payloads} == user_ids
+        assert {p["game_id"] for p in payloads} == game_ids
+        assert all(p["status"] == BetStatus.WON for p in payloads)
+        assert all(p["payout"] == Decimal("19.09") for p in payloads)
+        assert all(p["balance"] == Decimal("138.18") for p in payloads)
+
+    @pytest.mark.parametrize("size", [1, 10])
+    def test_query_count_does_not_grow_with_games_or_users(
+        self, db_session: Session, size: int
+    ):
+        games, _ = seed(db_session, game_count=size, user_count=size)
+
+        # Select bets, users, performance rows, buckets and team stats, then
+        # one batched statement for each of the five tables
+        with query_budget(10):
+            BetSettlementService(db_session).settle_bets_for_games(games)
+
+
+class TestPreviewSettlements:
+    def test_previews_without_changes(self, db_session: Session):
+        games, users = seed(db_session, game_count=2, user_count=3)
+
+        with query_budget(2):
+            preview = BetSettlementService(db_session).preview_settlements(games)
+
+        assert len(preview["bets"]) == 6
+        assert preview["won_count"] == 6
+        assert preview["total_payout"] == Decimal("114.54")
+        assert {item["user"].username for item in preview["bets"]} == {
+            user.username for user in users
+        }
+        assert [item["game"] for item in preview["bets"]] == [games[0]] * 3 + [
+            games[1]
+        ] * 3
+        assert all(user.balance == Decimal("100.00") for user in users)
@@ -5,8 +5,9 @@ from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.orm.session import Session
 
+from betting.instrumentation import instrument_engine, query_budget
 from betting.models.base import Base
-from betting.models.bet import BetSelection, BetStatus, BetType
+from betting.models.bet import Bet, BetSelection, BetStatus, BetType
 from betting.models.game import Game, GameStatus
 from betting.models.user import User
 from betting.services import BettingService, InsufficientBalanceError, InvalidBetError
@@ -14,7 +15,7 @@ from betting.services import BettingService, InsufficientBalanceError, InvalidBe
 
 @pytest.fixture
 def db_session():
-    engine = create_engine("sqlite:///:memory:")
+    engine = instrument_engine(create_engine("sqlite:///:memory:"))
     Base.metadata.create_all(engine)
     Session = sessionmaker(bind=engine)
     session = Session()
@@ -74,6 +75,16 @@ class TestPlaceBet:
         db_session.refresh(user)
         assert user.balance == Decimal("900.00")
 
+    def test_query_budget(self, db_session: Session, user: User, game: Game):
+        service = BettingService(db_session)
+        user_id, game_id = user.id, game.id
+
+        # Load game and user, insert bet, update balance, then refresh the bet
+        with query_budget(5):
+            service.place_bet(
+                user_id, game_id, BetType.MONEYLINE, BetSelection.HOME, Decimal("10")
+            )
+
     def test_place_spread_bet(self, db_session: Session, user: User, game: Game):
         service = BettingService(db_session)
 
@@ -123,6 +134,24 @@ class TestPlaceBet:
                 user.id, game.id, BetType.MONEYLINE, BetSelection.HOME, Decimal("100")
             )
 
+    def test_bet_on_past_game_marks_it_in_progress(
+        self, db_session: Session, user: User, game: Game
+    ):
+        game.commence_time = datetime.now(timezone.utc) - timedelta(minutes=1)
+        db_session.commit()
+
+        service = BettingService(db_session)
+
+        with pytest.raises(InvalidBetError):
+            service.place_bet(
+                user.id, game.id, BetType.MONEYLINE, BetSelection.HOME, Decimal("100")
+            )
+
+        # Committed by the sweep even though the bet was rejected
+        db_session.rollback()
+        db_session.refresh(game)
+        assert game.status == GameStatus.IN_PROGRESS
+
     def test_odds_not_available(self, db_session: Session, user: User, game: Game):
         game.home_moneyline = None
         db_session.commit()
@@ -165,3 +194,77 @@ class TestGetBets:
 
         history = service.get_bet_history(user.id)
         assert len(history) == 1
+
+
+class TestGetBetHistoryPage:
+    @pytest.fixture
+    def bets(self, db_session: Session, user: User, game: Game):
+        start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        bets = [
+            Bet(
+                user_id=user.id,
+                game_id=game.id,
+                bet_type=BetType.SPREAD if i % 2 else BetType.MONEYLINE,
+                selection=BetSelection.HOME,
+                odds=Decimal("-110"),
+                stake=Decimal("10"),
+                potential_payout=Decimal("19.09"),
+                status=BetStatus.WON if i % 3 == 0 else BetStatus.PENDING,
+                # Pairs share a timestamp so the id tiebreaker is exercised
+                created_at=start + timedelta(hours=i // 2),
+            )
+            for i in range(7)
+        ]
+        db_session.add_all(bets)
+        db_session.commit()
+        return bets
+
+    def test_pages_through_full_history(
+        self, db_session: Session, user: User, bets: list[Bet]
+    ):
+        service = BettingService(db_session)
+
+        seen = []
+        cursor = None
+        while True:
+            page, cursor = service.get_bet_history_page(user.id, limit=3, cursor=cursor)
+            seen.extend(page)
+            if cursor is None:
+                break
+
+        assert len(seen) == 7
+        assert {b.id for b in seen} == {b.id for b in bets}
+        keys = [(b.created_at, str(b.id)) for b in seen]
+        assert keys == sorted(keys, reverse=True)
+
+    def test_filters(self, db_session: Session, user: User, bets: list[Bet]):
+        service = BettingService(db_session)
+
+        won, _ = service.get_bet_history_page(user.id, status=BetStatus.WON)
+        assert len(won) == 3
+
+        spreads, _ = service.get_bet_history_page(user.id, bet_type=BetType.SPREAD)
+        assert len(spreads) == 3
+
+        window, _ = service.get_bet_history_page(
+            user.id,
+            created_from=datetime(2024, 1, 1, 1, tzinfo=timezone.utc),
+            created_to=datetime(2024, 1, 1, 3, tzinfo=timezone.utc),
+        )
+        assert len(window) == 4
+
+    def test_last_page_has_no_cursor(
+        self, db_session: Session, user: User, bets: list[Bet]
+    ):
+        service = BettingService(db_session)
+
+        page, cursor = service.get_bet_history_page(user.id, limit=7)
+
+        assert len(page) == 7
+        assert cursor is None
+
+    def test_invalid_cursor(self, db_session: Session, user: User):
+        service = BettingService(db_session)
+
+        with pytest.raises(InvalidBetError, match="Invalid cursor"):
+            service.get_bet_history_page(user.id, cursor="not-a-cursor")
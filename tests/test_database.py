@@ -0,0 +1,252 @@
+import threading
+import time
+from datetime import timedelta
+
+import pytest
+
+from sqlalchemy.pool import NullPool, QueuePool
+
+from sqlalchemy import select, text
+from sqlalchemy.exc import InvalidRequestError
+
+from betting.database import Database, PoolSettings, issue_consistency_token
+from betting.instrumentation import collect_query_stats
+from betting.models.base import Base
+from betting.models.user import User
+from betting.repositories import UserRepository
+
+
+@pytest.fixture
+def database(tmp_path):
+    # Two independent files stand in for a primary and a replica that has
+    # not caught up yet, so the session each read lands on is observable
+    db = Database(
+        f"sqlite:///{tmp_path / 'primary.db'}",
+        [f"sqlite:///{tmp_path / 'replica.db'}"],
+        max_replica_lag=timedelta(seconds=5),
+    )
+    Base.metadata.create_all(db.engine)
+    Base.metadata.create_all(db.replica_engines[0])
+    yield db
+    db.engine.dispose()
+    db.replica_engines[0].dispose()
+
+
+@pytest.fixture
+def written_user(database):
+    with database.get_session() as session:
+        user = UserRepository(session).create(username="writer", balance=100)
+        user_id = user.id
+    return user_id
+
+
+def read_user(database, user_id, token=None):
+    with database.get_read_session(token) as session:
+        return UserRepository(session).find_by_id(user_id)
+
+
+def test_reads_without_token_go_to_replica(database, written_user):
+    assert read_user(database, written_user) is None
+
+
+def test_fresh_token_reads_own_write_from_primary(database, written_user):
+    token = issue_consistency_token()
+    assert read_user(database, written_user, token).username == "writer"
+
+
+def test_token_older_than_max_lag_goes_to_replica(database, written_user):
+    token = str(int(issue_consistency_token()) - 6000)
+    assert read_user(database, written_user, token) is None
+
+
+def test_malformed_token_falls_back_to_primary(database, written_user):
+    assert read_user(database, written_user, "not-a-token") is not None
+
+
+def test_replicas_are_used_round_robin(tmp_path):
+    urls = [f"sqlite:///{tmp_path / f'replica_{i}.db'}" for i in range(2)]
+    db = Database(f"sqlite:///{tmp_path / 'primary.db'}", urls)
+
+    engines = []
+    for _ in range(4):
+        with db.get_read_session() as session:
+            engines.append(session.get_bind().url)
+
+    assert engines == [engine.url for engine in db.replica_engines] * 2
+
+
+def test_without_replicas_reads_use_primary(tmp_path):
+    db = Database(f"sqlite:///{tmp_path / 'primary.db'}")
+    Base.metadata.create_all(db.engine)
+
+    with db.get_session() as session:
+        session.add(User(username="solo", balance=1))
+
+    with db.get_read_session() as session:
+        assert session.get_bind().url == db.engine.url
+        assert UserRepository(session).find_by_username("solo") is not None
+
+
+def test_read_sessions_skip_transaction_round_trips(database, written_user):
+    with collect_query_stats() as write_stats:
+        with database.get_session() as session:
+            UserRepository(session).find_by_id(written_user)
+
+    with collect_query_stats() as read_stats:
+        with database.get_read_session(issue_consistency_token()) as session:
+            UserRepository(session).find_by_id(written_user)
+
+    # BEGIN and COMMIT per request on the transactional session
+    assert write_stats.transactions == 2
+    assert read_stats.statements == write_stats.statements
+    assert read_stats.transactions == 0
+
+
+def test_read_sessions_refuse_writes(database, written_user):
+    with database.get_read_session(issue_consistency_token()) as session:
+        user = UserRepository(session).find_by_id(written_user)
+        user.balance = 0
+        with pytest.raises(InvalidRequestError):
+            session.flush()
+
+    assert read_user(database, written_user, issue_consistency_token()).balance == 100
+
+
+def test_streaming_read_sessions_run_in_a_transaction(database, written_user):
+    with collect_query_stats() as stats:
+        with database.get_read_session(
+            issue_consistency_token(), streaming=True
+        ) as session:
+            users = session.execute(
+                select(User).execution_options(yield_per=10)
+            ).scalars()
+            assert [user.id for user in users] == [written_user]
+
+            user = UserRepository(session).find_by_id(written_user)
+            user.balance = 0
+            with pytest.raises(InvalidRequestError):
+                session.flush()
+
+    # BEGIN, then ROLLBACK on close
+    assert stats.transactions == 2
+
+
+def test_streaming_reads_go_to_replica(database, written_user):
+    with database.get_read_session(streaming=True) as session:
+        assert session.get_bind().url == database.replica_engines[0].url
+
+
+def test_streaming_reads_do_not_take_the_write_lock(database, written_user):
+    with database.get_read_session(
+        issue_consistency_token(), streaming=True
+    ) as session:
+        assert UserRepository(session).find_by_id(written_user).balance == 100
+
+        # A writer would wait out busy_timeout behind BEGIN IMMEDIATE
+        started = time.perf_counter()
+        with database.get_session() as writer:
+            UserRepository(writer).find_by_id(written_user).balance = 50
+        assert time.perf_counter() - started < 1
+
+        # The read transaction keeps its snapshot
+        session.expire_all()
+        assert UserRepository(session).find_by_id(written_user).balance == 100
+
+
+def test_warm_up_fills_each_pool(database):
+    opened = database.warm_up(3)
+
+    assert opened == 6
+    for engine in [database.engine, *database.replica_engines]:
+        assert engine.pool.checkedin() == 3
+        assert engine.pool.checkedout() == 0
+
+
+def test_warm_up_is_capped_at_pool_size(database):
+    assert database.warm_up(50) == 2 * database.engine.pool.size()
+
+
+def test_pool_settings_apply_to_server_databases():
+    settings = PoolSettings(size=3, max_overflow=2, timeout=5, recycle=60)
+    # psycopg2 is imported but nothing connects until first use
+    db = Database("postgresql+psycopg2://app@localhost/betting", pool_settings=settings)
+
+    pool = db.engine.pool
+    assert isinstance(pool, QueuePool)
+    assert pool.size() == 3
+    assert pool._pre_ping
+    assert pool._recycle == 60
+    assert db.pool_status()[0]["max_connections"] == 5
+
+
+def test_pgbouncer_mode_disables_app_pooling_and_prepares():
+    settings = PoolSettings(pgbouncer=True)
+
+    db = Database(
+        "postgresql+psycopg2://app@localhost:6543/betting", pool_settings=settings
+    )
+    assert isinstance(db.engine.pool, NullPool)
+    assert db.pool_status()[0]["max_connections"] is None
+
+    options = settings.engine_options("postgresql+psycopg://app@localhost/betting")
+    assert options["connect_args"] == {"prepare_threshold": None}
+
+
+def test_pool_settings_leave_sqlite_defaults():
+    assert PoolSettings(size=1).engine_options("sqlite:///betting.db") == {}
+
+
+def test_pool_status_counts_checkouts(database):
+    with database.engine.connect():
+        primary, replica = database.pool_status()
+
+    assert primary["name"] == "primary"
+    assert primary["checked_out"] == 1
+    assert replica["name"] == "replica0"
+    assert replica["checked_out"] == 0
+
+
+def test_sqlite_profile_applies_pragmas(database):
+    with database.engine.connect() as connection:
+        pragma = lambda name: connection.execute(text(f"PRAGMA {name}")).scalar()
+        assert pragma("journal_mode") == "wal"
+        assert pragma("synchronous") == 1  # NORMAL
+        assert pragma("busy_timeout") == 5000
+        assert pragma("cache_size") == -64000
+
+
+def test_concurrent_read_then_write_transactions_queue(database, written_user):
+    """Writers hold the lock from their first read, so no update is lost."""
+    first_has_read = threading.Event()
+    errors = []
+
+    def second_writer():
+        first_has_read.wait()
+        try:
+            with database.get_session() as session:
+                UserRepository(session).find_by_id(written_user).balance -= 10
+        except Exception as e:
+            errors.append(e)
+
+    thread = threading.Thread(target=second_writer)
+    thread.start()
+    with database.get_session() as session:
+        user = UserRepository(session).find_by_id(written_user)
+        first_has_read.set()
+        # Let the second writer reach its BEGIN while this one holds the lock
+        thread.join(timeout=0.2)
+        user.balance -= 10
+    thread.join()
+
+    assert errors == []
+    assert read_user(database, written_user, issue_consistency_token()).balance == 80
+
+
+def test_reads_are_not_blocked_by_a_writer(database, written_user):
+    with database.get_session() as session:
+        UserRepository(session).find_by_id(written_user).balance = 50
+        session.flush()
+        # WAL: a concurrent read sees the last committed value without waiting
+        assert (
+            read_user(database, written_user, issue_consistency_token()).balance == 100
+        )
@@ -0,0 +1,39 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from betting.events import publish, subscribe, unsubscribe
+
+EVENT = "test_event"
+
+
+@pytest.fixture
+def handler():
+    handler = MagicMock()
+    subscribe(EVENT, handler)
+    yield handler
+    unsubscribe(EVENT, handler)
+
+
+def test_publish_calls_subscribers_with_payload(handler):
+    publish(EVENT, session="session")
+    handler.assert_called_once_with(session="session")
+
+
+def test_failing_handler_does_not_stop_others_or_publisher(handler):
+    failing = MagicMock(side_effect=RuntimeError("boom"))
+    subscribe(EVENT, failing)
+    try:
+        publish(EVENT)
+    finally:
+        unsubscribe(EVENT, failing)
+
+    handler.assert_called_once_with()
+
+
+def test_unsubscribed_handler_is_not_called(handler):
+    unsubscribe(EVENT, handler)
+    publish(EVENT)
+    subscribe(EVENT, handler)
+
+    handler.assert_not_called()
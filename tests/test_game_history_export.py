@@ -0,0 +1,150 @@
+import io
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm.session import Session
+
+from betting.models import Base, Game, GameStatus, OddsSnapshot
+from betting.services import (
+    GameHistoryExportService,
+    HistoryFormat,
+    HistoryTable,
+    season_for,
+)
+
+
+@pytest.fixture
+def pa():
+    return pytest.importorskip("pyarrow")
+
+
+@pytest.fixture
+def db_session():
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine)
+    session = Session()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def games(db_session: Session):
+    starts = [
+        datetime(2025, 12, 25, 20, tzinfo=timezone.utc),
+        datetime(2025, 12, 26, 1, tzinfo=timezone.utc),
+        datetime(2026, 11, 1, 23, tzinfo=timezone.utc),
+    ]
+    games = [
+        Game(
+            external_id=f"game{i}",
+            home_team="Lakers",
+            away_team="Warriors",
+            commence_time=start,
+            status=GameStatus.COMPLETED,
+            home_moneyline=Decimal("-150"),
+            home_spread=Decimal("-5.5"),
+            home_score=110,
+            away_score=100,
+        )
+        for i, start in enumerate(starts)
+    ]
+    upcoming = Game(
+        external_id="upcoming",
+        home_team="Celtics",
+        away_team="Heat",
+        commence_time=starts[-1] + timedelta(days=1),
+        status=GameStatus.UPCOMING,
+    )
+    db_session.add_all(games + [upcoming])
+    db_session.flush()
+    for game in games + [upcoming]:
+        db_session.add(
+            OddsSnapshot(
+                game_id=game.id,
+                captured_at=game.commence_time - timedelta(hours=6),
+                last_seen_at=game.commence_time,
+                bookmaker="betmgm",
+                home_moneyline=-150,
+                home_spread=Decimal("-5.5"),
+            )
+        )
+    db_session.commit()
+    return games
+
+
+@pytest.mark.parametrize(
+    "commence_time, season",
+    [
+        (datetime(2025, 10, 21, tzinfo=timezone.utc), "2025-26"),
+        (datetime(2026, 6, 15, tzinfo=timezone.utc), "2025-26"),
+        (datetime(2099, 12, 1, tzinfo=timezone.utc), "2099-00"),
+    ],
+)
+def test_season_for(commence_time, season):
+    assert season_for(commence_time) == season
+
+
+class TestStream:
+    def test_arrow_file_keeps_column_types(self, pa, db_session: Session, games):
+        service = GameHistoryExportService(db_session, batch_size=2)
+
+        chunks = list(service.stream(HistoryTable.GAMES, HistoryFormat.ARROW))
+        table = pa.ipc.open_file(pa.py_buffer(b"".join(chunks))).read_all()
+
+        assert table.num_rows == 3
+        assert table.schema.field("home_moneyline").type == pa.decimal128(10, 2)
+        assert table.schema.field("home_spread").type == pa.decimal128(5, 1)
+        assert table.schema.field("commence_time").type == pa.timestamp("us", "UTC")
+        assert table.column("home_spread").to_pylist()[0] == Decimal("-5.5")
+        assert table.column("status").to_pylist() == ["completed"] * 3
+        assert table.column("season").to_pylist() == ["2025-26", "2025-26", "2026-27"]
+        assert [d.isoformat() for d in table.column("date").to_pylist()] == [
+            "2025-12-25",
+            "2025-12-26",
+            "2026-11-01",
+        ]
+
+    def test_parquet_odds_for_completed_games_only(
+        self, pa, db_session: Session, games
+    ):
+        pq = pytest.importorskip("pyarrow.parquet")
+        service = GameHistoryExportService(db_session)
+
+        body = b"".join(
+            service.stream(
+                HistoryTable.ODDS,
+                HistoryFormat.PARQUET,
+                commence_from=datetime(2026, 1, 1, tzinfo=timezone.utc),
+            )
+        )
+        table = pq.read_table(io.BytesIO(body))
+
+        assert table.column("game_id").to_pylist() == [str(games[2].id)]
+        assert table.schema.field("home_moneyline").type == pa.int32()
+        assert table.column("season").to_pylist() == ["2026-27"]
+
+
+class TestWriteDataset:
+    def test_partitions_by_season_and_date(
+        self, pa, db_session: Session, games, tmp_path
+    ):
+        ds = pytest.importorskip("pyarrow.dataset")
+        service = GameHistoryExportService(db_session, batch_size=2)
+
+        service.write_dataset(tmp_path, HistoryTable.GAMES, HistoryFormat.ARROW)
+
+        assert sorted(
+            str(path.parent.relative_to(tmp_path)) for path in tmp_path.rglob("*.arrow")
+        ) == [
+            "season=2025-26/date=2025-12-25",
+            "season=2025-26/date=2025-12-26",
+            "season=2026-27/date=2026-11-01",
+        ]
+        path = next(tmp_path.rglob("*.arrow"))
+        assert pa.ipc.open_file(pa.memory_map(str(path))).read_all().num_rows == 1
+        dataset = ds.dataset(tmp_path, format="ipc", partitioning="hive")
+        assert dataset.to_table().num_rows == 3
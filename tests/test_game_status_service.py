@@ -0,0 +1,85 @@
+from datetime import datetime, timedelta, timezone
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm.session import Session
+
+from betting.models import Base, Game, GameStatus
+from betting.services import GameStatusService, GameStatusSweeper
+
+NOW = datetime(2024, 1, 15, 19, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def db_session():
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine)
+    session = Session()
+    yield session
+    session.close()
+
+
+def add_game(session, external_id, commence_time, status=GameStatus.UPCOMING):
+    game = Game(
+        external_id=external_id,
+        home_team="Lakers",
+        away_team="Warriors",
+        commence_time=commence_time,
+        status=status,
+    )
+    session.add(game)
+    session.commit()
+    return game
+
+
+class TestStartDueGames:
+    def test_moves_only_started_upcoming_games(self, db_session: Session):
+        started = add_game(db_session, "started", NOW - timedelta(minutes=5))
+        later = add_game(db_session, "later", NOW + timedelta(hours=1))
+        done = add_game(
+            db_session, "done", NOW - timedelta(days=1), GameStatus.COMPLETED
+        )
+
+        count = GameStatusService(db_session).start_due_games(NOW)
+
+        assert count == 1
+        assert started.status == GameStatus.IN_PROGRESS
+        assert later.status == GameStatus.UPCOMING
+        assert done.status == GameStatus.COMPLETED
+
+
+class TestGameStatusSweeper:
+    def test_skips_until_interval_elapses(self, db_session: Session):
+        sweeper = GameStatusSweeper(timedelta(seconds=30))
+        sweeper.sweep_if_due(db_session, NOW)
+        add_game(db_session, "g1", NOW - timedelta(minutes=1))
+
+        assert sweeper.sweep_if_due(db_session, NOW + timedelta(seconds=10)) == 0
+        assert sweeper.sweep_if_due(db_session, NOW + timedelta(seconds=30)) == 1
+
+    def test_sweeps_early_when_next_game_is_due(self, db_session: Session):
+        game = add_game(db_session, "g1", NOW + timedelta(seconds=5))
+        sweeper = GameStatusSweeper(timedelta(minutes=10))
+
+        assert sweeper.sweep_if_due(db_session, NOW) == 0
+        assert sweeper.sweep_if_due(db_session, NOW + timedelta(seconds=5)) == 1
+        assert game.status == GameStatus.IN_PROGRESS
+
+    def test_reset_forces_sweep(self, db_session: Session):
+        sweeper = GameStatusSweeper(timedelta(minutes=10))
+        sweeper.sweep_if_due(db_session, NOW)
+        add_game(db_session, "g1", NOW - timedelta(minutes=1))
+
+        sweeper.reset()
+
+        assert sweeper.sweep_if_due(db_session, NOW + timedelta(seconds=1)) == 1
+
+    def test_is_due_does_not_claim_the_sweep(self, db_session: Session):
+        sweeper = GameStatusSweeper(timedelta(minutes=10))
+
+        assert sweeper.is_due(NOW)
+        assert sweeper.is_due(NOW)
+        sweeper.sweep_if_due(db_session, NOW)
+        assert not sweeper.is_due(NOW + timedelta(minutes=5))
+        assert sweeper.is_due(NOW + timedelta(minutes=10))
@@ -0,0 +1,217 @@
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from unittest.mock import MagicMock
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm.session import Session
+
+from betting.events import GAMES_CHANGED
+from betting.instrumentation import instrument_engine, query_budget
+from betting.models import Base, Game, GameStatus, OddsSnapshot
+from betting.repositories import OddsSnapshotRepository
+from betting.services import GameStatusService, GameSyncService
+
+
+@pytest.fixture
+def db_session():
+    engine = instrument_engine(create_engine("sqlite:///:memory:"))
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine)
+    session = Session()
+    yield session
+    session.close()
+
+
+def make_game_data(external_id="game1", home_moneyline="-110"):
+    return {
+        "external_id": external_id,
+        "home_team": "Lakers",
+        "away_team": "Warriors",
+        "commence_time": datetime.now(timezone.utc) + timedelta(hours=2),
+        "status": GameStatus.UPCOMING,
+        "home_moneyline": Decimal(home_moneyline),
+        "away_moneyline": Decimal("100"),
+        "home_spread": Decimal("-5.5"),
+        "home_spread_odds": Decimal("-110"),
+        "away_spread": Decimal("5.5"),
+        "away_spread_odds": Decimal("-110"),
+        "total_points": Decimal("215.5"),
+        "over_odds": Decimal("-110"),
+        "under_odds": Decimal("-110"),
+        "home_score": None,
+        "away_score": None,
+    }
+
+
+def make_snapshot(bookmaker="betmgm", home_moneyline="-110"):
+    return {
+        "bookmaker": bookmaker,
+        "home_moneyline": Decimal(home_moneyline),
+        "away_moneyline": Decimal("100"),
+        "home_spread": Decimal("-5.5"),
+        "home_spread_odds": Decimal("-110"),
+        "away_spread": Decimal("5.5"),
+        "away_spread_odds": Decimal("-110"),
+        "total_points": Decimal("215.5"),
+        "over_odds": Decimal("-110"),
+        "under_odds": Decimal("-110"),
+    }
+
+
+def make_service(session, *responses):
+    api_client = MagicMock()
+    api_client.get_nba_games_with_snapshots.side_effect = list(responses)
+    return GameSyncService(session, api_client=api_client)
+
+
+class TestSyncGames:
+    def test_creates_games_and_snapshots(self, db_session: Session):
+        service = make_service(
+            db_session,
+            [
+                (
+                    make_game_data(),
+                    [make_snapshot("betmgm"), make_snapshot("fanduel")],
+                )
+            ],
+        )
+
+        result = service.sync_games()
+
+        assert result["created"] == 1
+        assert result["line_changes"] == 2
+        game = db_session.query(Game).one()
+        snapshots = OddsSnapshotRepository(db_session).find_by_game(game.id)
+        assert {s.bookmaker for s in snapshots} == {"betmgm", "fanduel"}
+        assert snapshots[0].home_moneyline == -110
+
+    def test_each_sync_appends_history(self, db_session: Session):
+        service = make_service(
+            db_session,
+            [(make_game_data(), [make_snapshot(home_moneyline="-110")])],
+            [
+                (
+                    make_game_data(home_moneyline="-125"),
+                    [make_snapshot(home_moneyline="-125")],
+                )
+            ],
+        )
+
+        service.sync_games()
+        result = service.sync_games()
+
+        assert result["updated"] == 1
+        game = db_session.query(Game).one()
+        assert game.home_moneyline == Decimal("-125")
+        history = OddsSnapshotRepository(db_session).find_by_game(game.id)
+        assert [s.home_moneyline for s in history] == [-110, -125]
+
+    def test_sync_keeps_status_of_started_games(self, db_session: Session):
+        service = make_service(
+            db_session,
+            [(make_game_data(), [make_snapshot()])],
+            [(make_game_data(home_moneyline="-125"), [make_snapshot()])],
+        )
+
+        service.sync_games()
+        game = db_session.query(Game).one()
+        GameStatusService(db_session).start_due_games(
+            game.commence_time + timedelta(minutes=1)
+        )
+        service.sync_games()
+
+        db_session.refresh(game)
+        assert game.status == GameStatus.IN_PROGRESS
+        assert game.home_moneyline == Decimal("-125")
+
+    def test_unchanged_lines_extend_current_run(self, db_session: Session):
+        service = make_service(
+            db_session,
+            [(make_game_data(), [make_snapshot()])],
+            [(make_game_data(), [make_snapshot()])],
+            [(make_game_data(), [make_snapshot()])],
+        )
+
+        service.sync_games()
+        service.sync_games()
+        result = service.sync_games()
+
+        assert result["line_changes"] == 0
+        run = db_session.query(OddsSnapshot).one()
+        assert run.sample_count == 3
+        assert run.last_seen_at > run.captured_at
+
+    @pytest.mark.parametrize("size", [1, 10])
+    def test_query_count_does_not_grow_with_games(
+        self, db_session: Session, size: int, monkeypatch
+    ):
+        # GAMES_CHANGED handlers (e.g. the API's /games cache) aren't sync cost
+        publish = MagicMock()
+        monkeypatch.setattr("betting.services.game_sync_service.publish", publish)
+
+        games = [
+            (make_game_data(f"game{i}"), [make_snapshot("betmgm")]) for i in range(size)
+        ]
+        make_service(db_session, games).sync_games()
+
+        moved = [
+            (make_game_data(f"game{i}", "-120"), [make_snapshot("betmgm", "-120")])
+            for i in range(size)
+        ]
+        # Load games, update games, load runs, insert moved lines
+        with query_budget(4):
+            make_service(db_session, moved).sync_games()
+
+        publish.assert_any_call(GAMES_CHANGED, session=db_session)
+
+
+class TestPruneSnapshots:
+    def test_keeps_opening_and_closing_lines(self, db_session: Session):
+        start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        game = Game(**make_game_data())
+        game.commence_time = start + timedelta(days=1)
+        db_session.add(game)
+        db_session.flush()
+
+        repo = OddsSnapshotRepository(db_session)
+        repo.save_all(
+            [
+                {
+                    "game_id": game.id,
+                    "captured_at": start + timedelta(hours=i),
+                    "last_seen_at": start + timedelta(hours=i),
+                    "bookmaker": "betmgm",
+                    "home_moneyline": -100 - i,
+                }
+                for i in range(5)
+            ]
+        )
+
+        deleted = repo.prune(commenced_before=start + timedelta(days=30))
+
+        assert deleted == 3
+        remaining = repo.find_by_game(game.id)
+        assert [s.home_moneyline for s in remaining] == [-100, -104]
+
+    def test_leaves_recent_games_untouched(self, db_session: Session):
+        game = Game(**make_game_data())
+        db_session.add(game)
+        db_session.flush()
+
+        now = datetime.now(timezone.utc)
+        repo = OddsSnapshotRepository(db_session)
+        repo.save_all(
+            [
+                {
+                    "game_id": game.id,
+                    "captured_at": now - timedelta(minutes=i),
+                    "last_seen_at": now - timedelta(minutes=i),
+                    "bookmaker": "betmgm",
+                }
+                for i in range(4)
+            ]
+        )
+
+        assert repo.prune(commenced_before=now - timedelta(days=90)) == 0
+        assert db_session.query(OddsSnapshot).count() == 4
@@ -0,0 +1,108 @@
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm.session import Session
+
+from betting.models import Base, Game, GameStatus
+from betting.services import GameScoringService
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    return engine
+
+
+@pytest.fixture
+def db_session(engine):
+    Session = sessionmaker(bind=engine)
+    session = Session()
+    yield session
+    session.close()
+
+
+def make_game(external_id, status=GameStatus.UPCOMING):
+    return Game(
+        external_id=external_id,
+        home_team="Lakers",
+        away_team="Warriors",
+        commence_time=datetime.now(timezone.utc) - timedelta(hours=3),
+        status=status,
+    )
+
+
+def make_score(external_id, home_score=110, away_score=104):
+    return {
+        "external_id": external_id,
+        "home_score": home_score,
+        "away_score": away_score,
+        "completed": True,
+    }
+
+
+def make_service(session, scores):
+    api_client = MagicMock()
+    api_client.get_nba_scores.return_value = scores
+    return GameScoringService(session, api_client=api_client)
+
+
+class TestUpdateCompletedGames:
+    def test_scores_unfinished_games(self, db_session: Session):
+        db_session.add_all([make_game("g1"), make_game("g2", GameStatus.IN_PROGRESS)])
+        db_session.commit()
+
+        service = make_service(
+            db_session, [make_score("g1"), make_score("g2", 99, 101)]
+        )
+        updated = service.update_completed_games()
+
+        assert {g.external_id for g in updated} == {"g1", "g2"}
+        g2 = db_session.query(Game).filter_by(external_id="g2").one()
+        assert g2.status == GameStatus.COMPLETED
+        assert (g2.home_score, g2.away_score) == (99, 101)
+
+    def test_skips_completed_and_unknown_games(self, db_session: Session):
+        db_session.add_all([make_game("open"), make_game("done", GameStatus.COMPLETED)])
+        db_session.commit()
+
+        service = make_service(
+            db_session,
+            [make_score("open"), make_score("done", 1, 2), make_score("unknown")],
+        )
+        updated = service.update_completed_games()
+
+        assert [g.external_id for g in updated] == ["open"]
+        done = db_session.query(Game).filter_by(external_id="done").one()
+        assert done.home_score is None
+
+    def test_no_unfinished_games_skips_api_call(self, db_session: Session):
+        db_session.add(make_game("done", GameStatus.COMPLETED))
+        db_session.commit()
+
+        service = make_service(db_session, [make_score("done")])
+
+        assert service.update_completed_games() == []
+        service.api_client.get_nba_scores.assert_not_called()
+
+    def test_query_count_is_independent_of_score_count(self, engine, db_session):
+        def count_queries(game_count):
+            external_ids = [f"game{game_count}_{i}" for i in range(game_count)]
+            db_session.add_all([make_game(external_id) for external_id in external_ids])
+            db_session.commit()
+
+            statements = []
+            listener = lambda *args: statements.append(args[2])
+            event.listen(engine, "before_cursor_execute", listener)
+            try:
+                make_service(
+                    db_session,
+                    [make_score(external_id) for external_id in external_ids],
+                ).update_completed_games()
+            finally:
+                event.remove(engine, "before_cursor_execute", listener)
+            return len(statements)
+
+        assert count_queries(2) == count_queries(40)
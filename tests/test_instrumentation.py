@@ -0,0 +1,160 @@
+import logging
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import create_engine, select, update
+from sqlalchemy.orm import sessionmaker
+
+from betting.instrumentation import (
+    QueryBudgetExceeded,
+    SlowQueryLog,
+    collect_query_stats,
+    instrument_engine,
+    instrument_slow_queries,
+    query_budget,
+    redact_parameters,
+)
+from betting.models import Base, User
+from betting.repositories import UserRepository
+
+
+@pytest.fixture
+def Session():
+    engine = instrument_engine(create_engine("sqlite:///:memory:"))
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine)
+    with Session() as session:
+        session.add_all([User(username=f"user{i}", balance=100) for i in range(3)])
+        session.commit()
+    return Session
+
+
+def test_counts_statements_time_and_rows(Session):
+    with Session() as session, collect_query_stats(count_rows=True) as stats:
+        session.execute(select(User)).all()
+        UserRepository(session).find_by_username("user1")
+
+    assert stats.statements == 2
+    assert stats.rows == 4
+    assert stats.sql_time > 0
+
+
+def test_counts_only_rows_written_by_default(Session):
+    with Session() as session, collect_query_stats() as stats:
+        assert len(session.execute(select(User)).all()) == 3
+        session.execute(update(User).values(balance=50))
+        session.commit()
+
+    assert stats.rows == 3
+
+
+def test_streaming_reads_are_not_buffered(Session):
+    with Session() as session, collect_query_stats(count_rows=True) as stats:
+        result = session.execute(select(User).execution_options(yield_per=1))
+        assert len(result.scalars().all()) == 3
+
+    assert stats.statements == 1
+    assert stats.rows == 0
+
+
+def test_nothing_is_collected_outside_a_block(Session):
+    with Session() as session:
+        session.execute(select(User)).all()
+
+    with collect_query_stats() as stats:
+        pass
+
+    assert stats.statements == 0
+
+
+def test_repeated_statements_flag_n_plus_one(Session):
+    with Session() as session, collect_query_stats() as stats:
+        for i in range(6):
+            UserRepository(session).find_by_username(f"user{i}")
+        session.execute(select(User)).all()
+
+    [(statement, count)] = stats.repeated_statements()
+    assert count == 6
+    assert "WHERE users.username" in statement
+
+
+def test_query_budget_passes_within_budget(Session):
+    with Session() as session, query_budget(1):
+        UserRepository(session).find_by_username("user0")
+
+
+def test_query_budget_fails_over_budget(Session):
+    with pytest.raises(QueryBudgetExceeded, match=r"3 statements \(budget 2\)"):
+        with Session() as session, query_budget(2):
+            for i in range(3):
+                UserRepository(session).find_by_username(f"user{i}")
+
+
+@pytest.fixture
+def slow_Session():
+    # Threshold 0: every statement counts as slow
+    log = SlowQueryLog(threshold=0, size=3)
+    engine = instrument_slow_queries(
+        create_engine("sqlite:///:memory:"), log, "primary"
+    )
+    Base.metadata.create_all(engine)
+    with engine.begin() as connection:
+        connection.execute(User.__table__.insert(), {"username": "user1", "balance": 1})
+    log.clear()
+    Session = sessionmaker(bind=engine)
+    Session.log = log
+    return Session
+
+
+def test_slow_queries_record_caller_plan_and_redacted_parameters(slow_Session):
+    with slow_Session() as session:
+        UserRepository(session).find_by_username("user1")
+
+    [entry] = slow_Session.log.entries()
+    assert entry.database == "primary"
+    assert "FROM users" in entry.statement
+    assert entry.caller.endswith("UserRepository.find_by_username")
+    assert entry.parameters == ["<str>", 1, 0]
+    assert any("users" in line for line in entry.plan)
+
+
+def test_slow_query_log_is_bounded_and_newest_first(slow_Session):
+    with slow_Session() as session:
+        for i in range(5):
+            UserRepository(session).find_by_username(f"user{i}")
+        session.execute(select(User).limit(7)).all()
+
+    entries = slow_Session.log.entries()
+    assert len(entries) == 3
+    assert entries[0].parameters == [7, 0]
+
+
+def test_fast_statements_are_not_recorded():
+    log = SlowQueryLog(threshold=60)
+    engine = instrument_slow_queries(create_engine("sqlite://"), log, "primary")
+    with engine.connect() as connection:
+        connection.exec_driver_sql("SELECT 1")
+
+    assert log.entries() == []
+
+
+def test_slow_queries_are_logged(slow_Session, caplog):
+    with caplog.at_level(logging.WARNING, logger="betting.instrumentation"):
+        with slow_Session() as session:
+            session.execute(select(User)).all()
+
+    [record] = caplog.records
+    assert record.slow_query_database == "primary"
+    assert record.slow_query_plan
+
+
+def test_redact_parameters_keeps_only_numbers_and_dates():
+    at = datetime(2026, 1, 10, tzinfo=timezone.utc)
+    assert redact_parameters({"id": uuid4(), "name": "x", "at": at, "n": 3}) == {
+        "id": "<UUID>",
+        "name": "<str>",
+        "at": "2026-01-10T00:00:00+00:00",
+        "n": 3,
+    }
+    assert redact_parameters([(1,), (2,)], executemany=True) == "<2 parameter sets>"
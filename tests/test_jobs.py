@@ -0,0 +1,237 @@
+from concurrent.futures import Executor, Future
+from contextlib import contextmanager
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from betting.database import Database
+from betting.instrumentation import instrument_engine
+from betting.jobs import JobRunner
+from betting.models import Base, Job, JobStatus, JobType
+from betting.repositories import JobRepository
+
+
+class DeferredExecutor(Executor):
+    """Holds submitted jobs until run_all, to observe the queued state."""
+
+    def __init__(self):
+        self.pending = []
+
+    def submit(self, fn, *args, **kwargs):
+        self.pending.append((fn, args, kwargs))
+        return Future()
+
+    def run_all(self):
+        pending, self.pending = self.pending, []
+        for fn, args, kwargs in pending:
+            fn(*args, **kwargs)
+
+
+@pytest.fixture
+def Session():
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(engine)
+    return sessionmaker(bind=instrument_engine(engine))
+
+
+@pytest.fixture
+def session_scope(Session):
+    @contextmanager
+    def session_scope():
+        session = Session()
+        try:
+            yield session
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+    return session_scope
+
+
+def make_runner(session_scope, handler, executor):
+    return JobRunner(
+        {JobType.SETTLE_BETS: handler},
+        session_scope,
+        executor,
+        stale_after=timedelta(minutes=15),
+    )
+
+
+def load(Session, job_id) -> Job:
+    return JobRepository(Session()).find_by_id(job_id)
+
+
+def test_job_runs_after_submit_returns(Session, session_scope):
+    def handler(session, progress):
+        progress("halfway")
+        assert load(Session, job_id).progress == "halfway"
+        assert load(Session, job_id).status == JobStatus.RUNNING
+        return {"bets_settled": 3}
+
+    executor = DeferredExecutor()
+    job_id, created = make_runner(session_scope, handler, executor).submit(
+        JobType.SETTLE_BETS
+    )
+
+    assert created
+    assert load(Session, job_id).status == JobStatus.QUEUED
+
+    executor.run_all()
+
+    job = load(Session, job_id)
+    assert job.status == JobStatus.SUCCEEDED
+    assert job.result["bets_settled"] == 3
+    assert job.result["query_count"] >= 0
+    assert job.duration_seconds >= 0
+
+
+def test_active_job_is_shared_by_later_submits(session_scope):
+    executor = DeferredExecutor()
+    runner = make_runner(session_scope, lambda session, progress: {}, executor)
+
+    first_id, first_created = runner.submit(JobType.SETTLE_BETS)
+    second_id, second_created = runner.submit(JobType.SETTLE_BETS)
+
+    assert (first_created, second_created) == (True, False)
+    assert second_id == first_id
+    assert len(executor.pending) == 1
+
+    executor.run_all()
+    third_id, third_created = runner.submit(JobType.SETTLE_BETS)
+    assert third_created
+    assert third_id != first_id
+
+
+def test_unique_index_allows_one_active_job_per_type(Session):
+    session = Session()
+    session.add(Job(job_type=JobType.FETCH_GAMES, status=JobStatus.RUNNING))
+    session.add(Job(job_type=JobType.FETCH_GAMES, status=JobStatus.SUCCEEDED))
+    session.add(Job(job_type=JobType.SCORE_GAMES, status=JobStatus.QUEUED))
+    session.commit()
+
+    session.add(Job(job_type=JobType.FETCH_GAMES, status=JobStatus.QUEUED))
+    with pytest.raises(IntegrityError):
+        session.commit()
+
+
+def test_stale_job_is_failed_and_releases_lock(Session, session_scope):
+    session = Session()
+    stale = Job(
+        job_type=JobType.SETTLE_BETS,
+        status=JobStatus.RUNNING,
+        updated_at=datetime.now(timezone.utc) - timedelta(hours=1),
+    )
+    session.add(stale)
+    session.commit()
+    stale_id = stale.id
+    session.close()
+
+    executor = DeferredExecutor()
+    job_id, created = make_runner(
+        session_scope, lambda session, progress: {}, executor
+    ).submit(JobType.SETTLE_BETS)
+
+    assert created
+    assert job_id != stale_id
+    stale = load(Session, stale_id)
+    assert stale.status == JobStatus.FAILED
+    assert "heartbeat" in stale.error
+
+
+def test_long_running_job_keeps_its_heartbeat(Session, session_scope):
+    def handler(session, progress):
+        # Several stale_after periods without reporting progress
+        time.sleep(0.6)
+        assert runner.submit(JobType.SETTLE_BETS) == (job_id, False)
+        return {}
+
+    executor = DeferredExecutor()
+    runner = JobRunner(
+        {JobType.SETTLE_BETS: handler},
+        session_scope,
+        executor,
+        stale_after=timedelta(seconds=0.2),
+        heartbeat_interval=timedelta(seconds=0.05),
+    )
+    job_id, _ = runner.submit(JobType.SETTLE_BETS)
+    executor.run_all()
+
+    assert load(Session, job_id).status == JobStatus.SUCCEEDED
+    assert executor.pending == []
+
+
+def test_long_job_holding_the_sqlite_write_lock_is_not_expired(tmp_path):
+    db = Database(f"sqlite:///{tmp_path / 'jobs.db'}")
+    Base.metadata.create_all(db.engine)
+
+    def handler(session, progress):
+        # Hold the write lock for several heartbeat intervals and stale_after
+        session.add(Job(job_type=JobType.FETCH_GAMES, status=JobStatus.SUCCEEDED))
+        session.flush()
+        time.sleep(0.3)
+        session.commit()
+        assert runner.submit(JobType.SETTLE_BETS) == (job_id, False)
+        return {}
+
+    executor = DeferredExecutor()
+    runner = JobRunner(
+        {JobType.SETTLE_BETS: handler},
+        db.get_session,
+        executor,
+        stale_after=timedelta(seconds=0.1),
+        heartbeat_interval=timedelta(seconds=0.02),
+        heartbeat=False,
+    )
+    job_id, _ = runner.submit(JobType.SETTLE_BETS)
+    executor.run_all()
+
+    assert load(db.SessionLocal, job_id).status == JobStatus.SUCCEEDED
+    assert executor.pending == []
+    db.engine.dispose()
+
+
+def test_finished_run_does_not_overwrite_abandoned_status(Session, session_scope):
+    def handler(session, progress):
+        with session_scope() as other:
+            JobRepository(other).fail_stale(datetime.now(timezone.utc) + timedelta(1))
+        return {}
+
+    executor = DeferredExecutor()
+    job_id, _ = make_runner(session_scope, handler, executor).submit(
+        JobType.SETTLE_BETS
+    )
+    executor.run_all()
+
+    job = load(Session, job_id)
+    assert job.status == JobStatus.FAILED
+    assert "heartbeat" in job.error
+
+
+def test_failed_job_rolls_back_its_work(Session, session_scope):
+    def handler(session, progress):
+        session.add(Job(job_type=JobType.FETCH_GAMES, status=JobStatus.SUCCEEDED))
+        session.flush()
+        raise ValueError("bad data")
+
+    executor = DeferredExecutor()
+    job_id, _ = make_runner(session_scope, handler, executor).submit(
+        JobType.SETTLE_BETS
+    )
+    executor.run_all()
+
+    job = load(Session, job_id)
+    assert job.status == JobStatus.FAILED
+    assert job.error == "ValueError: bad data"
+    assert Session().query(Job).filter_by(job_type=JobType.FETCH_GAMES).count() == 0
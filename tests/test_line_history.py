@@ -0,0 +1,54 @@
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+from betting.services.line_history import LineHistory
+
+START = datetime(2024, 1, 15, 12, 0, tzinfo=timezone.utc)
+
+
+def make_runs(*offsets_and_prices):
+    return [
+        SimpleNamespace(
+            captured_at=START + timedelta(minutes=offset), home_moneyline=price
+        )
+        for offset, price in offsets_and_prices
+    ]
+
+
+class TestAsOf:
+    def test_before_first_run(self):
+        history = LineHistory(make_runs((0, -110)))
+        assert history.as_of(START - timedelta(seconds=1)) is None
+
+    def test_exact_run_start(self):
+        history = LineHistory(make_runs((0, -110), (30, -120)))
+        assert history.as_of(START + timedelta(minutes=30)).home_moneyline == -120
+
+    def test_between_runs_holds_previous_line(self):
+        history = LineHistory(make_runs((0, -110), (30, -120), (90, -105)))
+        assert history.as_of(START + timedelta(minutes=89)).home_moneyline == -120
+
+    def test_after_last_run(self):
+        history = LineHistory(make_runs((0, -110), (30, -120)))
+        assert history.as_of(START + timedelta(days=1)).home_moneyline == -120
+
+
+class TestResample:
+    def test_dense_series(self):
+        history = LineHistory(make_runs((0, -110), (25, -130)))
+
+        points = history.resample(
+            START - timedelta(minutes=10),
+            START + timedelta(minutes=30),
+            timedelta(minutes=10),
+        )
+
+        prices = [run.home_moneyline if run else None for _, run in points]
+        assert prices == [None, -110, -110, -110, -130]
+        assert points[0][0] == START - timedelta(minutes=10)
+
+    def test_empty_history(self):
+        points = LineHistory([]).resample(
+            START, START + timedelta(minutes=5), timedelta(minutes=5)
+        )
+        assert [run for _, run in points] == [None, None]
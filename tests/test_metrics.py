@@ -0,0 +1,37 @@
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import QueuePool
+
+from betting.metrics import REGISTRY, instrument_pool
+
+
+def held_count(pool: str) -> float:
+    return (
+        REGISTRY.get_sample_value("db_pool_checkout_seconds_count", {"pool": pool}) or 0
+    )
+
+
+def test_instrument_pool_records_hold_times_and_size(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path}/pool.db", poolclass=QueuePool)
+    instrument_pool(engine, "test_pool")
+    before = held_count("test_pool")
+
+    labels = {"pool": "test_pool"}
+
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+        assert REGISTRY.get_sample_value("db_pool_checked_out", labels) == 1
+
+    assert held_count("test_pool") == before + 1
+    assert REGISTRY.get_sample_value("db_pool_checked_out", labels) == 0
+    assert REGISTRY.get_sample_value("db_pool_size", labels) == 5
+
+
+def test_pool_events_survive_dispose(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path}/pool.db", poolclass=QueuePool)
+    instrument_pool(engine, "disposed_pool")
+    engine.dispose()
+
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+
+    assert held_count("disposed_pool") == 1
@@ -0,0 +1,259 @@
+import statistics
+from datetime import datetime, timezone
+from decimal import Decimal
+from uuid import uuid4
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm.session import Session
+
+from betting.models import Base, Bet, BetSelection, BetStatus, BetType
+from betting.models import Game, GameStatus, User, UserPerformance
+from betting.services import BetSettlementService, PerformanceService
+from betting.services.performance_service import (
+    PerformanceAccumulator,
+    SettledBet,
+    summarize,
+)
+
+JAN = datetime(2026, 1, 15, tzinfo=timezone.utc)
+FEB = datetime(2026, 2, 15, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def db_session():
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine)
+    session = Session()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def user(db_session: Session):
+    user = User(username="bettor", balance=Decimal("1000.00"))
+    db_session.add(user)
+    db_session.commit()
+    return user
+
+
+def settle_round(session: Session, user: User, home_score: int, away_score: int):
+    """One completed game with a moneyline, spread and total bet, then settle it."""
+    game = Game(
+        external_id=f"game-{home_score}-{away_score}",
+        home_team="Lakers",
+        away_team="Warriors",
+        commence_time=datetime.now(timezone.utc),
+        status=GameStatus.COMPLETED,
+        home_score=home_score,
+        away_score=away_score,
+        home_spread=Decimal("-5.0"),
+        away_spread=Decimal("5.0"),
+        total_points=Decimal("215.0"),
+    )
+    session.add(game)
+    session.flush()
+    for bet_type, selection, stake, payout in [
+        (BetType.MONEYLINE, BetSelection.HOME, "10.00", "19.09"),
+        (BetType.SPREAD, BetSelection.HOME, "25.00", "47.73"),
+        (BetType.OVER_UNDER, BetSelection.OVER, "40.00", "76.36"),
+    ]:
+        session.add(
+            Bet(
+                user_id=user.id,
+                game_id=game.id,
+                bet_type=bet_type,
+                selection=selection,
+                odds=Decimal("-110"),
+                stake=Decimal(stake),
+                potential_payout=Decimal(payout),
+            )
+        )
+    session.commit()
+    BetSettlementService(session).settle_bets_for_games([game])
+
+
+def settled(
+    user: User,
+    status: BetStatus,
+    stake: str,
+    potential_payout: str,
+    settled_at: datetime = JAN,
+    bet_type: BetType = BetType.MONEYLINE,
+    selection: BetSelection = BetSelection.HOME,
+) -> SettledBet:
+    return SettledBet(
+        uuid4(),
+        user.id,
+        bet_type,
+        selection,
+        status,
+        Decimal(stake),
+        Decimal(potential_payout),
+        settled_at,
+        "Lakers",
+        "Warriors",
+    )
+
+
+class TestPerformanceAccumulator:
+    def test_matches_batch_statistics(self, user: User):
+        bets = [
+            settled(user, BetStatus.WON, "10.00", "20.00"),
+            settled(user, BetStatus.LOST, "10.00", "19.09"),
+            settled(user, BetStatus.LOST, "20.00", "38.18"),
+            settled(user, BetStatus.PUSH, "5.00", "9.55"),
+            settled(user, BetStatus.WON, "10.00", "25.00"),
+        ]
+        accumulator = PerformanceAccumulator(user.id)
+        for bet in bets:
+            accumulator.add(bet)
+
+        returns = [1.0, -1.0, -1.0, 0.0, 1.5]
+        summary = summarize(accumulator.performance, accumulator.buckets.values())
+
+        assert summary["record"] == {"won": 2, "lost": 2, "push": 1}
+        assert summary["win_rate"] == 0.5
+        assert summary["net_profit"] == Decimal("-5.00")
+        assert summary["roi"] == pytest.approx(-5 / 55)
+        assert summary["sharpe_ratio"] == pytest.approx(
+            statistics.mean(returns) / statistics.stdev(returns)
+        )
+        # Net profit runs 10, 0, -20, -20, -5: down 30 from the peak of 10
+        assert summary["max_drawdown"] == Decimal("30.00")
+
+    def test_buckets_by_bet_type_and_month(self, user: User):
+        accumulator = PerformanceAccumulator(user.id)
+        accumulator.add(settled(user, BetStatus.WON, "10", "20", JAN, BetType.SPREAD))
+        accumulator.add(settled(user, BetStatus.LOST, "10", "20", FEB, BetType.SPREAD))
+        accumulator.add(settled(user, BetStatus.WON, "10", "15", FEB))
+
+        breakdown = summarize(accumulator.performance, accumulator.buckets.values())[
+            "breakdown"
+        ]
+
+        assert breakdown["by_bet_type"] == {
+            "moneyline": {"count": 1, "roi": 0.5},
+            "spread": {"count": 2, "roi": 0.0},
+        }
+        assert breakdown["by_month"] == [
+            {"month": "2026-01", "bets": 1, "roi": 1.0},
+            {"month": "2026-02", "bets": 2, "roi": -0.25},
+        ]
+
+    def test_streaks_skip_pushes(self, user: User):
+        won, lost, push = BetStatus.WON, BetStatus.LOST, BetStatus.PUSH
+        accumulator = PerformanceAccumulator(user.id)
+        for status in [won, won, push, won, lost, lost, lost, push, won]:
+            accumulator.add(settled(user, status, "10", "20"))
+
+        performance = accumulator.performance
+        assert performance.current_streak == 1
+        assert performance.longest_win_streak == 3
+        assert performance.longest_loss_streak == 3
+
+    def test_team_stats_count_both_sides(self, user: User):
+        accumulator = PerformanceAccumulator(user.id)
+        accumulator.add(settled(user, BetStatus.WON, "10", "20"))
+        accumulator.add(
+            settled(user, BetStatus.LOST, "30", "60", selection=BetSelection.AWAY)
+        )
+        accumulator.add(
+            settled(
+                user,
+                BetStatus.WON,
+                "10",
+                "20",
+                bet_type=BetType.OVER_UNDER,
+                selection=BetSelection.OVER,
+            )
+        )
+
+        lakers, warriors = accumulator.teams["Lakers"], accumulator.teams["Warriors"]
+        assert (lakers.bets_for, lakers.wins_for, lakers.pnl_for) == (1, 1, 10)
+        assert (lakers.bets_against, lakers.losses_against) == (1, 1)
+        assert lakers.pnl_against == Decimal("-30")
+        assert (warriors.bets_for, warriors.losses_for) == (1, 1)
+        assert warriors.pnl_for == Decimal("-30")
+        assert (warriors.bets_against, warriors.wins_against) == (1, 1)
+
+
+class TestPerformanceService:
+    def test_settlement_keeps_stats_equal_to_recompute(
+        self, db_session: Session, user: User
+    ):
+        # Home wins by 10, wins by 2, then loses: a mix of wins and losses
+        for home_score, away_score in [(120, 110), (100, 98), (90, 100)]:
+            settle_round(db_session, user, home_score, away_score)
+
+        service = PerformanceService(db_session)
+        assert service.verify(user.id) == []
+        performance = service.get_performance(user.id)
+        assert performance["total_bets"] == 9
+        assert performance["record"] == {"won": 4, "lost": 5, "push": 0}
+        assert performance["total_staked"] == Decimal("225.00")
+
+    def test_verify_reports_drift_and_rebuild_repairs_it(
+        self, db_session: Session, user: User
+    ):
+        settle_round(db_session, user, 120, 110)
+        db_session.get(UserPerformance, user.id).won = 0
+        db_session.commit()
+        service = PerformanceService(db_session)
+
+        assert service.verify(user.id) == ["performance.won: stored 0, recomputed 3"]
+
+        service.rebuild(user.id)
+        db_session.commit()
+        db_session.expire_all()
+        assert service.verify(user.id) == []
+        assert service.get_performance(user.id)["record"]["won"] == 3
+
+    def test_user_without_settled_bets(self, db_session: Session, user: User):
+        service = PerformanceService(db_session)
+
+        assert service.verify(user.id) == []
+        assert service.get_performance(user.id)["total_bets"] == 0
+
+    def test_stats_report_best_teams_and_streak(self, db_session: Session, user: User):
+        for home_score, away_score in [(120, 110), (100, 98), (90, 100)]:
+            settle_round(db_session, user, home_score, away_score)
+
+        stats = PerformanceService(db_session).get_stats(user.id)
+
+        assert stats["total_wins"] == 4
+        assert stats["by_bet_type"]["moneyline"] == {
+            "wins": 2,
+            "losses": 1,
+            "pushes": 0,
+            "pnl": Decimal("8.18"),
+        }
+        assert stats["best_teams"] == []
+        assert [team.team_name for team in stats["worst_teams"]] == ["Lakers"]
+        # Bets within a game settle in no fixed order, but the last game's
+        # three losses end the history
+        assert stats["current_streak"] <= -3
+        assert stats["longest_loss_streak"] == -stats["current_streak"]
+
+    def test_rebuild_all_matches_incremental_stats(
+        self, db_session: Session, user: User
+    ):
+        other = User(username="other", balance=Decimal("1000.00"))
+        db_session.add(other)
+        db_session.commit()
+        for home_score, away_score in [(120, 110), (90, 100)]:
+            settle_round(db_session, user, home_score, away_score)
+            settle_round(db_session, other, home_score + 1, away_score)
+        service = PerformanceService(db_session, batch_size=2)
+        before = {u.id: service.get_stats(u.id) for u in (user, other)}
+
+        assert service.rebuild_all() == 2
+        db_session.commit()
+        db_session.expire_all()
+
+        for u in (user, other):
+            assert service.verify(u.id) == []
+            after = service.get_stats(u.id)
+            assert after["total_pnl"] == before[u.id]["total_pnl"]
+            assert after["longest_win_streak"] == before[u.id]["longest_win_streak"]
@@ -0,0 +1,179 @@
+"""Assert the hot repository queries are served by indexes at realistic sizes."""
+
+import random
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from uuid import uuid4
+import pytest
+from sqlalchemy import create_engine, event, insert
+from sqlalchemy.orm import sessionmaker
+
+from betting.models import (
+    Base,
+    Bet,
+    BetSelection,
+    BetStatus,
+    BetType,
+    Game,
+    GameStatus,
+    User,
+)
+from betting.repositories import BetRepository, GameRepository
+from betting.repositories.pagination import decode_cursor, encode_cursor
+
+USER_COUNT = 500
+GAME_COUNT = 3000
+BET_COUNT = 20000
+NOW = datetime(2025, 3, 1, tzinfo=timezone.utc)
+
+
+def game_status(commence_time):
+    if commence_time < NOW - timedelta(hours=3):
+        return GameStatus.COMPLETED
+    if commence_time < NOW:
+        return GameStatus.IN_PROGRESS
+    return GameStatus.UPCOMING
+
+
+@pytest.fixture(scope="module")
+def dataset():
+    """A season-and-a-half of games with bets mostly settled, as in production."""
+    rng = random.Random(7)
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+
+    users = [
+        {"id": uuid4(), "username": f"user{i}", "balance": Decimal("1000")}
+        for i in range(USER_COUNT)
+    ]
+    games = []
+    for i in range(GAME_COUNT):
+        commence_time = NOW - timedelta(hours=6 * (GAME_COUNT - 100 - i))
+        games.append(
+            {
+                "id": uuid4(),
+                "external_id": f"game{i}",
+                "home_team": "Lakers",
+                "away_team": "Warriors",
+                "commence_time": commence_time,
+                "status": game_status(commence_time),
+            }
+        )
+    bets = []
+    for _ in range(BET_COUNT):
+        game = rng.choice(games)
+        pending = game["status"] != GameStatus.COMPLETED
+        bets.append(
+            {
+                "id": uuid4(),
+                "user_id": rng.choice(users)["id"],
+                "game_id": game["id"],
+                "bet_type": BetType.MONEYLINE,
+                "selection": BetSelection.HOME,
+                "odds": Decimal("-110"),
+                "stake": Decimal("10"),
+                "potential_payout": Decimal("19.09"),
+                "status": (
+                    BetStatus.PENDING
+                    if pending
+                    else rng.choice([BetStatus.WON, BetStatus.LOST])
+                ),
+                "created_at": game["commence_time"] - timedelta(hours=rng.random()),
+            }
+        )
+
+    Session = sessionmaker(bind=engine)
+    with Session() as session:
+        session.execute(insert(User), users)
+        session.execute(insert(Game), games)
+        session.execute(insert(Bet), bets)
+        session.commit()
+
+    with engine.begin() as conn:
+        conn.exec_driver_sql("ANALYZE")
+
+    return engine, Session, users, games
+
+
+def query_plans(engine, Session, call):
+    """Run a repository call and return the EXPLAIN QUERY PLAN of each statement."""
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        with Session() as session:
+            call(session)
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+
+    plans = []
+    with engine.connect() as conn:
+        for statement, parameters in statements:
+            rows = conn.exec_driver_sql(
+                "EXPLAIN QUERY PLAN " + statement, parameters
+            ).all()
+            plans.extend(row[-1] for row in rows)
+    return plans
+
+
+def pending_bets_by_game(session, users, games):
+    BetRepository(session).find_pending_bets_by_game(games[-1]["id"])
+
+
+def pending_bets_by_games(session, users, games):
+    BetRepository(session).find_pending_bets_by_games([g["id"] for g in games[-20:]])
+
+
+def pending_bets_by_user(session, users, games):
+    BetRepository(session).find_pending_bets_by_user(users[0]["id"])
+
+
+def bet_history_by_user(session, users, games):
+    BetRepository(session).find_bet_history_by_user(users[0]["id"])
+
+
+def bet_history_deep_page(session, users, games):
+    cursor = encode_cursor(NOW - timedelta(days=200), uuid4())
+    BetRepository(session).find_bet_history_page(
+        users[0]["id"], before=decode_cursor(cursor), status=BetStatus.WON
+    )
+
+
+def games_by_status(session, users, games):
+    GameRepository(session).find_by_status(GameStatus.UPCOMING)
+
+
+def games_with_pending_bets(session, users, games):
+    GameRepository(session).find_games_with_pending_bets(GameStatus.COMPLETED)
+
+
+CASES = [
+    (pending_bets_by_game, ["ix_bets_game_id_pending"]),
+    (pending_bets_by_games, ["ix_bets_game_id_pending"]),
+    (pending_bets_by_user, ["ix_bets_user_id_pending"]),
+    (bet_history_by_user, ["ix_bets_user_id_created_at_id"]),
+    (bet_history_deep_page, ["ix_bets_user_id_created_at_id"]),
+    (games_by_status, ["ix_games_status_commence_time"]),
+    (
+        games_with_pending_bets,
+        ["ix_games_status_commence_time", "ix_bets_game_id_pending"],
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "call, expected_indexes", CASES, ids=[call.__name__ for call, _ in CASES]
+)
+def test_repository_method_uses_index(dataset, call, expected_indexes):
+    engine, Session, users, games = dataset
+
+    plans = query_plans(engine, Session, lambda session: call(session, users, games))
+
+    for index in expected_indexes:
+        assert any(index in plan for plan in plans), plans
+    full_scans = [plan for plan in plans if plan.startswith("SCAN")]
+    assert not full_scans, plans
+    assert not any("TEMP B-TREE" in plan for plan in plans), plans
@@ -0,0 +1,180 @@
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm.session import Session
+
+from betting.events import TEAM_STATS_CHANGED, subscribe, unsubscribe
+from betting.models import Base, Game, GameStatus, TeamStats
+from betting.repositories.team_stats_repository import TEAM_STATS_COLUMNS
+from betting.services import TeamStatsService
+
+START = datetime(2025, 11, 1, 0, 30, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def db_session():
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine)
+    session = Session()
+    yield session
+    session.close()
+
+
+def add_game(
+    session: Session,
+    day: int,
+    home_score: int,
+    away_score: int,
+    home_team: str = "Lakers",
+    away_team: str = "Warriors",
+    home_spread: str | None = "-5.0",
+    total_points: str | None = "215.0",
+) -> Game:
+    game = Game(
+        external_id=f"game-{home_team}-{away_team}-{day}",
+        home_team=home_team,
+        away_team=away_team,
+        commence_time=START + timedelta(days=day),
+        status=GameStatus.COMPLETED,
+        home_score=home_score,
+        away_score=away_score,
+        home_spread=Decimal(home_spread) if home_spread else None,
+        away_spread=-Decimal(home_spread) if home_spread else None,
+        total_points=Decimal(total_points) if total_points else None,
+    )
+    session.add(game)
+    session.commit()
+    return game
+
+
+def stats_rows(session: Session) -> dict:
+    rows = session.execute(select(*TEAM_STATS_COLUMNS)).all()
+    return {(row.team_name, row.season): row._asdict() for row in rows}
+
+
+def test_full_refresh_records_each_side(db_session):
+    # Lakers -5 win by 10 under 215; Warriors -3 at home win by 2 over 215
+    add_game(db_session, 0, 110, 100)
+    add_game(db_session, 1, 120, 118, "Warriors", "Lakers", home_spread="-3.0")
+
+    result = TeamStatsService(db_session).refresh()
+
+    assert result == {"mode": "full", "games": 2, "teams": 2}
+    lakers = db_session.get(TeamStats, ("Lakers", "2025-26"))
+    assert (lakers.wins, lakers.losses) == (1, 1)
+    assert (lakers.home_wins, lakers.away_losses) == (1, 1)
+    assert (lakers.ats_wins, lakers.ats_losses) == (2, 0)
+    assert (lakers.ats_wins_as_favorite, lakers.ats_wins_as_underdog) == (1, 1)
+    assert (lakers.ats_wins_home, lakers.ats_wins_away) == (1, 1)
+    assert (lakers.overs, lakers.unders) == (1, 1)
+    assert (lakers.recent_su, lakers.recent_ats, lakers.recent_ou) == ("WL", "WW", "UO")
+    assert lakers.current_streak == -1
+
+    warriors = db_session.get(TeamStats, ("Warriors", "2025-26"))
+    assert (warriors.wins, warriors.losses) == (1, 1)
+    assert (warriors.ats_wins, warriors.ats_losses) == (0, 2)
+    assert (warriors.ats_losses_as_favorite, warriors.ats_losses_as_underdog) == (1, 1)
+    assert warriors.current_streak == 1
+    assert warriors.last_game_at == START + timedelta(days=1)
+
+
+def test_pushes_and_missing_lines(db_session):
+    # Lakers -5 win by exactly 5 on a total of 215; then a game with no lines
+    add_game(db_session, 0, 110, 105)
+    add_game(db_session, 1, 100, 90, home_spread=None, total_points=None)
+
+    TeamStatsService(db_session).refresh()
+
+    lakers = db_session.get(TeamStats, ("Lakers", "2025-26"))
+    assert (lakers.wins, lakers.ats_pushes, lakers.ou_pushes) == (2, 1, 1)
+    assert (lakers.ats_wins, lakers.ats_losses) == (0, 0)
+    assert (lakers.recent_su, lakers.recent_ats, lakers.recent_ou) == ("WW", "P", "P")
+
+
+def test_last_ten_keeps_the_most_recent_games(db_session):
+    # Two losses, then ten wins covering and going over
+    add_game(db_session, 0, 90, 100)
+    add_game(db_session, 1, 90, 100)
+    for day in range(2, 12):
+        add_game(db_session, day, 130, 100)
+
+    TeamStatsService(db_session).refresh()
+
+    lakers = db_session.get(TeamStats, ("Lakers", "2025-26"))
+    assert (lakers.wins, lakers.losses) == (10, 2)
+    assert lakers.recent_su == "W" * 10
+    assert (lakers.last10_wins, lakers.last10_losses) == (10, 0)
+    assert (lakers.last10_ats_wins, lakers.last10_overs) == (10, 10)
+    assert lakers.current_streak == 10
+
+
+def test_seasons_are_kept_apart(db_session):
+    add_game(db_session, 0, 110, 100)
+    add_game(db_session, 365, 110, 100)
+
+    TeamStatsService(db_session).refresh()
+
+    assert set(stats_rows(db_session)) == {
+        ("Lakers", "2025-26"),
+        ("Warriors", "2025-26"),
+        ("Lakers", "2026-27"),
+        ("Warriors", "2026-27"),
+    }
+
+
+def test_incremental_refresh_matches_full(db_session):
+    add_game(db_session, 0, 110, 100)
+    add_game(db_session, 1, 120, 118, "Warriors", "Lakers", home_spread="-3.0")
+    service = TeamStatsService(db_session)
+    service.refresh()
+
+    add_game(db_session, 2, 95, 104)
+    add_game(db_session, 2, 101, 99, "Celtics", "Knicks")
+    result = service.refresh()
+
+    assert result == {"mode": "incremental", "games": 2, "teams": 4}
+    incremental = stats_rows(db_session)
+    service.refresh(full=True)
+    assert stats_rows(db_session) == incremental
+
+
+def test_incremental_refresh_with_no_new_games(db_session):
+    add_game(db_session, 0, 110, 100)
+    service = TeamStatsService(db_session)
+    service.refresh()
+
+    assert service.refresh() == {"mode": "incremental", "games": 0, "teams": 0}
+
+
+def test_game_completed_out_of_order_forces_full_refresh(db_session):
+    add_game(db_session, 0, 110, 100)
+    add_game(db_session, 2, 110, 100)
+    service = TeamStatsService(db_session)
+    service.refresh()
+
+    # Commenced before the last game counted, scored after the refresh
+    add_game(db_session, 1, 90, 100)
+    result = service.refresh()
+
+    assert result["mode"] == "full"
+    lakers = db_session.get(TeamStats, ("Lakers", "2025-26"))
+    assert (lakers.wins, lakers.losses, lakers.recent_su) == (2, 1, "WLW")
+
+
+def test_refresh_publishes_change(db_session):
+    add_game(db_session, 0, 110, 100)
+    received = []
+
+    def handler(session):
+        received.append(session)
+
+    subscribe(TEAM_STATS_CHANGED, handler)
+    try:
+        TeamStatsService(db_session).refresh()
+    finally:
+        unsubscribe(TEAM_STATS_CHANGED, handler)
+
+    assert received == [db_session]
@@ -133,3 +133,48 @@ def test_parse_timestamp():
     assert result["commence_time"].hour == 19
     assert result["commence_time"].minute == 30
     assert result["commence_time"].tzinfo is None
+
+
+def test_parse_snapshots_one_per_bookmaker():
+    game_data = {
+        "id": "test123",
+        "home_team": "Lakers",
+        "away_team": "Warriors",
+        "commence_time": "2024-01-15T19:30:00Z",
+        "bookmakers": [
+            {
+                "key": "betmgm",
+                "markets": [
+                    {
+                        "key": "h2h",
+                        "outcomes": [
+                            {"name": "Lakers", "price": -110},
+                            {"name": "Warriors", "price": 120},
+                        ],
+                    }
+                ],
+            },
+            {
+                "key": "fanduel",
+                "markets": [
+                    {
+                        "key": "totals",
+                        "outcomes": [
+                            {"name": "Over", "price": -105, "point": 221.5},
+                            {"name": "Under", "price": -115, "point": 221.5},
+                        ],
+                    }
+                ],
+            },
+        ],
+    }
+
+    snapshots = OddsParser.parse_snapshots(game_data)
+
+    assert [s["bookmaker"] for s in snapshots] == ["betmgm", "fanduel"]
+    assert snapshots[0]["home_moneyline"] == Decimal("-110")
+    assert snapshots[0]["total_points"] is None
+    assert snapshots[1]["home_moneyline"] is None
+    assert snapshots[1]["total_points"] == Decimal("221.5")
+    assert snapshots[1]["under_odds"] == Decimal("-115")
+    assert "home_score" not in snapshots[0]